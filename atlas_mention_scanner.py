@@ -1,24 +1,41 @@
 #!/usr/bin/env python3
 """
-Atlas Mention Scanner - Periodic @Atlas mention detection.
-Designed to run every 15 minutes via scheduler or continuous loop.
+Atlas Mention Scanner - @Atlas mention detection.
+
+Polling scans are incremental: each page keeps a last_edited_time and
+last-seen-comment cursor, so only pages edited since the last scan have
+their comments re-read (concurrently, under the shared Notion rate limit).
+Webhook mode receives Notion comment events and handles a mention within
+seconds instead of waiting for the next poll.
 
 Usage:
     python atlas_mention_scanner.py           # Single scan
     python atlas_mention_scanner.py --loop    # Continuous (every 15 min)
     python atlas_mention_scanner.py --daemon  # Background daemon mode
+    python atlas_mention_scanner.py --webhook [--port 8787]   # Event receiver
+    python atlas_mention_scanner.py --send-test-event PAGE_ID [--url URL]
 """
+import hashlib
+import hmac
 import json
 import os
+import queue
+import sqlite3
 import sys
+import threading
 import time
-from datetime import datetime, timedelta
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional, Tuple
 
-import requests
 from dotenv import load_dotenv
 
+from notion_pipeline.transport import NotionTransport, get_transport
+
 load_dotenv()
 
 # Configuration
@@ -26,63 +43,167 @@ NOTION_KEY = os.environ.get('NOTION_API_KEY')
 WORK_QUEUE_ID = os.environ.get('NOTION_ATLAS_WORK_QUEUE_ID', '9c8f104b347f4dfc829f7609c8f17f0d')
 INBOX_DB_ID = os.environ.get('NOTION_ATLAS_INBOX_ID', 'c298b60934d248beb2c50942436b8bfe')
 
-HEADERS = {
-    'Authorization': f'Bearer {NOTION_KEY}',
-    'Content-Type': 'application/json',
-    'Notion-Version': '2022-06-28'
-}
-
-# State file to track processed mentions
-STATE_FILE = Path(__file__).parent / '.atlas_scanner_state.json'
-SCAN_INTERVAL = 15 * 60  # 15 minutes in seconds
-
-
-def load_state() -> Dict:
-    """Load scanner state from file."""
-    if STATE_FILE.exists():
-        try:
-            with open(STATE_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
-    return {
-        'last_scan': None,
-        'processed_comments': [],  # List of comment IDs already handled
-        'processed_pages': {}      # page_id -> last_edited_time we saw
-    }
+# Webhook receiver: Notion signs events with the subscription's verification token
+WEBHOOK_PORT = int(os.environ.get('ATLAS_WEBHOOK_PORT', '8787'))
+WEBHOOK_SECRET = os.environ.get('NOTION_WEBHOOK_SECRET', '')
 
 
-def save_state(state: Dict):
-    """Save scanner state to file."""
-    with open(STATE_FILE, 'w') as f:
-        json.dump(state, f, indent=2, default=str)
+def notion() -> NotionTransport:
+    """Shared pooled, rate-limited Notion transport."""
+    return get_transport(NOTION_KEY)
 
 
-def search_recent_pages(hours_back: int = 1, limit: int = 20) -> List[Dict]:
-    """Search for recently modified pages."""
+# Scanner state: per-page cursors + processed comments (SQLite, indexed)
+STATE_DB = Path(__file__).parent / '.atlas_scanner_state.db'
+LEGACY_STATE_FILE = Path(__file__).parent / '.atlas_scanner_state.json'
+SCAN_INTERVAL = 15 * 60  # 15 minutes in seconds
+SCAN_WORKERS = 4         # Concurrent comment fetches (transport enforces the rate limit)
+MAX_SEARCH_RESULTS = 500  # Safety cap on pages examined per scan
+# Notion rounds last_edited_time to the minute; re-check a little overlap
+SEARCH_OVERLAP = timedelta(minutes=2)
+
+
+class ScannerState:
+    """Per-page comment cursors and processed comment IDs.
+
+    Replaces the old JSON state, whose processed-comments list was
+    truncated to 500 entries; every handled comment is kept here.
+    """
+
+    def __init__(self, path: Path = STATE_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS pages (
+                page_id TEXT PRIMARY KEY,
+                last_edited TEXT,
+                last_comment TEXT
+            );
+            CREATE TABLE IF NOT EXISTS comments (
+                comment_id TEXT PRIMARY KEY,
+                page_id TEXT,
+                created_time TEXT
+            );
+            CREATE INDEX IF NOT EXISTS comments_page ON comments (page_id);
+        """)
+        self._migrate_json()
+
+    def _migrate_json(self):
+        """One-time import of the old .atlas_scanner_state.json."""
+        if not LEGACY_STATE_FILE.exists() or self.get_meta('migrated_from'):
+            return
+        try:
+            legacy = json.loads(LEGACY_STATE_FILE.read_text())
+        except (OSError, ValueError):
+            legacy = {}
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO comments (comment_id) VALUES (?)",
+                [(cid,) for cid in legacy.get('processed_comments', [])])
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('migrated_from', ?)",
+                               (str(LEGACY_STATE_FILE),))
+            if legacy.get('last_scan'):
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_scan', ?)",
+                                   (legacy['last_scan'],))
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    def page_cursor(self, page_id: str) -> Dict[str, Optional[str]]:
+        """Last seen last_edited_time and newest comment time for a page."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_edited, last_comment FROM pages WHERE page_id = ?",
+                (page_id,)).fetchone()
+        return {'last_edited': row[0], 'last_comment': row[1]} if row else \
+            {'last_edited': None, 'last_comment': None}
+
+    def set_page_cursor(self, page_id: str, last_edited: Optional[str],
+                        last_comment: Optional[str]):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?)",
+                               (page_id, last_edited, last_comment))
+
+    def is_processed(self, comment_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM comments WHERE comment_id = ?",
+                                      (comment_id,)).fetchone() is not None
+
+    def mark_processed(self, comment_id: str, page_id: str, created_time: str):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO comments VALUES (?, ?, ?)",
+                               (comment_id, page_id, created_time))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def search_recent_pages(since: Optional[str] = None, hours_back: int = 1,
+                        limit: int = MAX_SEARCH_RESULTS) -> Tuple[List[Dict], bool]:
+    """Pages edited since `since` (default: the last `hours_back` hours), newest first.
+
+    Returns:
+        (pages, complete) - complete is False if a search request failed or
+        the `limit` cap cut the results short
+    """
     url = 'https://api.notion.com/v1/search'
+    if not since:
+        since = (datetime.now(timezone.utc) - timedelta(hours=hours_back)).isoformat()
+    cutoff = datetime.fromisoformat(since.replace('Z', '+00:00'))
 
-    # Get pages modified recently
     payload = {
         "filter": {"property": "object", "value": "page"},
         "sort": {"direction": "descending", "timestamp": "last_edited_time"},
-        "page_size": limit
+        "page_size": 100
     }
 
-    response = requests.post(url, headers=HEADERS, json=payload)
-    if response.status_code == 200:
-        return response.json().get('results', [])
-    print(f"  Search error: {response.status_code}")
-    return []
-
-
-def get_page_comments(page_id: str) -> List[Dict]:
-    """Get comments for a page."""
-    url = f'https://api.notion.com/v1/comments?block_id={page_id}'
-    response = requests.get(url, headers=HEADERS)
-    if response.status_code == 200:
-        return response.json().get('results', [])
-    return []
+    pages = []
+    while True:
+        response = notion().post(url, json=payload)
+        if response.status_code != 200:
+            print(f"  Search error: {response.status_code}")
+            return pages, False
+        data = response.json()
+        for page in data.get('results', []):
+            edited = datetime.fromisoformat(page['last_edited_time'].replace('Z', '+00:00'))
+            if edited < cutoff:
+                return pages, True  # Sorted newest first, so the rest are older
+            if len(pages) == limit:
+                print(f"  Search capped at {limit} pages")
+                return pages, False
+            pages.append(page)
+        if not data.get('has_more'):
+            return pages, True
+        payload['start_cursor'] = data['next_cursor']
+
+
+def get_page_comments(page_id: str) -> Tuple[List[Dict], bool]:
+    """Get all comments for a page, following pagination.
+
+    Returns the comments and whether every page of them was read.
+    """
+    url = 'https://api.notion.com/v1/comments'
+    params = {'block_id': page_id, 'page_size': 100}
+    comments = []
+    while True:
+        response = notion().get(url, params=params)
+        if response.status_code != 200:
+            print(f"  Comment listing failed ({response.status_code}) for {page_id}")
+            return comments, False
+        data = response.json()
+        comments.extend(data.get('results', []))
+        if not data.get('has_more'):
+            return comments, True
+        params['start_cursor'] = data['next_cursor']
 
 
 def extract_comment_text(comment: Dict) -> str:
@@ -123,96 +244,128 @@ def post_to_work_queue(title: str, mention_type: str, source_url: str, notes: st
         }
     }
 
-    response = requests.post(url, headers=HEADERS, json=payload)
+    response = notion().post(url, json=payload)
     return response.status_code in [200, 201]
 
 
-def scan_for_mentions(state: Dict) -> List[Dict]:
-    """Scan for new @atlas mentions."""
-    new_mentions = []
-    processed_comments = set(state.get('processed_comments', []))
+def scan_page(state: ScannerState, page: Dict) -> List[Dict]:
+    """Find new @atlas mentions in one page's comments and advance its cursor.
+
+    If the comment listing is incomplete, the comments that were read are
+    still handled but the cursor stays put, so the next scan re-reads the page.
+    """
+    page_id = page['id']
+    page_title = get_page_title(page)
+    page_url = f"https://www.notion.so/{page_id.replace('-', '')}"
+    cursor = state.page_cursor(page_id)
+
+    mentions = []
+    newest = cursor['last_comment']
+    comments, complete = get_page_comments(page_id)
+    for comment in comments:
+        created = comment.get('created_time') or ''
+        # Older than the cursor, or already handled at the same timestamp
+        if cursor['last_comment'] and created < cursor['last_comment']:
+            continue
+        comment_id = comment.get('id')
+        if state.is_processed(comment_id):
+            continue
+
+        comment_text = extract_comment_text(comment)
+        if has_atlas_mention(comment_text):
+            mentions.append({
+                'comment_id': comment_id,
+                'page_id': page_id,
+                'page_title': page_title,
+                'page_url': page_url,
+                'comment_text': comment_text,
+                'created_time': created
+            })
+        state.mark_processed(comment_id, page_id, created)
+        newest = max(newest or '', created)
+
+    if complete:
+        state.set_page_cursor(page_id, page.get('last_edited_time'), newest)
+    return mentions
 
-    # Get recent pages
-    pages = search_recent_pages(hours_back=1)
-    print(f"  Checking {len(pages)} recent pages...")
 
-    for i, page in enumerate(pages):
-        page_id = page['id']
-        page_title = get_page_title(page)
-        page_url = f"https://www.notion.so/{page_id.replace('-', '')}"
+def scan_pages(state: ScannerState, pages: Iterable[Dict]) -> List[Dict]:
+    """Scan pages concurrently; mentions come back in page order."""
+    pages = list(pages)
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        results = pool.map(lambda page: scan_page(state, page), pages)
+        return [mention for page_mentions in results for mention in page_mentions]
 
-        # Check comments on this page
-        comments = get_page_comments(page_id)
 
-        for comment in comments:
-            comment_id = comment.get('id')
+def scan_for_mentions(state: ScannerState) -> List[Dict]:
+    """Scan pages edited since the last scan for new @atlas mentions.
 
-            # Skip if already processed
-            if comment_id in processed_comments:
-                continue
+    search_since only advances when the search covered the whole window;
+    otherwise the next scan searches from the same point (pages scanned
+    this time are skipped by their cursors).
+    """
+    started = datetime.now(timezone.utc)
+    since = state.get_meta('search_since')
 
-            comment_text = extract_comment_text(comment)
+    # Only pages whose last_edited_time moved past their cursor
+    found, complete = search_recent_pages(since=since, hours_back=1)
+    pages = [page for page in found
+             if page.get('last_edited_time') != state.page_cursor(page['id'])['last_edited']]
+    print(f"  Checking {len(pages)} pages edited since last scan...")
 
-            if has_atlas_mention(comment_text):
-                new_mentions.append({
-                    'comment_id': comment_id,
-                    'page_id': page_id,
-                    'page_title': page_title,
-                    'page_url': page_url,
-                    'comment_text': comment_text,
-                    'created_time': comment.get('created_time')
-                })
+    new_mentions = scan_pages(state, pages)
+
+    if complete:
+        state.set_meta('search_since', (started - SEARCH_OVERLAP).isoformat())
+    elif not since:
+        # Keep the window this scan searched, not a later default
+        state.set_meta('search_since', (started - timedelta(hours=1)).isoformat())
+    state.set_meta('last_scan', datetime.now().isoformat())
+    return new_mentions
 
-                # Mark as processed
-                processed_comments.add(comment_id)
 
-        time.sleep(0.1)  # Rate limiting
+def handle_mentions(mentions: List[Dict]):
+    """Report mentions and post each one to the Work Queue."""
+    if not mentions:
+        print("No new mentions found.")
+        return
 
-    # Update state
-    state['processed_comments'] = list(processed_comments)[-500:]  # Keep last 500
-    state['last_scan'] = datetime.now().isoformat()
+    print(f"\n** Found {len(mentions)} new mention(s)! **\n")
 
-    return new_mentions
+    for m in mentions:
+        print(f"  Page: {m['page_title'][:50]}")
+        print(f"  Comment: {m['comment_text'][:80]}...")
+        print(f"  URL: {m['page_url']}")
+        print()
 
+        # Post to Work Queue
+        success = post_to_work_queue(
+            title=f"@Atlas Mention: {m['page_title'][:60]}",
+            mention_type="Other",
+            source_url=m['page_url'],
+            notes=f"Comment: {m['comment_text']}"
+        )
 
-def run_scan():
+        if success:
+            print(f"  -> Posted to Work Queue")
+        else:
+            print(f"  -> Failed to post to Work Queue")
+
+
+def run_scan(state: Optional[ScannerState] = None):
     """Run a single scan."""
     print(f"\n{'='*60}")
     print(f"ATLAS MENTION SCANNER - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print('='*60)
 
-    state = load_state()
-    last_scan = state.get('last_scan', 'never')
+    state = state or ScannerState()
+    last_scan = state.get_meta('last_scan') or 'never'
     print(f"Last scan: {last_scan}")
 
     print("\nScanning for @Atlas mentions...")
     mentions = scan_for_mentions(state)
+    handle_mentions(mentions)
 
-    if mentions:
-        print(f"\n** Found {len(mentions)} new mention(s)! **\n")
-
-        for m in mentions:
-            print(f"  Page: {m['page_title'][:50]}")
-            print(f"  Comment: {m['comment_text'][:80]}...")
-            print(f"  URL: {m['page_url']}")
-            print()
-
-            # Post to Work Queue
-            success = post_to_work_queue(
-                title=f"@Atlas Mention: {m['page_title'][:60]}",
-                mention_type="Other",
-                source_url=m['page_url'],
-                notes=f"Comment: {m['comment_text']}"
-            )
-
-            if success:
-                print(f"  -> Posted to Work Queue")
-            else:
-                print(f"  -> Failed to post to Work Queue")
-    else:
-        print("No new mentions found.")
-
-    save_state(state)
     print(f"\nScan complete. State saved.")
 
     return mentions
@@ -224,9 +377,10 @@ def run_loop():
     print(f"Scanning every {SCAN_INTERVAL // 60} minutes")
     print("Press Ctrl+C to stop\n")
 
+    state = ScannerState()
     while True:
         try:
-            run_scan()
+            run_scan(state)
             print(f"\nNext scan in {SCAN_INTERVAL // 60} minutes...")
             time.sleep(SCAN_INTERVAL)
         except KeyboardInterrupt:
@@ -237,12 +391,166 @@ def run_loop():
             time.sleep(60)  # Wait a minute before retrying
 
 
+# --- Webhook receiver ---
+def sign_payload(body: bytes, secret: str) -> str:
+    """X-Notion-Signature value for a request body."""
+    return 'sha256=' + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+class WebhookReceiver:
+    """Local HTTP endpoint for Notion webhook events.
+
+    Comment events queue their page; one worker thread scans queued pages
+    (coalescing bursts on the same page) and posts mentions right away.
+    """
+
+    COMMENT_EVENTS = {'comment.created', 'comment.updated'}
+
+    def __init__(self, state: ScannerState, port: int = WEBHOOK_PORT,
+                 secret: str = WEBHOOK_SECRET, host: str = '127.0.0.1'):
+        self.state = state
+        self.secret = secret
+        self.pages: 'queue.Queue[str]' = queue.Queue()
+        self.processed = 0  # scan batches completed, for tests/monitoring
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._worker = threading.Thread(target=self._work, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/webhook"
+
+    def start(self) -> 'WebhookReceiver':
+        self._worker.start()
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def accept(self, body: bytes, signature: str) -> int:
+        """Validate and enqueue one delivery. Returns the HTTP status."""
+        if self.secret and not hmac.compare_digest(signature, sign_payload(body, self.secret)):
+            return 401
+        try:
+            event = json.loads(body or b'{}')
+        except ValueError:
+            return 400
+
+        if 'verification_token' in event:
+            # One-time subscription handshake: paste this token into Notion
+            print(f"  Webhook verification token: {event['verification_token']}")
+            return 200
+
+        if event.get('type') in self.COMMENT_EVENTS:
+            page_id = (event.get('data') or {}).get('page_id')
+            if page_id:
+                self.pages.put(page_id)
+        return 200
+
+    def _work(self):
+        while True:
+            page_ids = {self.pages.get()}
+            # Coalesce everything that arrived meanwhile
+            while True:
+                try:
+                    page_ids.add(self.pages.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                pages = []
+                for page_id in page_ids:
+                    response = notion().get(f'pages/{page_id}')
+                    if response.status_code == 200:
+                        pages.append(response.json())
+                handle_mentions(scan_pages(self.state, pages))
+            except Exception as e:
+                print(f"Error handling webhook event: {e}")
+            self.processed += 1
+
+    def _handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length)
+                status = receiver.accept(body, self.headers.get('X-Notion-Signature', ''))
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+        return Handler
+
+
+def run_webhook(port: int = WEBHOOK_PORT):
+    """Serve webhook events, after a catch-up scan for anything missed."""
+    state = ScannerState()
+    run_scan(state)
+
+    receiver = WebhookReceiver(state, port=port).start()
+    print(f"\nListening for Notion webhook events on {receiver.url}")
+    if not WEBHOOK_SECRET:
+        print("  WARN: NOTION_WEBHOOK_SECRET not set - signatures are not checked")
+    print("Press Ctrl+C to stop\n")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        receiver.stop()
+        print("\n\nReceiver stopped.")
+
+
+def send_test_event(page_id: str, url: Optional[str] = None,
+                    secret: str = WEBHOOK_SECRET) -> int:
+    """Stand-in for Notion: deliver a signed comment.created event."""
+    url = url or f"http://127.0.0.1:{WEBHOOK_PORT}/webhook"
+    body = json.dumps({
+        'id': f'test-{int(time.time())}',
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'type': 'comment.created',
+        'entity': {'id': 'test-comment', 'type': 'comment'},
+        'data': {'page_id': page_id, 'parent': {'id': page_id, 'type': 'page'}},
+    }).encode()
+    headers = {'Content-Type': 'application/json'}
+    if secret:
+        headers['X-Notion-Signature'] = sign_payload(body, secret)
+    request = urllib.request.Request(url, data=body, headers=headers, method='POST')
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code  # A rejected delivery (401/400) is still an answer
+
+
+def _arg_value(flag: str) -> Optional[str]:
+    if flag in sys.argv:
+        index = sys.argv.index(flag)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return None
+
+
 def main():
+    if '--send-test-event' in sys.argv:
+        page_id = _arg_value('--send-test-event')
+        if not page_id:
+            print("Usage: python atlas_mention_scanner.py --send-test-event PAGE_ID [--url URL]")
+            sys.exit(1)
+        print(f"Delivered: HTTP {send_test_event(page_id, _arg_value('--url'))}")
+        return
+
     if not NOTION_KEY:
         print("ERROR: NOTION_API_KEY not set in environment")
         sys.exit(1)
 
-    if '--loop' in sys.argv or '--daemon' in sys.argv:
+    if '--webhook' in sys.argv:
+        run_webhook(int(_arg_value('--port') or WEBHOOK_PORT))
+    elif '--loop' in sys.argv or '--daemon' in sys.argv:
         run_loop()
     else:
         run_scan()
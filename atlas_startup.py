@@ -6,6 +6,12 @@ Scans Notion for @Atlas mentions and creates tasks in the Atlas Tasks database.
 Usage:
     python atlas_startup.py [--api-key KEY] [--task-db DB_ID]
 
+Page text is cached in .atlas_startup_cache.db keyed by each page's
+last_edited_time, so a warm start only fetches the text of pages edited
+since the previous run. Comments are re-listed for every page on every run:
+adding a comment does not always move the page's last_edited_time. Delete
+the file to force a full rescan.
+
 Environment variables:
     NOTION_ATLAS_API_KEY      - Notion API key for Atlas integration
     NOTION_ATLAS_TASK_DATABASE_ID - Database ID for creating tasks
@@ -14,14 +20,18 @@ Environment variables:
 import json
 import os
 import re
+import sqlite3
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
 
-import requests
 from dotenv import load_dotenv
 
+from notion_pipeline.transport import NotionTransport, get_transport
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -31,11 +41,14 @@ TASK_DB_ID = os.environ.get('NOTION_ATLAS_TASK_DATABASE_ID', '')
 DB_IDS_ENV = os.environ.get('NOTION_ATLAS_DATABASES', '')
 INBOX_DB_ID = os.environ.get('NOTION_ATLAS_INBOX_ID', 'c298b60934d248beb2c50942436b8bfe')
 
-HEADERS = {
-    'Authorization': f'Bearer {NOTION_KEY}',
-    'Content-Type': 'application/json',
-    'Notion-Version': '2022-06-28'
-}
+CACHE_DB = Path(__file__).parent / '.atlas_startup_cache.db'
+FETCH_WORKERS = 4  # Concurrent page fetches (transport enforces the rate limit)
+
+
+def notion() -> NotionTransport:
+    """Shared pooled, rate-limited Notion transport."""
+    return get_transport(NOTION_KEY)
+
 
 # Priority keywords mapping
 PRIORITY_KEYWORDS = {
@@ -66,11 +79,83 @@ DISPOSITION_PATTERNS = {
     'canon': re.compile(r'@atlas\s+(?:canon|canonical|add to (?:the )?(?:technical )?canon)', re.IGNORECASE),
 }
 
+ATLAS_CONTEXT_PATTERN = re.compile(r'@Atlas[:\s]+(.+)', re.IGNORECASE)
+
+
+class MentionScanner:
+    """TASK_PATTERNS and DISPOSITION_PATTERNS compiled into one scanner.
+
+    A single trigger pass finds which of "@atlas", "atlas", "todo" and
+    "task" occur in the text; only the patterns that need one of those
+    words are run, so the bulk of page text (no triggers) costs one
+    regex search. Disposition actions are folded into one alternation
+    with a named group per action.
+    """
+
+    TRIGGERS = re.compile(r'@?atlas|todo|task', re.IGNORECASE)
+
+    # Trigger word each TASK_PATTERNS entry cannot match without
+    TASK_TRIGGERS = ['@atlas', '@atlas', '@atlas', 'todo', 'atlas', 'task']
+
+    def __init__(self):
+        assert len(self.TASK_TRIGGERS) == len(TASK_PATTERNS)
+        self._actions = list(DISPOSITION_PATTERNS)
+        self._dispositions = re.compile('|'.join(
+            f'(?P<{action}>{pattern.pattern})'
+            for action, pattern in DISPOSITION_PATTERNS.items()
+        ), re.IGNORECASE)
+
+    def triggers(self, text: str) -> set:
+        found = {m.group().lower() for m in self.TRIGGERS.finditer(text)}
+        if '@atlas' in found:
+            found.add('atlas')
+        return found
+
+    def mentions(self, text: str, found: Optional[set] = None) -> List[str]:
+        """Same output, in the same order, as running TASK_PATTERNS one by one."""
+        found = self.triggers(text) if found is None else found
+        if not found:
+            return []
+
+        mentions = []
+        for pattern, trigger in zip(TASK_PATTERNS, self.TASK_TRIGGERS):
+            if trigger in found:
+                mentions.extend(m.strip() for m in pattern.findall(text) if m.strip())
+
+        if '@atlas' in found:
+            context_match = ATLAS_CONTEXT_PATTERN.search(text)
+            if context_match:
+                mentions.append(context_match.group(1).strip())
+        return mentions
+
+    def disposition(self, text: str, found: Optional[set] = None) -> Optional[str]:
+        """First action, in DISPOSITION_PATTERNS order, that the text matches."""
+        found = self.triggers(text) if found is None else found
+        if '@atlas' not in found:
+            return None
+        matched = {m.lastgroup for m in self._dispositions.finditer(text)}
+        return next((action for action in self._actions if action in matched), None)
+
+    def scan(self, text: str) -> Tuple[List[str], Optional[str]]:
+        """Task mentions and disposition action from one trigger pass."""
+        found = self.triggers(text)
+        return self.mentions(text, found), self.disposition(text, found)
+
+
+_scanner: Optional[MentionScanner] = None
+
+
+def get_scanner() -> MentionScanner:
+    global _scanner
+    if _scanner is None:
+        _scanner = MentionScanner()
+    return _scanner
+
 
 def get_atlas_user_id() -> Optional[str]:
     """Get Atlas bot's user ID by fetching self info."""
     url = 'https://api.notion.com/v1/users/me'
-    response = requests.get(url, headers=HEADERS)
+    response = notion().get(url)
     if response.status_code == 200:
         return response.json().get('id')
     return None
@@ -86,15 +171,36 @@ def get_shared_databases() -> List[str]:
         "filter": {"property": "object", "value": "database"},
         "page_size": 100
     }
-    response = requests.post(url, headers=HEADERS, json=payload)
+    response = notion().post(url, json=payload)
     if response.status_code == 200:
         results = response.json().get('results', [])
         return [r['id'] for r in results]
     return []
 
 
-def get_all_pages() -> List[Dict]:
-    """Get all pages accessible to Atlas (search)."""
+def _get_all(url: str, params: Optional[Dict] = None) -> Tuple[List[Dict], bool]:
+    """Follow start_cursor pagination on a GET list endpoint.
+
+    Returns the results and whether every page was read.
+    """
+    params = dict(params or {}, page_size=100)
+    results = []
+    while True:
+        response = notion().get(url, params=params)
+        if response.status_code != 200:
+            return results, False
+        data = response.json()
+        results.extend(data.get('results', []))
+        if not data.get('has_more'):
+            return results, True
+        params['start_cursor'] = data['next_cursor']
+
+
+def get_all_pages() -> Tuple[List[Dict], bool]:
+    """Get all pages accessible to Atlas (search).
+
+    Returns the pages and whether the search read every result page.
+    """
     url = 'https://api.notion.com/v1/search'
     payload = {
         "filter": {"property": "object", "value": "page"},
@@ -102,37 +208,27 @@ def get_all_pages() -> List[Dict]:
     }
     all_pages = []
 
-    while url:
-        response = requests.post(url, headers=HEADERS, json=payload)
+    while True:
+        response = notion().post(url, json=payload)
         if response.status_code != 200:
-            break
+            print(f"  WARN: Page search failed ({response.status_code}), list is incomplete")
+            return all_pages, False
 
         data = response.json()
         all_pages.extend(data.get('results', []))
-        url = data.get('next_url', None)
-        time.sleep(0.25)  # Rate limit
+        if not data.get('has_more'):
+            return all_pages, True
+        payload['start_cursor'] = data['next_cursor']
+
 
-    return all_pages
+def _fetch_page_content(page_id: str) -> Tuple[str, bool]:
+    blocks, complete = _get_all(f'https://api.notion.com/v1/blocks/{page_id}/children')
+    return '\n'.join(block_to_text(block) for block in blocks), complete
 
 
 def get_page_content(page_id: str) -> str:
     """Get the content of a page as text."""
-    url = f'https://api.notion.com/v1/blocks/{page_id}/children'
-    content_parts = []
-
-    while url:
-        response = requests.get(url, headers=HEADERS)
-        if response.status_code != 200:
-            break
-
-        data = response.json()
-        for block in data.get('results', []):
-            content_parts.append(block_to_text(block))
-
-        url = data.get('next_url', None)
-        time.sleep(0.25)
-
-    return '\n'.join(content_parts)
+    return _fetch_page_content(page_id)[0]
 
 
 def block_to_text(block: Dict) -> str:
@@ -175,38 +271,12 @@ def rich_text_to_text(rich_text: List[Dict]) -> str:
 
 def get_page_comments(page_id: str) -> List[Dict]:
     """Get all comments on a page."""
-    url = f'https://api.notion.com/v1/comments?block_id={page_id}'
-    all_comments = []
-
-    while url:
-        response = requests.get(url, headers=HEADERS)
-        if response.status_code != 200:
-            break
-
-        data = response.json()
-        all_comments.extend(data.get('results', []))
-        url = data.get('next_url', None)
-
-    return all_comments
+    return _get_all('https://api.notion.com/v1/comments', {'block_id': page_id})[0]
 
 
 def extract_atlas_mentions(text: str) -> List[str]:
     """Extract @Atlas mention patterns from text."""
-    mentions = []
-
-    for pattern in TASK_PATTERNS:
-        matches = pattern.findall(text)
-        mentions.extend([m.strip() for m in matches if m.strip()])
-
-    # Also look for @Atlas specifically
-    atlas_pattern = re.compile(r'@Atlas', re.IGNORECASE)
-    if atlas_pattern.search(text):
-        # Try to get context after @Atlas
-        context_match = re.search(r'@Atlas[:\s]+(.+)', text, re.IGNORECASE)
-        if context_match:
-            mentions.append(context_match.group(1).strip())
-
-    return mentions
+    return get_scanner().mentions(text)
 
 
 def extract_disposition_command(text: str) -> Optional[Dict[str, str]]:
@@ -214,20 +284,125 @@ def extract_disposition_command(text: str) -> Optional[Dict[str, str]]:
 
     Returns dict with 'action' and 'full_text' if found, None otherwise.
     """
-    for action, pattern in DISPOSITION_PATTERNS.items():
-        if pattern.search(text):
-            return {
-                'action': action,
-                'full_text': text.strip()
-            }
+    action = get_scanner().disposition(text)
+    if action:
+        return {
+            'action': action,
+            'full_text': text.strip()
+        }
     return None
 
 
-def get_pending_dispositions() -> List[Dict]:
+class PageCache:
+    """Page text from the last startup, keyed by last_edited_time."""
+
+    def __init__(self, path: Path = CACHE_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                page_id TEXT PRIMARY KEY,
+                last_edited TEXT,
+                content TEXT
+            )
+        """)
+
+    def get(self, page_id: str, last_edited: Optional[str]) -> Optional[str]:
+        """Cached page text, or None if the page was edited since it was stored."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_edited, content FROM pages WHERE page_id = ?",
+                (page_id,)).fetchone()
+        if not row or not last_edited or row[0] != last_edited:
+            return None
+        return row[1]
+
+    def put(self, page_id: str, last_edited: Optional[str], content: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (page_id, last_edited, content) VALUES (?, ?, ?)",
+                (page_id, last_edited, content))
+
+    def prune(self, keep_ids: set):
+        """Drop pages that are no longer visible to the integration."""
+        with self._lock, self._conn:
+            stale = [(pid,) for (pid,) in self._conn.execute("SELECT page_id FROM pages")
+                     if pid not in keep_ids]
+            self._conn.executemany("DELETE FROM pages WHERE page_id = ?", stale)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _fetch_comment_fields(page_id: str) -> List[Dict]:
+    """The comment fields startup uses, for every comment on a page."""
+    comments, _ = _get_all('https://api.notion.com/v1/comments', {'block_id': page_id})
+    return [{
+        'id': comment.get('id', ''),
+        'text': rich_text_to_text(comment.get('rich_text', [])),
+        'created_by': comment.get('created_by', {}),
+        'created_time': comment.get('created_time', ''),
+    } for comment in comments]
+
+
+def fetch_page_snapshot(page_id: str) -> Tuple[Dict, bool]:
+    """Page text plus the comment fields startup uses, and whether the text fetch completed."""
+    content, complete = _fetch_page_content(page_id)
+    return {'content': content, 'comments': _fetch_comment_fields(page_id)}, complete
+
+
+def load_page_snapshots(pages: List[Dict], cache: Optional[PageCache] = None,
+                        workers: int = FETCH_WORKERS, complete: bool = True) -> Dict[str, Dict]:
+    """Snapshots for every page, fetching text only for pages edited since it was cached.
+
+    Comments are listed for every page (one call each), since a new comment
+    need not change last_edited_time. Fetches run concurrently; incomplete
+    text is used for this run but not cached, so it is retried next time.
+    Pass complete=False when `pages` is a partial listing, so the cache is
+    not pruned of pages that simply went unlisted.
+    """
+    cached = {}
+    if cache:
+        for page in pages:
+            content = cache.get(page['id'], page.get('last_edited_time'))
+            if content is not None:
+                cached[page['id']] = content
+
+    print(f"  {len(cached)} pages cached, fetching {len(pages) - len(cached)} "
+          f"(comments for all {len(pages)})...")
+
+    def fetch(page):
+        page_id = page['id']
+        if page_id in cached:
+            return page_id, {'content': cached[page_id],
+                             'comments': _fetch_comment_fields(page_id)}
+        snapshot, text_complete = fetch_page_snapshot(page_id)
+        if cache and text_complete:
+            cache.put(page_id, page.get('last_edited_time'), snapshot['content'])
+        return page_id, snapshot
+
+    snapshots = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for i, (page_id, snapshot) in enumerate(pool.map(fetch, pages), 1):
+            snapshots[page_id] = snapshot
+            if i % 50 == 0:
+                print(f"  Fetched page {i}/{len(pages)}...")
+
+    if cache and complete:
+        cache.prune({page['id'] for page in pages})
+    return snapshots
+
+
+def get_pending_dispositions(pages: Optional[List[Dict]] = None,
+                             snapshots: Optional[Dict[str, Dict]] = None) -> List[Dict]:
     """Scan all pages for pending @atlas disposition commands in comments."""
     print("  Scanning for disposition comments...")
 
-    all_pages = get_all_pages()
+    all_pages = get_all_pages()[0] if pages is None else pages
+    if snapshots is None:
+        snapshots = load_page_snapshots(all_pages)
     dispositions = []
 
     for page in all_pages:
@@ -235,11 +410,8 @@ def get_pending_dispositions() -> List[Dict]:
         page_title = get_page_title(page)
         page_url = f"https://www.notion.so/{page_id.replace('-', '')}"
 
-        # Get comments on this page
-        comments = get_page_comments(page_id)
-
-        for comment in comments:
-            comment_text = rich_text_to_text(comment.get('rich_text', []))
+        for comment in snapshots[page_id]['comments']:
+            comment_text = comment['text']
             disposition = extract_disposition_command(comment_text)
 
             if disposition:
@@ -263,7 +435,6 @@ def get_pending_dispositions() -> List[Dict]:
                     'created_time': created_time
                 })
 
-        time.sleep(0.1)  # Rate limit
 
     return dispositions
 
@@ -364,7 +535,7 @@ def create_task_in_database(task: Dict, source_page_url: str = '') -> bool:
     if not source_page_url:
         del payload["properties"]["Source"]
 
-    response = requests.post(url, headers=HEADERS, json=payload)
+    response = notion().post(url, json=payload)
     if response.status_code in [200, 201]:
         return True
     else:
@@ -372,16 +543,17 @@ def create_task_in_database(task: Dict, source_page_url: str = '') -> bool:
         return False
 
 
-def scan_page_for_tasks(page: Dict) -> List[Dict]:
+def scan_page_for_tasks(page: Dict, snapshot: Optional[Dict] = None) -> List[Dict]:
     """Scan a page for @Atlas mentions and extract tasks."""
     tasks = []
     page_id = page['id']
     page_title = get_page_title(page)
     page_url = f"https://www.notion.so/{page_id.replace('-', '')}"
+    if snapshot is None:
+        snapshot = fetch_page_snapshot(page_id)[0]
 
     # Check page content
-    content = get_page_content(page_id)
-    mentions = extract_atlas_mentions(content)
+    mentions = extract_atlas_mentions(snapshot['content'])
 
     for mention in mentions:
         tasks.append({
@@ -393,10 +565,8 @@ def scan_page_for_tasks(page: Dict) -> List[Dict]:
         })
 
     # Check comments
-    comments = get_page_comments(page_id)
-    for comment in comments:
-        comment_text = rich_text_to_text(comment.get('rich_text', []))
-        mentions = extract_atlas_mentions(comment_text)
+    for comment in snapshot['comments']:
+        mentions = extract_atlas_mentions(comment['text'])
 
         for mention in mentions:
             tasks.append({
@@ -444,7 +614,7 @@ def get_pending_plans() -> List[Dict]:
         }
     }
 
-    response = requests.post(url, headers=HEADERS, json=payload)
+    response = notion().post(url, json=payload)
     if response.status_code == 200:
         results = response.json().get('results', [])
         plans = []
@@ -496,7 +666,14 @@ def main():
         print(f"  No pending plans. Clear to execute.")
 
     print(f"\n[3/7] Scanning for disposition comments (@atlas approved/published/etc)...")
-    pending_dispositions = get_pending_dispositions()
+    all_pages, listing_complete = get_all_pages()
+    print(f"  Found {len(all_pages)} accessible pages")
+    cache = PageCache()
+    try:
+        snapshots = load_page_snapshots(all_pages, cache, complete=listing_complete)
+    finally:
+        cache.close()
+    pending_dispositions = get_pending_dispositions(all_pages, snapshots)
     if pending_dispositions:
         print(f"  Found {len(pending_dispositions)} disposition command(s):")
         for disp in pending_dispositions:
@@ -514,16 +691,10 @@ def main():
         print("  Tasks will be counted but not created")
 
     print(f"\n[5/7] Scanning all pages for @Atlas task mentions...")
-    all_pages = get_all_pages()
-    print(f"  Found {len(all_pages)} accessible pages")
-
     all_tasks = []
-    for i, page in enumerate(all_pages, 1):
-        if i % 50 == 0:
-            print(f"  Scanning page {i}/{len(all_pages)}...")
-        tasks = scan_page_for_tasks(page)
+    for page in all_pages:
+        tasks = scan_page_for_tasks(page, snapshots[page['id']])
         all_tasks.extend(tasks)
-        time.sleep(0.25)  # Rate limit
 
     # Remove duplicates based on content + page_id
     seen = set()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Grove Docs Refinery - Local Message Batches Stand-in
+
+A minimal local implementation of the Message Batches endpoints, for
+exercising batch mode without spending API credits:
+
+    POST /v1/messages/batches
+    GET  /v1/messages/batches/{id}
+    GET  /v1/messages/batches/{id}/results
+
+Batches report "in_progress" for a configurable number of polls, then
+"ended". Each request's reply text comes from a responder function
+(default: a canned rewrite/review that the agents can parse).
+
+Usage:
+    python batch_stub_server.py --port 8765
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=stub \\
+        python refinery.py --batch-api
+"""
+
+import argparse
+import json
+import threading
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+
+def default_responder(params: Dict) -> str:
+    """Canned reply: a PASS review for reviewer prompts, else a rewrite."""
+    user_message = params["messages"][0]["content"]
+    if "## Writer's Rewritten Draft" in user_message:
+        return "### Assessment: PASS\n\nThe rewrite follows Grove standards."
+    return (
+        "### Diagnosis Summary\nStub rewrite.\n\n"
+        "### Key Changes Made\n- Stub change\n\n"
+        "### Flags for Review\n- None\n\n"
+        "===CONTENT START===\n"
+        + user_message +
+        "\n===REWRITE END==="
+    )
+
+
+class BatchStubServer:
+    """Threaded local Message Batches server."""
+
+    def __init__(
+        self,
+        port: int = 0,
+        responder: Callable[[Dict], str] = default_responder,
+        polls_until_done: int = 1,
+    ):
+        self.responder = responder
+        self.polls_until_done = polls_until_done
+        self.batches: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'BatchStubServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'BatchStubServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Batch state
+    # ------------------------------------------------------------------
+
+    def _create(self, requests: list) -> Dict:
+        batch_id = f"msgbatch_stub_{uuid.uuid4().hex[:16]}"
+        with self._lock:
+            self.batches[batch_id] = {
+                "requests": requests,
+                "polls": 0,
+                "created_at": _now(),
+                "results": None,
+            }
+        return self._describe(batch_id)
+
+    def _poll(self, batch_id: str) -> Dict:
+        with self._lock:
+            batch = self.batches[batch_id]
+            batch["polls"] += 1
+            if batch["results"] is None and batch["polls"] >= self.polls_until_done:
+                batch["results"] = [self._run_request(r) for r in batch["requests"]]
+        return self._describe(batch_id)
+
+    def _run_request(self, request: Dict) -> Dict:
+        params = request["params"]
+        try:
+            text = self.responder(params)
+        except Exception as e:
+            return {
+                "custom_id": request["custom_id"],
+                "result": {
+                    "type": "errored",
+                    "error": {"type": "error", "error": {
+                        "type": "invalid_request_error", "message": str(e),
+                    }},
+                },
+            }
+
+        prompt_chars = len(json.dumps(params.get("system", ""))) + len(json.dumps(params["messages"]))
+        return {
+            "custom_id": request["custom_id"],
+            "result": {
+                "type": "succeeded",
+                "message": {
+                    "id": f"msg_stub_{uuid.uuid4().hex[:16]}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": params.get("model", "stub"),
+                    "content": [{"type": "text", "text": text}],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {
+                        "input_tokens": prompt_chars // 4,
+                        "output_tokens": len(text) // 4,
+                        "cache_creation_input_tokens": 0,
+                        "cache_read_input_tokens": 0,
+                    },
+                },
+            },
+        }
+
+    def _describe(self, batch_id: str) -> Dict:
+        batch = self.batches[batch_id]
+        results = batch["results"]
+        ended = results is not None
+        counts = {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0}
+        if ended:
+            for entry in results:
+                counts[entry["result"]["type"]] += 1
+        else:
+            counts["processing"] = len(batch["requests"])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": counts,
+            "created_at": batch["created_at"],
+            "expires_at": batch["created_at"],
+            "ended_at": _now() if ended else None,
+            "cancel_initiated_at": None,
+            "archived_at": None,
+            "results_url": f"{self.base_url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass  # Keep test output quiet
+
+            def _send(self, status: int, body: str, content_type: str = "application/json"):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                path = self.path.split("?", 1)[0].rstrip("/")
+                if path != "/v1/messages/batches":
+                    return self._send(404, json.dumps({"error": "not found"}))
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                self._send(200, json.dumps(server._create(payload.get("requests", []))))
+
+            def do_GET(self):
+                parts = self.path.split("?", 1)[0].strip("/").split("/")
+                # v1 / messages / batches / {id} [/ results]
+                if parts[:3] != ["v1", "messages", "batches"] or len(parts) not in (4, 5):
+                    return self._send(404, json.dumps({"error": "not found"}))
+                batch_id = parts[3]
+                if batch_id not in server.batches:
+                    return self._send(404, json.dumps({"error": "unknown batch"}))
+
+                if len(parts) == 4:
+                    return self._send(200, json.dumps(server._poll(batch_id)))
+
+                results = server.batches[batch_id]["results"]
+                if results is None:
+                    return self._send(400, json.dumps({"error": "batch still processing"}))
+                body = "\n".join(json.dumps(entry) for entry in results) + "\n"
+                self._send(200, body, content_type="application/binary")
+
+        return Handler
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Message Batches stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--polls", type=int, default=1,
+                        help="Status polls before a batch reports ended")
+    args = parser.parse_args()
+
+    server = BatchStubServer(port=args.port, polls_until_done=args.polls)
+    print(f"Message Batches stand-in listening on {server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,194 @@
 Grove Docs Refinery - Checkpoint Manager
 
 Loads and manages the editorial checkpoint (dynamic state).
+
+The engine and checkpoint are read through a process-wide cache keyed on
+each file's mtime and size, so every agent in a run shares one copy of the
+text and one parse of the checkpoint. The parsed checkpoint is also
+persisted next to its source as `.<name>.parsed.json`, keyed on a hash of
+the markdown, so parallel workers and fresh CLI invocations skip the
+regex parse too.
 """
 
+import copy
+import hashlib
+import json
+import os
 import re
+import threading
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime
 
+from lint import LintEngine, group_hits, LEGACY_TERM
+
+# Prohibited language (from original content)
+PROHIBITED_TERMS = [
+    "revolutionary", "paradigm shift", "Web3", "democratize",
+    "might", "could potentially", "tokenomics", "network effects",
+    "moats", "the future of AI", "unprecedented capabilities",
+]
+
+# Bump when parse_checkpoint's output shape changes
+PARSED_VERSION = 1
+
+_cache_lock = threading.Lock()
+_text_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_parsed_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _file_key(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_context_file(path: Path) -> str:
+    """
+    Text of an engine or checkpoint file, cached until the file changes.
+
+    Raises FileNotFoundError if the file does not exist.
+    """
+    path = Path(path)
+    key = _file_key(path)
+    name = str(path.resolve())
+    with _cache_lock:
+        cached = _text_cache.get(name)
+        if cached and cached[0] == key:
+            return cached[1]
+    text = path.read_text(encoding="utf-8")
+    with _cache_lock:
+        _text_cache[name] = (key, text)
+    return text
+
+
+def parse_checkpoint(content: str) -> Dict[str, Any]:
+    """Parse checkpoint markdown into structured data."""
+    data: Dict[str, Any] = {
+        "strategic_positioning": "",
+        "terminology": {},
+        "claims": [],
+        "terminology_mapping": {},
+        "current_terms": [],
+        "legacy_terms": [],
+    }
+
+    # Extract strategic positioning (between ### The Core Frame and ### Key Strategic Claims)
+    core_frame_match = re.search(
+        r"### The Core Frame\s*\n\s*(.+?)(?=\n###|\Z)",
+        content,
+        re.DOTALL,
+    )
+    if core_frame_match:
+        data["strategic_positioning"] = core_frame_match.group(1).strip()
+
+    # Extract thesis
+    thesis_match = re.search(
+        r"### The Thesis \(One Paragraph\)\s*\n\s*(.+?)(?=\n###|\Z)",
+        content,
+        re.DOTALL,
+    )
+    if thesis_match:
+        data["thesis"] = thesis_match.group(1).strip()
+
+    # Parse terminology mapping table
+    mapping_section = re.search(
+        r"### Current Terms \(Use These\).*?\n\n(.*?)(?=\n###|\Z)",
+        content,
+        re.DOTALL,
+    )
+    if mapping_section:
+        table_content = mapping_section.group(1)
+        # Parse markdown table
+        rows = re.findall(r"\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|", table_content)
+        for row in rows:
+            term = row[0].strip()
+            definition = row[1].strip()
+            data["terminology"][term] = definition
+            data["current_terms"].append(term)
+
+    # Parse legacy terms
+    legacy_section = re.search(
+        r"### Legacy Terms \(Avoid\)\s*\n\n(.*?)(?=\n###|\Z)",
+        content,
+        re.DOTALL,
+    )
+    if legacy_section:
+        table_content = legacy_section.group(1)
+        rows = re.findall(r"\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|", table_content)
+        for row in rows:
+            legacy = row[0].strip()
+            current = row[1].strip()
+            data["terminology_mapping"][legacy] = current
+            data["legacy_terms"].append(legacy)
+
+    # Extract strategic claims
+    claims_section = re.search(
+        r"### Key Strategic Claims\s*\n\n(.*?)(?=\n###|\Z)",
+        content,
+        re.DOTALL,
+    )
+    if claims_section:
+        claims_content = claims_section.group(1)
+        data["claims"] = [
+            line.strip().lstrip("123. ")
+            for line in claims_content.split("\n")
+            if line.strip() and line[0].isdigit()
+        ]
+
+    return data
+
+
+def _parsed_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.parsed.json")
+
+
+def _load_parsed(path: Path, content: str) -> Dict[str, Any]:
+    """Parsed checkpoint data from the sidecar, or a fresh parse that refreshes it."""
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    sidecar = _parsed_path(path)
+    try:
+        stored = json.loads(sidecar.read_text(encoding="utf-8"))
+        if stored.get("version") == PARSED_VERSION and stored.get("sha256") == digest:
+            return stored["data"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    data = parse_checkpoint(content)
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps({"version": PARSED_VERSION, "sha256": digest, "data": data},
+                                  separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, sidecar)
+    except OSError:
+        tmp.unlink(missing_ok=True)  # Read-only checkout: the in-process cache still applies
+    return data
+
+
+def load_parsed_checkpoint(path: Path) -> Tuple[str, Dict[str, Any]]:
+    """
+    (markdown, parsed data) for a checkpoint file, cached until the file changes.
+
+    The data is a private copy; callers may modify it.
+    """
+    path = Path(path)
+    content = read_context_file(path)
+    key = _file_key(path)
+    name = str(path.resolve())
+    with _cache_lock:
+        cached = _parsed_cache.get(name)
+    if not cached or cached[0] != key:
+        cached = (key, _load_parsed(path, content))
+        with _cache_lock:
+            _parsed_cache[name] = cached
+    return content, copy.deepcopy(cached[1])
+
+
+def clear_cache():
+    """Forget cached engine/checkpoint text and parses (sidecar files are kept)."""
+    with _cache_lock:
+        _text_cache.clear()
+        _parsed_cache.clear()
+
 
 class EditorialCheckpoint:
     """Manages the Grove Editorial Checkpoint - dynamic state for current terminology/positioning."""
@@ -19,6 +200,7 @@ class EditorialCheckpoint:
         self._content: str = ""
         self._data: Dict[str, Any] = {}
         self._loaded: bool = False
+        self._lint_engine: Optional[LintEngine] = None
 
     def load(self, path: Optional[Path] = None) -> 'EditorialCheckpoint':
         """Load checkpoint from file."""
@@ -26,85 +208,16 @@ class EditorialCheckpoint:
             self.checkpoint_path = path
 
         if self.checkpoint_path and self.checkpoint_path.exists():
-            self._content = self.checkpoint_path.read_text()
-            self._parse()
+            self._content, self._data = load_parsed_checkpoint(self.checkpoint_path)
+            self._lint_engine = None
             self._loaded = True
 
         return self
 
     def _parse(self):
         """Parse checkpoint content into structured data."""
-        self._data = {
-            "strategic_positioning": "",
-            "terminology": {},
-            "claims": [],
-            "terminology_mapping": {},
-            "current_terms": [],
-            "legacy_terms": [],
-        }
-
-        # Extract strategic positioning (between ### The Core Frame and ### Key Strategic Claims)
-        core_frame_match = re.search(
-            r"### The Core Frame\s*\n\s*(.+?)(?=\n###|\Z)",
-            self._content,
-            re.DOTALL,
-        )
-        if core_frame_match:
-            self._data["strategic_positioning"] = core_frame_match.group(1).strip()
-
-        # Extract thesis
-        thesis_match = re.search(
-            r"### The Thesis \(One Paragraph\)\s*\n\s*(.+?)(?=\n###|\Z)",
-            self._content,
-            re.DOTALL,
-        )
-        if thesis_match:
-            self._data["thesis"] = thesis_match.group(1).strip()
-
-        # Parse terminology mapping table
-        mapping_section = re.search(
-            r"### Current Terms \(Use These\).*?\n\n(.*?)(?=\n###|\Z)",
-            self._content,
-            re.DOTALL,
-        )
-        if mapping_section:
-            table_content = mapping_section.group(1)
-            # Parse markdown table
-            rows = re.findall(r"\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|", table_content)
-            for row in rows:
-                term = row[0].strip()
-                definition = row[1].strip()
-                self._data["terminology"][term] = definition
-                self._data["current_terms"].append(term)
-
-        # Parse legacy terms
-        legacy_section = re.search(
-            r"### Legacy Terms \(Avoid\)\s*\n\n(.*?)(?=\n###|\Z)",
-            self._content,
-            re.DOTALL,
-        )
-        if legacy_section:
-            table_content = legacy_section.group(1)
-            rows = re.findall(r"\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|", table_content)
-            for row in rows:
-                legacy = row[0].strip()
-                current = row[1].strip()
-                self._data["terminology_mapping"][legacy] = current
-                self._data["legacy_terms"].append(legacy)
-
-        # Extract strategic claims
-        claims_section = re.search(
-            r"### Key Strategic Claims\s*\n\n(.*?)(?=\n###|\Z)",
-            self._content,
-            re.DOTALL,
-        )
-        if claims_section:
-            claims_content = claims_section.group(1)
-            self._data["claims"] = [
-                line.strip().lstrip("123. ")
-                for line in claims_content.split("\n")
-                if line.strip() and line[0].isdigit()
-            ]
+        self._lint_engine = None
+        self._data = parse_checkpoint(self._content)
 
     def is_loaded(self) -> bool:
         """Check if checkpoint is loaded."""
@@ -169,49 +282,36 @@ class EditorialCheckpoint:
 
         return True, None  # Unknown terms are assumed valid
 
+    @property
+    def lint_engine(self) -> LintEngine:
+        """Legacy terms and prohibited language compiled into one matcher."""
+        if self._lint_engine is None:
+            self._lint_engine = LintEngine.from_standards(
+                legacy_terms=self.terminology_mapping,
+                avoid=PROHIBITED_TERMS,
+                throat_clearing=(),
+            )
+        return self._lint_engine
+
     def find_issues(self, content: str) -> List[Dict[str, Any]]:
         """
         Find terminology and positioning issues in content.
 
-        Returns list of issues found.
+        Returns list of issues found: legacy terms first, then prohibited
+        language, one per term with the context of its first occurrence.
         """
-        issues = []
-
-        # Check for legacy terms
-        for legacy, current in self.terminology_mapping.items():
-            if legacy.lower() in content.lower():
-                issues.append({
-                    "type": "legacy_term",
-                    "term": legacy,
-                    "suggestion": current,
-                    "context": self._find_context(content, legacy),
-                })
-
-        # Check for prohibited language (from original content)
-        prohibited = [
-            "revolutionary", "paradigm shift", "Web3", "democratize",
-            "might", "could potentially", "tokenomics", "network effects",
-            "moats", "the future of AI", "unprecedented capabilities",
+        grouped = group_hits(self.lint_engine.scan(content))
+        ordered = sorted(grouped.items(), key=lambda item: item[0][0] != LEGACY_TERM)
+        return [
+            {
+                "type": rule,
+                "term": term,
+                "suggestion": hits[0].suggestion,
+                "context": hits[0].context,
+                "count": len(hits),
+            }
+            for (rule, term), hits in ordered
         ]
-        for term in prohibited:
-            if term.lower() in content.lower():
-                issues.append({
-                    "type": "prohibited",
-                    "term": term,
-                    "suggestion": "Remove or rephrase",
-                    "context": self._find_context(content, term),
-                })
-
-        return issues
-
-    def _find_context(self, content: str, term: str, window: int = 50) -> str:
-        """Find context around a term."""
-        idx = content.lower().find(term.lower())
-        if idx == -1:
-            return ""
-        start = max(0, idx - window)
-        end = min(len(content), idx + len(term) + window)
-        return content[start:end]
 
     def check_positioning(self, content: str) -> Dict[str, Any]:
         """Check content against current strategic positioning."""
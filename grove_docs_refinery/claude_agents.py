@@ -6,14 +6,24 @@ Drop-in replacement for rules-based editor/reviewer using Claude API.
 Prompts are loaded from external files for easy tuning.
 """
 
+import sys
 import yaml
 from pathlib import Path
-from typing import Optional, Dict, List
-from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Tuple, Union
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 
 import anthropic
 
+from checkpoint import read_context_file
+
+# Shared Message Batches runner lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from message_batches import MessageBatchRunner, batch_ids, usage_to_dict
+from rate_limits import estimate_tokens, get_limiter
+from result_cache import ResultCache, cache_key
+
 # Import dataclasses from original modules to maintain compatibility
 from editor import Analysis, Draft
 from reviewer import Review, Assessment
@@ -44,6 +54,41 @@ def load_settings() -> Dict:
     }
 
 
+def build_system(system_prompt: str, engine_content: str, checkpoint_content: str) -> List[Dict]:
+    """Build system blocks with the editorial engine + checkpoint as a cached prefix.
+
+    The engine and checkpoint are identical for every document in a run, so
+    they're marked with cache_control and only the source document goes in
+    the user message. Calls after the first read the prefix from the prompt
+    cache instead of paying full input price for it.
+    """
+    context = f"""## Grove Editorial Engine (Methodology)
+
+{engine_content}
+
+---
+
+## Grove Editorial Checkpoint (Current State)
+
+{checkpoint_content}"""
+    return [
+        {"type": "text", "text": system_prompt},
+        {"type": "text", "text": context, "cache_control": {"type": "ephemeral"}},
+    ]
+
+
+def estimate_request_tokens(params: Dict) -> int:
+    """Estimated input tokens for a messages.create() request."""
+    text = "".join(block["text"] for block in params["system"])
+    text += "".join(message["content"] for message in params["messages"])
+    return estimate_tokens(text)
+
+
+def rate_limited_tokens(usage: Dict[str, int]) -> int:
+    """Tokens that count against the rate limit (cache reads don't)."""
+    return usage["input_tokens"] + usage["cache_creation_input_tokens"] + usage["output_tokens"]
+
+
 class ClaudeEditorAgent:
     """Claude-powered editor that follows Grove editorial methodology.
 
@@ -54,9 +99,11 @@ class ClaudeEditorAgent:
         self,
         engine_path: Optional[Path] = None,
         checkpoint_path: Optional[Path] = None,
+        cache: Optional[ResultCache] = None,
     ):
         self.engine_path = engine_path
         self.checkpoint_path = checkpoint_path
+        self.cache = cache
         self._engine_content: str = ""
         self._checkpoint_content: str = ""
         self._client = anthropic.Anthropic()
@@ -74,12 +121,12 @@ class ClaudeEditorAgent:
             self.checkpoint_path = checkpoint_path
 
         if self.engine_path and self.engine_path.exists():
-            self._engine_content = self.engine_path.read_text(encoding="utf-8")
+            self._engine_content = read_context_file(self.engine_path)
         else:
             raise FileNotFoundError(f"Editorial engine not found: {self.engine_path}")
 
         if self.checkpoint_path and self.checkpoint_path.exists():
-            self._checkpoint_content = self.checkpoint_path.read_text(encoding="utf-8")
+            self._checkpoint_content = read_context_file(self.checkpoint_path)
         else:
             raise FileNotFoundError(f"Editorial checkpoint not found: {self.checkpoint_path}")
 
@@ -107,26 +154,56 @@ class ClaudeEditorAgent:
 
     def rewrite(self, source_path: Path, analysis: Analysis) -> Draft:
         """Rewrite a document using Claude."""
-        source_content = source_path.read_text(encoding="utf-8")
-        source_name = source_path.name
-
-        # Load system prompt from file
-        system_prompt = load_prompt("writer_system")
+        params, key, cached = self.prepare_rewrite(source_path)
+        if cached:
+            return cached
 
-        # Build user message with full context
-        user_message = f"""## Grove Editorial Engine (Methodology)
+        source_name = source_path.name
+        model = params["model"]
+        print(f"  Calling Claude to rewrite {source_name}...")
+        print(f"    Source: {len(params['messages'][0]['content']):,} chars")
+
+        limiter = get_limiter(model, self._settings)
+        estimated = estimate_request_tokens(params)
+
+        with limiter.acquire(estimated):
+            # Use streaming for Opus to handle long-running requests
+            # (Anthropic API requires streaming for requests that may exceed 10 minutes)
+            if "opus" in model.lower():
+                print(f"    Using streaming for {model}...")
+                raw_response = ""
+                with self._client.messages.stream(**params) as stream:
+                    for text in stream.text_stream:
+                        raw_response += text
+                    usage = stream.get_final_message().usage
+            else:
+                response = self._client.messages.create(**params)
+                raw_response = response.content[0].text
+                usage = response.usage
+        usage = usage_to_dict(usage)
+        limiter.settle(estimated, rate_limited_tokens(usage))
 
-{self._engine_content}
+        print(f"    Response: {len(raw_response):,} chars")
+        print(f"    Cache: {usage['cache_read_input_tokens']:,} read, "
+              f"{usage['cache_creation_input_tokens']:,} written")
 
----
+        return self.finish_rewrite(source_name, raw_response, usage, key)
 
-## Grove Editorial Checkpoint (Current State)
+    def prepare_rewrite(self, source_path: Path) -> Tuple[Dict, Optional[str], Optional[Draft]]:
+        """Build the rewrite request for a document.
 
-{self._checkpoint_content}
+        Returns:
+            (message params, result cache key, cached Draft or None)
+        """
+        source_content = source_path.read_text(encoding="utf-8")
+        source_name = source_path.name
 
----
+        # System prompt plus cached editorial context
+        system_prompt = load_prompt("writer_system")
+        system = build_system(system_prompt, self._engine_content, self._checkpoint_content)
 
-## Source Document to Rewrite
+        # User message carries only the per-document content
+        user_message = f"""## Source Document to Rewrite
 
 **Filename:** {source_name}
 
@@ -134,42 +211,80 @@ class ClaudeEditorAgent:
 
 ---
 
-Please rewrite this document following the methodology and checkpoint above.
+Please rewrite this document following the editorial methodology and checkpoint.
 Remember to preserve intentional honesty in sections about caveats, risks, and uncertainties.
 """
 
-        print(f"  Calling Claude to rewrite {source_name}...")
-        print(f"    Source: {len(source_content):,} chars")
-
         settings = self._settings.get("writer", {})
-        model = settings.get("model", "claude-sonnet-4-20250514")
-        max_tokens = settings.get("max_tokens", 16000)
-
-        # Use streaming for Opus to handle long-running requests
-        # (Anthropic API requires streaming for requests that may exceed 10 minutes)
-        if "opus" in model.lower():
-            print(f"    Using streaming for {model}...")
-            raw_response = ""
-            with self._client.messages.stream(
-                model=model,
-                max_tokens=max_tokens,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_message}]
-            ) as stream:
-                for text in stream.text_stream:
-                    raw_response += text
-        else:
-            response = self._client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_message}]
+        params = {
+            "model": settings.get("model", "claude-sonnet-4-20250514"),
+            "max_tokens": settings.get("max_tokens", 16000),
+            "system": system,
+            "messages": [{"role": "user", "content": user_message}],
+        }
+
+        key = None
+        if self.cache:
+            key = cache_key(
+                "rewrite",
+                system=system,
+                user_message=user_message,
+                settings=settings,
             )
-            raw_response = response.content[0].text
+            cached = self.cache.get(key)
+            if cached:
+                print(f"  Using cached rewrite for {source_name}")
+                return params, key, Draft(**{**cached, "usage": {}})
 
-        print(f"    Response: {len(raw_response):,} chars")
+        return params, key, None
 
-        return self._parse_response(source_name, raw_response)
+    def finish_rewrite(
+        self,
+        source_name: str,
+        raw_response: str,
+        usage: Dict[str, int],
+        key: Optional[str] = None,
+    ) -> Draft:
+        """Parse a rewrite response and store it in the result cache."""
+        draft = self._parse_response(source_name, raw_response)
+        draft.usage = usage
+
+        # Don't cache a response we couldn't extract content from
+        if key and self.cache and draft.content:
+            self.cache.put(key, asdict(draft))
+        return draft
+
+    def rewrite_batch(
+        self,
+        source_paths: List[Path],
+        runner: Optional[MessageBatchRunner] = None,
+    ) -> Dict[str, Union[Draft, Exception]]:
+        """Rewrite many documents through one Message Batch.
+
+        Returns:
+            Source filename -> Draft, or the exception for a failed request
+        """
+        results: Dict[str, Union[Draft, Exception]] = {}
+        pending = {}
+        for source_path in source_paths:
+            params, key, cached = self.prepare_rewrite(source_path)
+            if cached:
+                results[source_path.name] = cached
+            else:
+                pending[source_path.name] = (params, key)
+
+        if pending:
+            ids = batch_ids(list(pending), prefix="rewrite")
+            runner = runner or MessageBatchRunner(self._client)
+            batch_results = runner.run({ids[name]: params for name, (params, _) in pending.items()})
+            for name, (params, key) in pending.items():
+                result = batch_results[ids[name]]
+                if result.ok:
+                    results[name] = self.finish_rewrite(name, result.text, result.usage, key)
+                else:
+                    results[name] = RuntimeError(f"Batch rewrite failed: {result.error}")
+
+        return results
 
     def _parse_response(self, source_name: str, raw_response: str) -> Draft:
         """Parse Claude's response into Draft structure.
@@ -266,9 +381,11 @@ class ClaudeReviewerAgent:
         self,
         engine_path: Optional[Path] = None,
         checkpoint_path: Optional[Path] = None,
+        cache: Optional[ResultCache] = None,
     ):
         self.engine_path = engine_path
         self.checkpoint_path = checkpoint_path
+        self.cache = cache
         self._engine_content: str = ""
         self._checkpoint_content: str = ""
         self._client = anthropic.Anthropic()
@@ -286,33 +403,54 @@ class ClaudeReviewerAgent:
             self.checkpoint_path = checkpoint_path
 
         if self.engine_path and self.engine_path.exists():
-            self._engine_content = self.engine_path.read_text(encoding="utf-8")
+            self._engine_content = read_context_file(self.engine_path)
 
         if self.checkpoint_path and self.checkpoint_path.exists():
-            self._checkpoint_content = self.checkpoint_path.read_text(encoding="utf-8")
+            self._checkpoint_content = read_context_file(self.checkpoint_path)
 
     def validate(self, original_path: Path, draft_path: Path) -> Review:
         """Review a rewritten document."""
-        original_content = original_path.read_text(encoding="utf-8")
-        draft_content = draft_path.read_text(encoding="utf-8")
+        params, key, cached = self.prepare_review(original_path, draft_path)
+        if cached:
+            return cached
+
         doc_name = original_path.name
+        print(f"  Calling Claude to review {doc_name}...")
 
-        # Load system prompt from file
-        system_prompt = load_prompt("reviewer_system")
+        limiter = get_limiter(params["model"], self._settings)
+        estimated = estimate_request_tokens(params)
 
-        user_message = f"""## Grove Editorial Engine (Methodology)
+        with limiter.acquire(estimated):
+            response = self._client.messages.create(**params)
+        usage = usage_to_dict(response.usage)
+        limiter.settle(estimated, rate_limited_tokens(usage))
 
-{self._engine_content}
+        raw_response = response.content[0].text
+        print(f"    Response: {len(raw_response):,} chars")
+        print(f"    Cache: {usage['cache_read_input_tokens']:,} read, "
+              f"{usage['cache_creation_input_tokens']:,} written")
 
----
+        return self.finish_review(doc_name, raw_response, usage, key)
 
-## Grove Editorial Checkpoint (Current State)
+    def prepare_review(
+        self,
+        original_path: Path,
+        draft_path: Path,
+    ) -> Tuple[Dict, Optional[str], Optional[Review]]:
+        """Build the review request for a draft.
 
-{self._checkpoint_content}
+        Returns:
+            (message params, result cache key, cached Review or None)
+        """
+        original_content = original_path.read_text(encoding="utf-8")
+        draft_content = draft_path.read_text(encoding="utf-8")
+        doc_name = original_path.name
 
----
+        # System prompt plus cached editorial context
+        system_prompt = load_prompt("reviewer_system")
+        system = build_system(system_prompt, self._engine_content, self._checkpoint_content)
 
-## Original Source Document
+        user_message = f"""## Original Source Document
 
 **Filename:** {doc_name}
 
@@ -330,20 +468,81 @@ Please review this rewrite against Grove standards.
 Pay special attention to whether intentional honesty in "Honest Assessment" sections was preserved.
 """
 
-        print(f"  Calling Claude to review {doc_name}...")
-
         settings = self._settings.get("reviewer", {})
-        response = self._client.messages.create(
-            model=settings.get("model", "claude-sonnet-4-20250514"),
-            max_tokens=settings.get("max_tokens", 4000),
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_message}]
-        )
+        params = {
+            "model": settings.get("model", "claude-sonnet-4-20250514"),
+            "max_tokens": settings.get("max_tokens", 4000),
+            "system": system,
+            "messages": [{"role": "user", "content": user_message}],
+        }
+
+        key = None
+        if self.cache:
+            key = cache_key(
+                "review",
+                system=system,
+                user_message=user_message,
+                settings=settings,
+            )
+            cached = self.cache.get(key)
+            if cached:
+                print(f"  Using cached review for {doc_name}")
+                return params, key, Review(**{
+                    **cached,
+                    "assessment": Assessment(cached["assessment"]),
+                    "usage": {},
+                })
+
+        return params, key, None
+
+    def finish_review(
+        self,
+        doc_name: str,
+        raw_response: str,
+        usage: Dict[str, int],
+        key: Optional[str] = None,
+    ) -> Review:
+        """Parse a review response and store it in the result cache."""
+        review = self._parse_response(doc_name, raw_response)
+        review.usage = usage
+
+        if key and self.cache:
+            data = asdict(review)
+            data["assessment"] = review.assessment.value
+            self.cache.put(key, data)
+        return review
+
+    def validate_batch(
+        self,
+        pairs: List[Tuple[Path, Path]],
+        runner: Optional[MessageBatchRunner] = None,
+    ) -> Dict[str, Union[Review, Exception]]:
+        """Review many (original, draft) pairs through one Message Batch.
 
-        raw_response = response.content[0].text
-        print(f"    Response: {len(raw_response):,} chars")
+        Returns:
+            Original filename -> Review, or the exception for a failed request
+        """
+        results: Dict[str, Union[Review, Exception]] = {}
+        pending = {}
+        for original_path, draft_path in pairs:
+            params, key, cached = self.prepare_review(original_path, draft_path)
+            if cached:
+                results[original_path.name] = cached
+            else:
+                pending[original_path.name] = (params, key)
+
+        if pending:
+            ids = batch_ids(list(pending), prefix="review")
+            runner = runner or MessageBatchRunner(self._client)
+            batch_results = runner.run({ids[name]: params for name, (params, _) in pending.items()})
+            for name, (params, key) in pending.items():
+                result = batch_results[ids[name]]
+                if result.ok:
+                    results[name] = self.finish_review(name, result.text, result.usage, key)
+                else:
+                    results[name] = RuntimeError(f"Batch review failed: {result.error}")
 
-        return self._parse_response(doc_name, raw_response)
+        return results
 
     def _parse_response(self, doc_name: str, raw_response: str) -> Review:
         """Parse Claude's response into Review structure."""
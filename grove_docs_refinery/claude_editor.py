@@ -13,6 +13,8 @@ from dataclasses import dataclass
 
 import anthropic
 
+from checkpoint import read_context_file
+
 
 # Paths to methodology files
 REFINERY_DIR = Path(__file__).parent
@@ -90,12 +92,12 @@ class ClaudeEditor:
     def load_context(self):
         """Load editorial engine and checkpoint."""
         if ENGINE_PATH.exists():
-            self.engine_content = ENGINE_PATH.read_text(encoding="utf-8")
+            self.engine_content = read_context_file(ENGINE_PATH)
         else:
             raise FileNotFoundError(f"Editorial engine not found: {ENGINE_PATH}")
 
         if CHECKPOINT_PATH.exists():
-            self.checkpoint_content = CHECKPOINT_PATH.read_text(encoding="utf-8")
+            self.checkpoint_content = read_context_file(CHECKPOINT_PATH)
         else:
             raise FileNotFoundError(f"Editorial checkpoint not found: {CHECKPOINT_PATH}")
 
@@ -70,6 +70,11 @@ class RefineryConfig:
                 "batch_size": 5,
                 "max_revisions": 2,
             },
+            "cache": {
+                "dir": str(refinery_root / "cache"),
+                "max_size_mb": 200,
+                "max_age_days": 30,
+            },
             "editor": {
                 "model": "sonnet",
                 "checkpoint_path": str(refinery_root / "editorial-checkpoint.md"),
@@ -155,6 +160,18 @@ class RefineryConfig:
     def max_revisions(self) -> int:
         return self.get("refinery", "max_revisions", default=2)
 
+    @property
+    def cache_dir(self) -> Path:
+        return self._resolve_path(self.get("cache", "dir", default="cache"))
+
+    @property
+    def cache_max_size_mb(self) -> float:
+        return self.get("cache", "max_size_mb", default=200)
+
+    @property
+    def cache_max_age_days(self) -> float:
+        return self.get("cache", "max_age_days", default=30)
+
     @property
     def backend(self) -> str:
         """Backend to use: 'claude' or 'rules'."""
@@ -11,6 +11,19 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from checkpoint import read_context_file
+from lint import LintEngine, group_hits
+
+# Legacy term -> current term
+LEGACY_MAPPINGS = {
+    "AI platform": "Exploration architecture",
+    "decentralized AI": "Exploration architecture",
+    "bots": "Agents",
+    "AI assistants": "Agents",
+    "tokens": "Credits",
+}
+
+_TERMINOLOGY_ENGINE = LintEngine.from_standards(legacy_terms=LEGACY_MAPPINGS, throat_clearing=())
 
 @dataclass
 class Analysis:
@@ -50,6 +63,7 @@ class Draft:
     flags_for_review: List[str]
     content: str
     editor_notes: str = ""
+    usage: Dict[str, int] = field(default_factory=dict)  # API token usage, if any
 
 
 class EditorAgent:
@@ -77,10 +91,10 @@ class EditorAgent:
             self.checkpoint_path = checkpoint_path
 
         if self.engine_path and self.engine_path.exists():
-            self._engine_content = self.engine_path.read_text()
+            self._engine_content = read_context_file(self.engine_path)
 
         if self.checkpoint_path and self.checkpoint_path.exists():
-            self._checkpoint_content = self.checkpoint_path.read_text()
+            self._checkpoint_content = read_context_file(self.checkpoint_path)
 
     def analyze(self, source_path: Path) -> Analysis:
         """Analyze a source document."""
@@ -215,26 +229,15 @@ class EditorAgent:
 
     def _find_terminology_issues(self, content: str) -> List[Dict]:
         """Find terminology issues in content."""
-        issues = []
-
-        legacy_mappings = {
-            "AI platform": "Exploration architecture",
-            "decentralized AI": "Exploration architecture",
-            "bots": "Agents",
-            "AI assistants": "Agents",
-            "tokens": "Credits",
-        }
-
-        for legacy, current in legacy_mappings.items():
-            if legacy.lower() in content.lower():
-                count = content.lower().count(legacy.lower())
-                issues.append({
-                    "legacy": legacy,
-                    "current": current,
-                    "count": count,
-                })
-
-        return issues
+        grouped = group_hits(_TERMINOLOGY_ENGINE.scan(content))
+        return [
+            {
+                "legacy": legacy,
+                "current": hits[0].suggestion,
+                "count": len(hits),
+            }
+            for (_, legacy), hits in grouped.items()
+        ]
 
     def _check_positioning(self, content: str) -> Dict:
         """Check positioning alignment."""
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Grove Docs Refinery - Lint Engine
+
+Compiles the editorial term lists (checkpoint legacy-term mapping,
+standards.avoid, throat-clearing phrases, current terms) into one
+case-insensitive, word-boundary-aware matcher and reports every hit with
+offsets, line number and surrounding context in a single pass over the
+document.
+
+The terms are folded into a prefix trie and emitted as one regex, so the
+scan does one trie walk per position rather than one substring search
+per term. Terms match across any whitespace and either apostrophe style
+("it's" / "it’s"). When one term contains another ("it's important to
+note that" / "it's important to note") both are reported.
+
+Usage:
+    python lint.py                        # lint refined/ on all cores
+    python lint.py docs/*.md --jobs 4
+    python lint.py --format json --fail-on legacy_term
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Rule names
+LEGACY_TERM = "legacy_term"
+PROHIBITED = "prohibited"
+THROAT_CLEARING = "throat_clearing"
+CURRENT_TERM = "current_term"  # Presence of approved terms (not an issue)
+
+THROAT_CLEARING_PHRASES = [
+    "it's important to note",
+    "in order to",
+    "it should be noted",
+]
+
+CONTEXT_WINDOW = 50
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A term to look for and what to say about it."""
+    term: str
+    rule: str
+    suggestion: str = ""
+
+
+@dataclass
+class LintHit:
+    """One occurrence of a rule's term in a document."""
+    rule: str
+    term: str          # Term as configured
+    suggestion: str
+    start: int         # Character offsets of the match in the document
+    end: int
+    line: int          # 1-based
+    context: str
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _term_key(text: str) -> str:
+    """Canonical form a term and its matches share."""
+    return " ".join(text.lower().replace("’", "'").split())
+
+
+def _trie_pattern(keys: Iterable[str]) -> str:
+    """Regex for a set of canonical keys, factored as a prefix trie."""
+    trie: Dict = {}
+    for key in keys:
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def atom(ch: str) -> str:
+        if ch == " ":
+            return r"\s+"
+        if ch == "'":
+            return "['’]"
+        return re.escape(ch)
+
+    def emit(node: Dict) -> str:
+        ends = "" in node
+        branches = [atom(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Prefer the longer match; an ending here makes the rest optional
+        return f"(?:{body})?" if ends else body
+
+    return emit(trie)
+
+
+class LintEngine:
+    """All lint rules compiled into one single-pass matcher."""
+
+    def __init__(self, rules: Iterable[Rule], context_window: int = CONTEXT_WINDOW):
+        self.context_window = context_window
+        self.rules: Dict[str, List[Rule]] = {}
+        for rule in rules:
+            key = _term_key(rule.term)
+            if key and rule not in self.rules.setdefault(key, []):
+                self.rules[key].append(rule)
+
+        # Shorter terms contained in a longer one, with their offset in it,
+        # so a single longest match still reports both
+        self._nested: Dict[str, List[Tuple[int, str]]] = {}
+        for key in self.rules:
+            for other in self.rules:
+                if other == key or len(other) >= len(key):
+                    continue
+                for m in re.finditer(re.escape(other), key):
+                    before = key[m.start() - 1] if m.start() else " "
+                    after = key[m.end()] if m.end() < len(key) else " "
+                    if not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_"):
+                        self._nested.setdefault(key, []).append((m.start(), other))
+
+        self._pattern = re.compile(
+            r"(?<!\w)(?:" + _trie_pattern(self.rules) + r")(?!\w)",
+            re.IGNORECASE,
+        ) if self.rules else None
+
+    @classmethod
+    def from_standards(
+        cls,
+        legacy_terms: Optional[Dict[str, str]] = None,
+        avoid: Iterable[str] = (),
+        throat_clearing: Iterable[str] = THROAT_CLEARING_PHRASES,
+        current_terms: Iterable[str] = (),
+    ) -> 'LintEngine':
+        """
+        Build an engine from the editorial term lists.
+
+        Args:
+            legacy_terms: legacy term -> current term
+            avoid: prohibited terms (standards.avoid)
+            throat_clearing: filler phrases
+            current_terms: approved terms, reported as CURRENT_TERM hits
+        """
+        rules = [Rule(legacy, LEGACY_TERM, current)
+                 for legacy, current in (legacy_terms or {}).items()]
+        rules += [Rule(term, PROHIBITED, "Remove or rephrase") for term in avoid]
+        rules += [Rule(phrase, THROAT_CLEARING, "Cut the phrase") for phrase in throat_clearing]
+        rules += [Rule(term, CURRENT_TERM) for term in current_terms]
+        return cls(rules)
+
+    def scan(self, content: str) -> List[LintHit]:
+        """Every hit in the document, in order of position."""
+        if not self._pattern:
+            return []
+
+        hits = []
+        window = self.context_window
+        line, line_pos = 1, 0
+        for match in self._pattern.finditer(content):
+            start, end = match.span()
+            line += content.count("\n", line_pos, start)
+            line_pos = start
+            context = content[max(0, start - window):end + window]
+
+            key = _term_key(match.group())
+            found = [(start, end, key)]
+            if key in self._nested:
+                # Map nested terms back onto the document via word positions
+                found += self._nested_spans(match, key)
+            for hit_start, hit_end, hit_key in found:
+                for rule in self.rules.get(hit_key, ()):
+                    hits.append(LintHit(rule.rule, rule.term, rule.suggestion,
+                                        hit_start, hit_end, line, context))
+        return hits
+
+    def _nested_spans(self, match: 're.Match', key: str) -> List[Tuple[int, int, str]]:
+        """Document spans of shorter terms inside a longer matched term."""
+        text = match.group()
+        # Canonical key offset -> document offset (the key collapses whitespace)
+        offsets = []
+        prev_space = False
+        for i, ch in enumerate(text):
+            if ch.isspace():
+                if not prev_space:
+                    offsets.append(i)
+                prev_space = True
+            else:
+                offsets.append(i)
+                prev_space = False
+        offsets.append(len(text))
+
+        spans = []
+        for key_start, other in self._nested[key]:
+            key_end = key_start + len(other)
+            spans.append((match.start() + offsets[key_start],
+                          match.start() + offsets[key_end - 1] + 1, other))
+        return spans
+
+
+def group_hits(hits: Iterable[LintHit]) -> Dict[Tuple[str, str], List[LintHit]]:
+    """Hits grouped by (rule, term), in order of first occurrence."""
+    grouped: Dict[Tuple[str, str], List[LintHit]] = {}
+    for hit in hits:
+        grouped.setdefault((hit.rule, hit.term), []).append(hit)
+    return grouped
+
+
+# ============================================================================
+# Corpus CLI
+# ============================================================================
+
+def default_engine(checkpoint_path: Optional[Path] = None) -> LintEngine:
+    """Engine from config.yaml standards plus the editorial checkpoint."""
+    from config import get_config
+    from checkpoint import load_checkpoint
+
+    config = get_config()
+    legacy = {}
+    for current, legacy_list in config.terminology_mapping.items():
+        for term in legacy_list or []:
+            legacy[term] = current
+    checkpoint = load_checkpoint(checkpoint_path or config.checkpoint_path)
+    legacy.update(checkpoint.terminology_mapping)
+    return LintEngine.from_standards(legacy_terms=legacy, avoid=config.terms_to_avoid)
+
+
+_worker_engine: Optional[LintEngine] = None
+
+
+def _init_worker(checkpoint_path: Optional[str]):
+    global _worker_engine
+    sys.path.insert(0, str(Path(__file__).parent))
+    _worker_engine = default_engine(Path(checkpoint_path) if checkpoint_path else None)
+
+
+def _lint_file(path: str) -> Tuple[str, List[Dict]]:
+    content = Path(path).read_text(encoding="utf-8")
+    return path, [hit.to_dict() for hit in _worker_engine.scan(content)]
+
+
+def lint_files(paths: List[Path], jobs: Optional[int] = None,
+               checkpoint_path: Optional[Path] = None) -> Dict[str, List[Dict]]:
+    """Lint files across processes; returns path -> hits (as dicts)."""
+    jobs = jobs or os.cpu_count() or 1
+    args = str(checkpoint_path) if checkpoint_path else None
+    files = [str(p) for p in paths]
+    if jobs == 1 or len(files) < 2:
+        _init_worker(args)
+        return dict(map(_lint_file, files))
+
+    chunksize = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(args,)) as pool:
+        return dict(pool.map(_lint_file, files, chunksize=chunksize))
+
+
+def main():
+    sys.path.insert(0, str(Path(__file__).parent))
+    from config import get_config
+
+    parser = argparse.ArgumentParser(description="Lint Grove docs for legacy terms and prohibited language")
+    parser.add_argument("paths", nargs="*", help="Files or directories (default: refined/)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--checkpoint", type=Path, help="Editorial checkpoint path")
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument("--fail-on", default=f"{LEGACY_TERM},{PROHIBITED}",
+                        help="Comma-separated rules that fail the run (exit 1)")
+    args = parser.parse_args()
+
+    targets = [Path(p) for p in args.paths] or [get_config().refined_dir]
+    files = []
+    for target in targets:
+        if target.is_dir():
+            files.extend(sorted(target.rglob("*.md")))
+        elif target.exists():
+            files.append(target)
+        else:
+            print(f"Warning: not found: {target}", file=sys.stderr)
+
+    results = lint_files(files, jobs=args.jobs, checkpoint_path=args.checkpoint)
+    fail_on = {rule.strip() for rule in args.fail_on.split(",") if rule.strip()}
+    reported = {path: [h for h in hits if h["rule"] != CURRENT_TERM]
+                for path, hits in results.items()}
+    failures = sum(1 for hits in reported.values() for h in hits if h["rule"] in fail_on)
+
+    if args.format == "json":
+        print(json.dumps({path: hits for path, hits in reported.items() if hits}, indent=2))
+    else:
+        for path, hits in reported.items():
+            for h in hits:
+                suggestion = f" -> {h['suggestion']}" if h["suggestion"] else ""
+                print(f"{path}:{h['line']}: [{h['rule']}] '{h['term']}'{suggestion}")
+        total = sum(len(hits) for hits in reported.values())
+        print(f"\n{len(files)} files, {total} hits, {failures} failing ({', '.join(sorted(fail_on))})")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,13 +17,18 @@ Schedule via Task Scheduler or cron for daily execution.
 import os
 import re
 import json
+import sys
 import hashlib
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-import requests
 from dotenv import load_dotenv
 
+# Shared Notion transport lives in notion_pipeline at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from notion_pipeline.transport import NotionTransport, get_transport
+
 load_dotenv()
 
 # Configuration
@@ -46,11 +51,11 @@ TYPE_MAP = {
     "blog": "b"
 }
 
-HEADERS = {
-    'Authorization': f'Bearer {NOTION_KEY}',
-    'Content-Type': 'application/json',
-    'Notion-Version': '2022-06-28'
-}
+
+def notion() -> NotionTransport:
+    """Shared pooled, rate-limited Notion transport."""
+    return get_transport(NOTION_KEY)
+
 
 
 def load_sync_state() -> Dict:
@@ -78,7 +83,7 @@ def get_child_pages(parent_id: str) -> List[Dict]:
     url = f'https://api.notion.com/v1/blocks/{parent_id}/children'
     pages = []
 
-    response = requests.get(url, headers=HEADERS)
+    response = notion().get(url)
     if response.status_code == 200:
         results = response.json().get('results', [])
         for block in results:
@@ -96,7 +101,7 @@ def get_page_content(page_id: str) -> Dict:
     """Get full page content and metadata."""
     # Get page properties
     page_url = f'https://api.notion.com/v1/pages/{page_id}'
-    page_resp = requests.get(page_url, headers=HEADERS)
+    page_resp = notion().get(page_url)
 
     if page_resp.status_code != 200:
         return None
@@ -106,7 +111,7 @@ def get_page_content(page_id: str) -> Dict:
 
     # Get page blocks (content)
     blocks_url = f'https://api.notion.com/v1/blocks/{page_id}/children?page_size=100'
-    blocks_resp = requests.get(blocks_url, headers=HEADERS)
+    blocks_resp = notion().get(blocks_url)
 
     if blocks_resp.status_code != 200:
         return None
@@ -385,7 +390,6 @@ def run_sync(categories: List[str] = None, apply: bool = True):
 
 
 def main():
-    import sys
     args = sys.argv[1:]
 
     if '--help' in args or '-h' in args:
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Grove Docs Refinery - Per-Model Rate Limits
+
+Bounds concurrent Claude calls and token throughput per model so a
+parallel batch (`refinery.py --workers N`) stays inside the account's
+rate limits instead of failing with 429s.
+
+Limits are read from the `limits` section of prompts/settings.yaml:
+
+    limits:
+      default:
+        max_concurrent: 4
+        tokens_per_minute: 80000
+      claude-opus-4-20250514:
+        max_concurrent: 2
+        tokens_per_minute: 30000
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+DEFAULT_LIMITS = {"max_concurrent": 4, "tokens_per_minute": 80000}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 chars per token) for pre-call budgeting."""
+    return max(1, len(text) // 4)
+
+
+class ModelLimiter:
+    """Concurrency slots plus a tokens-per-minute bucket for one model.
+
+    `acquire(estimate)` reserves the estimated input tokens up front;
+    `settle()` corrects the bucket with the usage the API actually reported.
+    """
+
+    def __init__(self, model: str, max_concurrent: int, tokens_per_minute: int):
+        self.model = model
+        self.max_concurrent = max_concurrent
+        self.tokens_per_minute = tokens_per_minute
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._rate = tokens_per_minute / 60.0
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self._rate)
+            self._updated = now
+
+    def _take_tokens(self, count: int):
+        # A request bigger than the whole bucket goes through once it's full
+        count = min(count, self.tokens_per_minute)
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= count:
+                    self._tokens -= count
+                    return
+                wait = (count - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def settle(self, estimated: int, actual: int):
+        """Charge (or refund) the difference between estimate and real usage."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.tokens_per_minute, self._tokens - (actual - estimated))
+
+    @contextmanager
+    def acquire(self, estimated_tokens: int):
+        """Hold a concurrency slot and reserve tokens for one request."""
+        self._slots.acquire()
+        try:
+            self._take_tokens(estimated_tokens)
+            yield self
+        finally:
+            self._slots.release()
+
+
+_limiters: Dict[str, ModelLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(model: str, settings: Optional[Dict] = None) -> ModelLimiter:
+    """Get the process-wide limiter for a model.
+
+    Args:
+        model: Model name as passed to the API
+        settings: Loaded settings.yaml (its `limits` section is used)
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(model)
+        if limiter is None:
+            limits = (settings or {}).get("limits", {})
+            config = {**DEFAULT_LIMITS, **limits.get("default", {}), **limits.get(model, {})}
+            limiter = ModelLimiter(
+                model,
+                max_concurrent=int(config["max_concurrent"]),
+                tokens_per_minute=int(config["tokens_per_minute"]),
+            )
+            _limiters[model] = limiter
+        return limiter
@@ -8,6 +8,8 @@ Orchestrates the batch content refactoring workflow.
 import json
 import sys
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -25,16 +27,26 @@ from reviewer import ReviewerAgent, Review, Assessment
 
 # Claude-powered agents (drop-in replacements)
 from claude_agents import ClaudeEditorAgent, ClaudeReviewerAgent
+from result_cache import ResultCache
 
 
 @dataclass
 class RunManifest:
-    """Manifest tracking a refinery run."""
+    """Manifest tracking a refinery run.
+
+    When `path` is set, every `record()` rewrites the manifest on disk so an
+    interrupted run can be resumed from it.
+    """
     run_id: str
     run_date: str
     files: List[Dict] = field(default_factory=list)
     escalate_items: List[Dict] = field(default_factory=list)
     summary: Dict = field(default_factory=dict)
+    path: Optional[Path] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    # Statuses that count as done when resuming (ERROR files are retried)
+    DONE_STATUSES = ("PASS", "REVISE", "ESCALATE")
 
     def to_dict(self) -> Dict:
         return {
@@ -45,8 +57,34 @@ class RunManifest:
             "summary": self.summary,
         }
 
-    def save(self, path: Path):
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+    def save(self, path: Optional[Path] = None):
+        path = path or self.path
+        with self._lock:
+            # Write-then-rename so an interrupted save never truncates the manifest
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(self.to_dict(), indent=2))
+            tmp_path.replace(path)
+
+    def record(self, result: Dict, escalate_item: Optional[Dict] = None):
+        """Add a file result (replacing any earlier attempt) and persist."""
+        with self._lock:
+            name = result.get("original_name")
+            self.files = [f for f in self.files if f.get("original_name") != name]
+            self.files.append(result)
+            if escalate_item:
+                self.escalate_items = [
+                    item for item in self.escalate_items if item.get("file") != name
+                ]
+                self.escalate_items.append(escalate_item)
+        if self.path:
+            self.save()
+
+    def completed_files(self) -> set:
+        """Original names of files that finished with a final status."""
+        return {
+            f["original_name"] for f in self.files
+            if f.get("status") in self.DONE_STATUSES
+        }
 
     @classmethod
     def load(cls, path: Path) -> 'RunManifest':
@@ -54,6 +92,7 @@ class RunManifest:
         manifest = cls(
             run_id=data["run_id"],
             run_date=data["run_date"],
+            path=path,
         )
         manifest.files = data.get("files", [])
         manifest.escalate_items = data.get("escalate_items", [])
@@ -68,6 +107,7 @@ class RefineryOrchestrator:
         self,
         config_path: Optional[Path] = None,
         backend: Optional[str] = None,
+        use_cache: bool = True,
     ):
         self.config = get_config()
         self.config.ensure_directories()
@@ -79,9 +119,18 @@ class RefineryOrchestrator:
         self.checkpoint: Optional[EditorialCheckpoint] = None
 
         # Initialize agents based on backend
+        # Cache of Claude results keyed by their inputs
+        self.cache: Optional[ResultCache] = None
+        if self.backend == "claude" and use_cache:
+            self.cache = ResultCache(
+                self.config.cache_dir,
+                max_size_mb=self.config.cache_max_size_mb,
+                max_age_days=self.config.cache_max_age_days,
+            )
+
         if self.backend == "claude":
-            self.editor = ClaudeEditorAgent()
-            self.reviewer = ClaudeReviewerAgent()
+            self.editor = ClaudeEditorAgent(cache=self.cache)
+            self.reviewer = ClaudeReviewerAgent(cache=self.cache)
         else:
             self.editor = EditorAgent()
             self.reviewer = ReviewerAgent()
@@ -108,57 +157,165 @@ class RefineryOrchestrator:
         input_dir: Optional[Path] = None,
         output_base: Optional[Path] = None,
         batch_size: Optional[int] = None,
+        workers: int = 1,
+        resume: Optional[str] = None,
+        batch_api: bool = False,
     ) -> RunManifest:
-        """Run refinery on all files in input directory."""
+        """Run refinery on all files in input directory.
+
+        Args:
+            workers: Files processed concurrently (Claude calls are further
+                bounded per model by rate_limits)
+            resume: Run ID or manifest path to continue; "latest" picks the
+                most recent manifest. Files already PASS/REVISE/ESCALATE
+                are skipped.
+            batch_api: Submit all rewrites, then all reviews, as Message
+                Batches (half price, no interactive latency guarantee)
+        """
         input_dir = input_dir or self.config.input_dir
         output_base = output_base or self.config.drafts_dir.parent
 
         batch_size = batch_size or self.config.batch_size
 
-        # Create manifest
-        run_id = datetime.now().strftime("%Y%m%d-%H%M%S")
-        self.manifest = RunManifest(
-            run_id=run_id,
-            run_date=datetime.now().isoformat(),
-        )
+        # Create or resume manifest (saved after every file)
+        if resume:
+            manifest_path = self._find_manifest(resume)
+            self.manifest = RunManifest.load(manifest_path)
+            print(f"Resuming run {self.manifest.run_id} from {manifest_path}")
+        else:
+            run_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+            self.manifest = RunManifest(
+                run_id=run_id,
+                run_date=datetime.now().isoformat(),
+                path=self.config.logs_dir / f"refinery-run-{run_id}.json",
+            )
+        self.manifest.save()
 
         # Scan input directory
         input_files = self._scan_input_dir(input_dir)
+        done = self.manifest.completed_files()
+        pending = [f for f in input_files if f.name not in done]
         print(f"Found {len(input_files)} files to process")
+        if len(pending) < len(input_files):
+            print(f"Skipping {len(input_files) - len(pending)} files already completed")
 
         # Process files
-        for i, file_path in enumerate(input_files):
-            print(f"\n[{i+1}/{len(input_files)}] Processing: {file_path.name}")
-
-            try:
-                result = self._process_file(file_path, output_base)
-                self.manifest.files.append(result)
-
-                if result["status"] == Assessment.ESCALATE.value:
-                    self.manifest.escalate_items.append({
-                        "file": file_path.name,
-                        "issue": "Requires human decision",
-                        "options": "See review for details",
-                    })
-
-            except Exception as e:
-                print(f"ERROR: {e}")
-                self.manifest.files.append({
-                    "original_name": file_path.name,
-                    "status": "ERROR",
-                    "error": str(e),
-                })
+        if batch_api and pending:
+            self._run_message_batches(pending)
+        elif workers > 1 and pending:
+            print(f"Running with {workers} workers")
+            # First file alone writes the prompt cache the others will read
+            self._run_file(pending[0], output_base, 0, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._run_file, file_path, output_base, i, len(pending))
+                    for i, file_path in enumerate(pending) if i > 0
+                ]
+                for future in as_completed(futures):
+                    future.result()
+        else:
+            for i, file_path in enumerate(pending):
+                self._run_file(file_path, output_base, i, len(pending))
 
         # Generate summary
         self._generate_summary()
 
         # Save manifest
-        manifest_path = self.config.logs_dir / f"refinery-run-{run_id}.json"
-        self.manifest.save(manifest_path)
-        print(f"\nManifest saved: {manifest_path}")
+        self.manifest.save()
+        print(f"\nManifest saved: {self.manifest.path}")
 
         return self.manifest
 
+    def _run_file(self, file_path: Path, output_base: Path, index: int, total: int):
+        """Process one file and record the outcome in the manifest."""
+        print(f"\n[{index+1}/{total}] Processing: {file_path.name}")
+
+        try:
+            result = self._process_file(file_path, output_base)
+        except Exception as e:
+            self._record_error(file_path, e)
+            return
+
+        self._record_result(file_path, result)
+
+    def _run_message_batches(self, input_files: List[Path]):
+        """Process files with all rewrites as one Message Batch, then all reviews."""
+        if self.backend != "claude":
+            raise ValueError("Message Batches mode requires the claude backend")
+
+        analyses = {}
+        for file_path in input_files:
+            try:
+                analyses[file_path.name] = self.editor.analyze(file_path)
+            except Exception as e:
+                self._record_error(file_path, e)
+        files = [f for f in input_files if f.name in analyses]
+
+        # Phase 2: all rewrites in one batch
+        print(f"\nRewriting {len(files)} files via Message Batches...")
+        drafts = self.editor.rewrite_batch(files)
+        draft_paths = {}
+        for file_path in files:
+            draft = drafts[file_path.name]
+            if isinstance(draft, Exception):
+                self._record_error(file_path, draft)
+                continue
+            working_name = self._normalize_name(file_path.name)
+            draft_paths[file_path.name] = self._save_draft(working_name, draft)
+        files = [f for f in files if f.name in draft_paths]
+
+        # Phase 3: all reviews in one batch
+        print(f"\nReviewing {len(files)} drafts via Message Batches...")
+        reviews = self.reviewer.validate_batch([(f, draft_paths[f.name]) for f in files])
+        for file_path in files:
+            review = reviews[file_path.name]
+            if isinstance(review, Exception):
+                self._record_error(file_path, review)
+                continue
+            try:
+                result = self._finish_file(
+                    file_path, analyses[file_path.name], drafts[file_path.name],
+                    draft_paths[file_path.name], review,
+                )
+            except Exception as e:
+                self._record_error(file_path, e)
+                continue
+            self._record_result(file_path, result)
+
+    def _record_error(self, file_path: Path, error: Exception):
+        print(f"ERROR ({file_path.name}): {error}")
+        self.manifest.record({
+            "original_name": file_path.name,
+            "status": "ERROR",
+            "error": str(error),
+        })
+
+    def _record_result(self, file_path: Path, result: Dict):
+        escalate_item = None
+        if result["status"] == Assessment.ESCALATE.value:
+            escalate_item = {
+                "file": file_path.name,
+                "issue": "Requires human decision",
+                "options": "See review for details",
+            }
+        self.manifest.record(result, escalate_item)
+
+    def _find_manifest(self, resume: str) -> Path:
+        """Resolve a run ID, manifest path or "latest" to a manifest file."""
+        if resume == "latest":
+            manifests = sorted(self.config.logs_dir.glob("refinery-run-*.json"))
+            if not manifests:
+                raise FileNotFoundError(f"No refinery runs in {self.config.logs_dir}")
+            return manifests[-1]
+
+        path = Path(resume)
+        if path.exists():
+            return path
+        path = self.config.logs_dir / f"refinery-run-{resume}.json"
+        if not path.exists():
+            raise FileNotFoundError(f"Run manifest not found: {path}")
+        return path
+
     def run_single(
         self,
         file_path: Path,
@@ -190,15 +347,31 @@ class RefineryOrchestrator:
         # Phase 2: Editor Pass
         print(f"  Rewriting...")
         draft = self.editor.rewrite(file_path, analysis)
+        draft_path = self._save_draft(working_name, draft)
+
+        # Phase 3: Reviewer Pass
+        print(f"  Reviewing...")
+        review = self.reviewer.validate(file_path, draft_path)
 
-        # Save draft
+        return self._finish_file(file_path, analysis, draft, draft_path, review)
+
+    def _save_draft(self, working_name: str, draft: Draft) -> Path:
+        """Write a draft to the drafts directory."""
         draft_path = self.config.drafts_dir / f"{working_name}--DRAFT.md"
         draft_content = self._format_draft(draft)
         draft_path.write_text(draft_content, encoding="utf-8")
+        return draft_path
 
-        # Phase 3: Reviewer Pass
-        print(f"  Reviewing...")
-        review = self.reviewer.validate(file_path, draft_path)
+    def _finish_file(
+        self,
+        file_path: Path,
+        analysis: Analysis,
+        draft: Draft,
+        draft_path: Path,
+        review: Review,
+    ) -> Dict:
+        """Write review and final outputs for a reviewed draft."""
+        working_name = self._normalize_name(file_path.name)
 
         # Save review
         review_path = self.config.reviews_dir / f"{working_name}--REVIEW.md"
@@ -237,7 +410,11 @@ class RefineryOrchestrator:
             "notes": review.specific_feedback[:200] if review.specific_feedback else "",
         }
 
-        print(f"  Status: {status}")
+        # Per-call token usage (Claude backend), including prompt cache hits/misses
+        if draft.usage or review.usage:
+            result["usage"] = {"rewrite": draft.usage, "review": review.usage}
+
+        print(f"  Status: {status} ({file_path.name})")
 
         return result
 
@@ -285,6 +462,18 @@ class RefineryOrchestrator:
         total_orig_words = sum(f.get("original_words", 0) for f in files)
         total_refined_words = sum(f.get("refined_words", 0) for f in files)
 
+        # Token usage across all calls
+        tokens = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        }
+        for f in files:
+            for call_usage in f.get("usage", {}).values():
+                for key in tokens:
+                    tokens[key] += call_usage.get(key, 0)
+
         self.manifest.summary = {
             "total_files": total,
             "passed": passed,
@@ -297,6 +486,7 @@ class RefineryOrchestrator:
                 int((total_refined_words / total_orig_words * 100))
                 if total_orig_words > 0 else 0
             ),
+            "tokens": tokens,
         }
 
         # Print summary
@@ -309,6 +499,12 @@ class RefineryOrchestrator:
         print(f"  ESCALATE: {escalated}")
         print(f"  ERROR: {errors}")
         print(f"Words: {total_orig_words} -> {total_refined_words} ({self.manifest.summary['word_change_pct']}%)")
+        if self.cache:
+            print(f"Result cache: {self.cache.hits} hits, {self.cache.misses} misses")
+        if any(tokens.values()):
+            print(f"Tokens: {tokens['input_tokens']:,} input, {tokens['output_tokens']:,} output, "
+                  f"{tokens['cache_read_input_tokens']:,} cache read, "
+                  f"{tokens['cache_creation_input_tokens']:,} cache written")
 
         if self.manifest.escalate_items:
             print("\nESCALATE ITEMS REQUIRING DECISION:")
@@ -339,6 +535,17 @@ class RefineryOrchestrator:
             f"- Change: {summary['word_change_pct']}%",
         ]
 
+        tokens = summary.get("tokens", {})
+        if any(tokens.values()):
+            lines.extend([
+                "",
+                "## Token Usage",
+                f"- Input: {tokens['input_tokens']:,}",
+                f"- Output: {tokens['output_tokens']:,}",
+                f"- Cache read: {tokens['cache_read_input_tokens']:,}",
+                f"- Cache written: {tokens['cache_creation_input_tokens']:,}",
+            ])
+
         if self.manifest.escalate_items:
             lines.extend([
                 "",
@@ -375,6 +582,30 @@ def main():
         default=None,
         help="Files per batch",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Files to process concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        const="latest",
+        default=None,
+        metavar="RUN_ID",
+        help="Resume an interrupted run (default: latest), skipping finished files",
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit rewrites and reviews as Message Batches (cheaper, slower; claude backend)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Call Claude even when a cached result exists for the same inputs",
+    )
     parser.add_argument(
         "--backend",
         choices=["claude", "rules"],
@@ -384,7 +615,7 @@ def main():
 
     args = parser.parse_args()
 
-    orchestrator = RefineryOrchestrator(backend=args.backend)
+    orchestrator = RefineryOrchestrator(backend=args.backend, use_cache=not args.no_cache)
     orchestrator.initialize()
 
     if args.single:
@@ -394,6 +625,9 @@ def main():
         manifest = orchestrator.run_batch(
             input_dir=args.input,
             batch_size=args.batch_size,
+            workers=args.workers,
+            resume=args.resume,
+            batch_api=args.batch_api,
         )
         print("\n" + orchestrator.generate_summary_report())
 
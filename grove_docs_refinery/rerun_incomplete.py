@@ -4,10 +4,14 @@ Re-run refinery on incomplete documents.
 
 These 13 files were identified as stubs (< 30 lines) in the refined/ folder.
 This script re-processes them from their original input sources.
+
+Documents whose inputs are unchanged since the last run come from the
+result cache instead of calling Claude again (use --no-cache to force).
 """
 
 import os
 import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
 
@@ -71,6 +75,14 @@ def check_quality(content: str) -> tuple[bool, str]:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Re-run refinery on incomplete documents")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Call Claude even for documents whose inputs are unchanged",
+    )
+    args = parser.parse_args()
+
     # Use absolute paths
     base_dir = Path('C:/GitHub/claude-assist/grove_docs_refinery')
     input_dir = base_dir / 'input'
@@ -83,7 +95,7 @@ def main():
     print()
 
     # Initialize refinery
-    refinery = RefineryOrchestrator(backend='claude')
+    refinery = RefineryOrchestrator(backend='claude', use_cache=not args.no_cache)
     refinery.initialize()
 
     results = {
@@ -4,10 +4,14 @@ Re-run refinery on 36 REVISE documents using Opus.
 
 These documents failed the first pass due to context window limits with Sonnet.
 Settings have been updated to use claude-opus-4-20250514 for the writer agent.
+
+Documents whose inputs are unchanged since the last run come from the
+result cache instead of calling Claude again (use --no-cache to force).
 """
 
 import os
 import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
 
@@ -112,6 +116,14 @@ def check_quality(content: str) -> tuple[bool, str]:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Re-run REVISE documents with Opus")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Call Claude even for documents whose inputs are unchanged",
+    )
+    args = parser.parse_args()
+
     input_dir = BASE_DIR / 'input'
     refined_dir = BASE_DIR / 'refined'
 
@@ -138,7 +150,7 @@ def main():
 
     # Initialize refinery
     print("Initializing refinery with Opus settings...")
-    refinery = RefineryOrchestrator(backend='claude')
+    refinery = RefineryOrchestrator(backend='claude', use_cache=not args.no_cache)
     refinery.initialize()
     print("Ready.\n")
 
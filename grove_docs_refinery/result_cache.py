@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Grove Docs Refinery - Result Cache
+
+Content-addressed on-disk cache for parsed Claude results (Draft, Review).
+
+Keys are SHA-256 hashes over everything that determines a result: the
+source text, editorial engine, checkpoint, system prompt and model
+settings. Re-running the refinery on an unchanged input returns the stored
+result instead of calling Claude again; change any input and the key
+changes with it.
+
+Entries are JSON files under `cache/<key[:2]>/<key>.json`. Reads refresh
+an entry's mtime, and eviction drops entries older than `max_age_days`
+and then the least recently used ones until the cache is back under
+`max_size_mb` (to EVICT_TARGET of it, so the next few writes don't evict
+again). Eviction scans the directory once per cache instance, on the first
+write, and after that only when a running size total goes over the limit.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Bump when the cached Draft/Review shape changes
+CACHE_VERSION = 1
+
+# Fraction of max size an over-limit eviction trims down to
+EVICT_TARGET = 0.9
+
+
+def cache_key(kind: str, **inputs: Any) -> str:
+    """Hash a result kind and its inputs into a cache key."""
+    payload = json.dumps(
+        {"version": CACHE_VERSION, "kind": kind, **inputs},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """On-disk, content-addressed cache with size and age eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_mb: float = 200,
+        max_age_days: float = 30,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age = max_age_days * 86400
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # Running total; None until first scan
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached entry for key, or None if missing/expired."""
+        path = self._path(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.max_age:
+                path.unlink(missing_ok=True)
+                raise FileNotFoundError(path)
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Mark as recently used for eviction
+        os.utime(path)
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: Dict):
+        """Store an entry; evict if this is the first write or the cache is over size."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        size = tmp_path.stat().st_size
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        tmp_path.replace(path)
+
+        with self._lock:
+            if self._size is not None:
+                self._size += size - replaced
+            needs_evict = self._size is None or self._size > self.max_bytes
+        if needs_evict:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then oldest-used ones over max size.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            now = time.time()
+            removed = 0
+            total = 0
+            kept = []
+            for mtime, size, path in entries:
+                if now - mtime > self.max_age:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                else:
+                    kept.append((mtime, size, path))
+                    total += size
+
+            # Least recently used first
+            if total > self.max_bytes:
+                target = self.max_bytes * EVICT_TARGET
+                for mtime, size, path in sorted(kept):
+                    if total <= target:
+                        break
+                    path.unlink(missing_ok=True)
+                    total -= size
+                    removed += 1
+
+            self._size = total
+            return removed
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            for path in self.cache_dir.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+            self._size = 0
@@ -11,6 +11,12 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
+from checkpoint import read_context_file
+from lint import (
+    LintEngine, LintHit, group_hits,
+    CURRENT_TERM, LEGACY_TERM, PROHIBITED, THROAT_CLEARING, THROAT_CLEARING_PHRASES,
+)
+
 
 class Assessment(Enum):
     """Review assessment types."""
@@ -29,6 +35,7 @@ class Review:
     suggested_improvements: List[str] = field(default_factory=list)
     terminology_issues_found: List[Dict] = field(default_factory=list)
     positioning_issues: List[Dict] = field(default_factory=list)
+    usage: Dict[str, int] = field(default_factory=dict)  # API token usage, if any
 
 
 class ReviewerAgent:
@@ -60,6 +67,28 @@ class ReviewerAgent:
             "unprecedented capabilities",
         ]
 
+        # Current terms -> legacy terms they replace
+        self._current_terms = {
+            "exploration architecture": ["AI platform", "decentralized AI"],
+            "agents": ["bots", "AI assistants"],
+            "credits": ["tokens"],
+            "Trellis Architecture": [],
+            "Grove": [],
+        }
+
+        self._lint_engine = LintEngine.from_standards(
+            legacy_terms={legacy: current
+                          for current, legacy_list in self._current_terms.items()
+                          for legacy in legacy_list},
+            avoid=self._prohibited,
+            throat_clearing=THROAT_CLEARING_PHRASES,
+            current_terms=self._current_terms,
+        )
+
+    def lint(self, content: str) -> List[LintHit]:
+        """All term hits (current, legacy, prohibited, throat-clearing) in one pass."""
+        return self._lint_engine.scan(content)
+
     def load_context(
         self,
         engine_path: Optional[Path] = None,
@@ -72,10 +101,10 @@ class ReviewerAgent:
             self.checkpoint_path = checkpoint_path
 
         if self.engine_path and self.engine_path.exists():
-            self._engine_content = self.engine_path.read_text()
+            self._engine_content = read_context_file(self.engine_path)
 
         if self.checkpoint_path and self.checkpoint_path.exists():
-            self._checkpoint_content = self.checkpoint_path.read_text()
+            self._checkpoint_content = read_context_file(self.checkpoint_path)
 
     def validate(
         self,
@@ -103,15 +132,18 @@ class ReviewerAgent:
         term_issues = []
         pos_issues = []
 
+        # One scan serves the terminology, prohibited and voice checks
+        hits = self.lint(draft_content)
+
         # Check 1: Terminology
-        term_check = self._check_terminology(draft_content)
+        term_check = self._check_terminology(draft_content, hits)
         if not term_check["valid"]:
             checklist["terminology_current"] = False
             term_issues = term_check["issues"]
             feedback.append(f"Terminology issues found: {len(term_issues)}")
 
         # Check 2: Prohibited language
-        prohibited_check = self._check_prohibited(draft_content)
+        prohibited_check = self._check_prohibited(draft_content, hits)
         if not prohibited_check["valid"]:
             checklist["no_prohibited_language"] = False
             feedback.append(f"Prohibited language: {prohibited_check['issues']}")
@@ -130,7 +162,7 @@ class ReviewerAgent:
             feedback.append(length_check["reason"])
 
         # Check 5: Voice consistency
-        voice_check = self._check_voice(draft_content)
+        voice_check = self._check_voice(draft_content, hits)
         if not voice_check["consistent"]:
             checklist["voice_consistent"] = False
             improvements.extend(voice_check["issues"])
@@ -169,22 +201,14 @@ class ReviewerAgent:
             positioning_issues=pos_issues,
         )
 
-    def _check_terminology(self, content: str) -> Dict:
+    def _check_terminology(self, content: str, hits: Optional[List[LintHit]] = None) -> Dict:
         """Check for terminology issues."""
         issues = []
+        grouped = group_hits(self.lint(content) if hits is None else hits)
 
-        # Current terms to check
-        current_terms = {
-            "exploration architecture": ["AI platform", "decentralized AI"],
-            "agents": ["bots", "AI assistants"],
-            "credits": ["tokens"],
-            "Trellis Architecture": [],
-            "Grove": [],
-        }
-
-        for current, legacy_list in current_terms.items():
+        for current, legacy_list in self._current_terms.items():
             # Check if current term is present (good)
-            if current.lower() not in content.lower():
+            if (CURRENT_TERM, current) not in grouped:
                 issues.append({
                     "type": "missing_term",
                     "expected": current,
@@ -193,11 +217,13 @@ class ReviewerAgent:
 
             # Check for legacy terms
             for legacy in legacy_list:
-                if legacy.lower() in content.lower():
+                if (LEGACY_TERM, legacy) in grouped:
                     issues.append({
                         "type": "legacy_term",
                         "found": legacy,
                         "suggestion": current,
+                        "count": len(grouped[(LEGACY_TERM, legacy)]),
+                        "line": grouped[(LEGACY_TERM, legacy)][0].line,
                     })
 
         return {
@@ -205,15 +231,14 @@ class ReviewerAgent:
             "issues": issues,
         }
 
-    def _check_prohibited(self, content: str) -> Dict:
+    def _check_prohibited(self, content: str, hits: Optional[List[LintHit]] = None) -> Dict:
         """Check for prohibited language."""
-        issues = []
-
-        content_lower = content.lower()
-        for term in self._prohibited:
-            if f" {term} " in content_lower or f" {term}," in content_lower:
-                count = content_lower.count(f" {term} ")
-                issues.append(f"'{term}' ({count}x)")
+        grouped = group_hits(self.lint(content) if hits is None else hits)
+        issues = [
+            f"'{term}' ({len(term_hits)}x)"
+            for (rule, term), term_hits in grouped.items()
+            if rule == PROHIBITED
+        ]
 
         return {
             "valid": len(issues) == 0,
@@ -269,7 +294,7 @@ class ReviewerAgent:
 
         return {"appropriate": True}
 
-    def _check_voice(self, content: str) -> Dict:
+    def _check_voice(self, content: str, hits: Optional[List[LintHit]] = None) -> Dict:
         """Check voice consistency."""
         issues = []
 
@@ -279,13 +304,9 @@ class ReviewerAgent:
             issues.append(f"High passive voice usage ({passive_count} instances)")
 
         # Check for throat-clearing phrases
-        throat_clearing = [
-            "it's important to note",
-            "in order to",
-            "it should be noted",
-        ]
-        for phrase in throat_clearing:
-            if phrase in content.lower():
+        grouped = group_hits(self.lint(content) if hits is None else hits)
+        for rule, phrase in grouped:
+            if rule == THROAT_CLEARING:
                 issues.append(f"Throat-clearing phrase: '{phrase}'")
 
         return {
@@ -7,24 +7,32 @@ Modules:
     api: Paginated Notion API client with child recursion
     converter: Markdown <-> Notion blocks conversion (with table support)
     state: Enhanced sync state management
+    diff: Incremental block-level diff for page updates
     push: Upload workflow (local -> Notion)
     pull: Download workflow (Notion -> local)
+    index: Local full-text index of pages (title lookups, keyword search)
 """
 
 from .api import NotionAPI, get_api
 from .state import SyncState, get_state
+from .index import PageIndex, get_index
 from .push import PushManager
+from .diff import sync_page_blocks
 from .converter import (
     blocks_to_markdown,
+    iter_page_markdown,
     markdown_to_blocks,
     notion_page_to_markdown,
-    parse_frontmatter
+    parse_frontmatter,
+    write_markdown
 )
 
 __all__ = [
     'NotionAPI', 'get_api',
     'SyncState', 'get_state',
-    'PushManager',
+    'PageIndex', 'get_index',
+    'PushManager', 'sync_page_blocks',
     'blocks_to_markdown', 'markdown_to_blocks',
-    'notion_page_to_markdown', 'parse_frontmatter'
+    'notion_page_to_markdown', 'iter_page_markdown', 'write_markdown',
+    'parse_frontmatter'
 ]
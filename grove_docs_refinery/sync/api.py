@@ -4,62 +4,61 @@ Notion API client with pagination and child block recursion.
 Fixes the truncation bug in the original sync scripts by:
 1. Handling pagination (has_more/next_cursor)
 2. Recursively fetching child blocks (toggles, columns, etc.)
+
+Sibling subtrees are fetched concurrently; the shared transport's token
+bucket keeps the whole pool inside Notion's rate budget.
+
+Every page the client sees is fed to an optional local PageIndex, which
+answers title lookups and keyword searches before any /search call.
 """
 
 import os
-import time
-import requests
+import sys
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
 
+# Shared Notion transport lives in notion_pipeline at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from notion_pipeline.transport import get_transport
+
+from .index import PageIndex, get_index, lookup_title
+
 load_dotenv()
 
 
 class NotionAPI:
     """Paginated Notion API client with child recursion."""
 
-    BASE_URL = 'https://api.notion.com/v1'
     MAX_DEPTH = 3  # Max recursion depth for nested blocks
     PAGE_SIZE = 100  # Notion API max
-    RATE_LIMIT_DELAY = 0.35  # Seconds between requests to avoid rate limits
+    MAX_WORKERS = 8  # Concurrent child fetches (rate limit is enforced by the transport)
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, index: Optional[PageIndex] = None):
         self.api_key = api_key or os.getenv('NOTION_API_KEY')
         if not self.api_key:
             raise ValueError("NOTION_API_KEY not found in environment")
 
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Notion-Version': '2022-06-28',
-            'Content-Type': 'application/json'
-        }
-        self._last_request_time = 0
+        # Pooled session + shared token bucket (handles 429 Retry-After)
+        self._transport = get_transport(self.api_key)
 
-    def _rate_limit(self):
-        """Ensure we don't exceed Notion's rate limits."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+        # Local full-text index of pages seen (None = always search live)
+        self.index = index
 
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
         """Make a rate-limited request to the Notion API."""
-        self._rate_limit()
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = requests.request(method, url, headers=self.headers, **kwargs)
-
-        if response.status_code == 429:
-            # Rate limited - wait and retry
-            retry_after = int(response.headers.get('Retry-After', 1))
-            time.sleep(retry_after)
-            return self._request(method, endpoint, **kwargs)
-
+        response = self._transport.request(method, endpoint, **kwargs)
         response.raise_for_status()
         return response.json()
 
     def get_page(self, page_id: str) -> Dict:
         """Get a page's metadata."""
-        return self._request('GET', f'pages/{page_id}')
+        page = self._request('GET', f'pages/{page_id}')
+        if self.index:
+            self.index.add_page(page)
+        return page
 
     def get_database(self, database_id: str) -> Dict:
         """Get a database's metadata."""
@@ -87,13 +86,37 @@ class NotionAPI:
                 break
             cursor = data.get('next_cursor')
 
+        if self.index:
+            self.index.add_pages(all_results)
         return all_results
 
+    def _list_block_children(self, block_id: str) -> List[Dict]:
+        """Fetch one level of child blocks, following pagination."""
+        all_blocks = []
+        cursor = None
+
+        while True:
+            params = {'page_size': self.PAGE_SIZE}
+            if cursor:
+                params['start_cursor'] = cursor
+
+            data = self._request('GET', f'blocks/{block_id}/children', params=params)
+            all_blocks.extend(data.get('results', []))
+
+            if not data.get('has_more'):
+                break
+            cursor = data.get('next_cursor')
+
+        return all_blocks
+
     def get_block_children(self, block_id: str, depth: int = 0) -> List[Dict]:
         """
         Fetch all child blocks with pagination and recursion.
 
-        This is the core fix for the truncated content bug.
+        This is the core fix for the truncated content bug. Nested blocks are
+        fetched on a bounded thread pool as soon as their parent is known, so
+        a page with 40 toggles costs ~MAX_WORKERS parallel round trips per
+        level instead of 40 sequential ones.
 
         Args:
             block_id: The parent block (or page) ID
@@ -102,36 +125,50 @@ class NotionAPI:
         Returns:
             List of blocks with nested '_children' for blocks that have children
         """
-        all_blocks = []
-        cursor = None
+        all_blocks = self._list_block_children(block_id)
 
-        while True:
-            params = {'page_size': self.PAGE_SIZE}
-            if cursor:
-                params['start_cursor'] = cursor
-
-            data = self._request('GET', f'blocks/{block_id}/children', params=params)
-
-            for block in data.get('results', []):
-                # Recursively fetch children if they exist and we haven't hit max depth
-                if block.get('has_children') and depth < self.MAX_DEPTH:
-                    block['_children'] = self.get_block_children(block['id'], depth + 1)
-                all_blocks.append(block)
+        # (block, depth the block was listed at) still needing children
+        todo = [(block, depth) for block in all_blocks
+                if block.get('has_children') and depth < self.MAX_DEPTH]
+        if not todo:
+            return all_blocks
 
-            if not data.get('has_more'):
-                break
-            cursor = data.get('next_cursor')
+        pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        try:
+            pending = {pool.submit(self._list_block_children, block['id']): (block, level)
+                       for block, level in todo}
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    block, level = pending.pop(future)
+                    children = future.result()
+                    block['_children'] = children
+
+                    if level + 1 < self.MAX_DEPTH:
+                        for child in children:
+                            if child.get('has_children'):
+                                pending[pool.submit(self._list_block_children, child['id'])] = \
+                                    (child, level + 1)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
         return all_blocks
 
-    def get_page_content(self, page_id: str) -> Dict:
+    def get_page_content(self, page_id: str, page: Optional[Dict] = None) -> Dict:
         """
         Get a page's full content including metadata and all blocks.
 
+        Args:
+            page_id: Page to fetch
+            page: Page metadata already in hand (e.g. a database query row);
+                skips the extra GET when given
+
         Returns:
             Dict with 'page' (metadata) and 'blocks' (full content with children)
         """
-        page = self.get_page(page_id)
+        if page is None:
+            page = self.get_page(page_id)
         blocks = self.get_block_children(page_id)
 
         return {
@@ -171,15 +208,34 @@ class NotionAPI:
         """Update a page's properties."""
         return self._request('PATCH', f'pages/{page_id}', json={'properties': properties})
 
-    def append_blocks(self, block_id: str, children: List[Dict]) -> Dict:
-        """Append blocks to a page or block, handling the 100-block limit."""
+    def update_block(self, block_id: str, block: Dict) -> Dict:
+        """Update a block's content in place (e.g. {'paragraph': {...}})."""
+        return self._request('PATCH', f'blocks/{block_id}', json=block)
+
+    def append_blocks(self, block_id: str, children: List[Dict],
+                      after: Optional[str] = None) -> Dict:
+        """
+        Append blocks to a page or block, handling the 100-block limit.
+
+        Args:
+            block_id: Parent page or block
+            children: Blocks to append
+            after: Optional sibling block ID to insert after instead of at the end
+        """
         results = []
 
         # Batch in groups of 100
-        for i in range(0, len(children), 100):
-            batch = children[i:i + 100]
-            result = self._request('PATCH', f'blocks/{block_id}/children',
-                                   json={'children': batch})
+        batches = [children[i:i + 100] for i in range(0, len(children), 100)]
+        if after:
+            # Every batch goes right after the same anchor, so insert the
+            # last batch first to keep document order
+            batches.reverse()
+
+        for batch in batches:
+            body = {'children': batch}
+            if after:
+                body['after'] = after
+            result = self._request('PATCH', f'blocks/{block_id}/children', json=body)
             results.extend(result.get('results', []))
 
         return {'results': results}
@@ -202,7 +258,7 @@ class NotionAPI:
             Number of blocks deleted
         """
         try:
-            blocks = self.get_block_children(page_id, depth=0)  # Only top-level
+            blocks = self._list_block_children(page_id)  # Only top-level
         except Exception:
             return 0
 
@@ -214,7 +270,7 @@ class NotionAPI:
 
     def get_child_pages(self, page_id: str) -> List[Dict]:
         """Get all child pages under a parent page."""
-        blocks = self.get_block_children(page_id, depth=0)
+        blocks = self._list_block_children(page_id)
         return [b for b in blocks if b['type'] == 'child_page']
 
     def search(self, query: str, filter_type: Optional[str] = None) -> List[Dict]:
@@ -242,12 +298,32 @@ class NotionAPI:
                 break
             cursor = data.get('next_cursor')
 
+        if self.index:
+            self.index.add_pages(all_results)
         return all_results
 
+    def search_pages(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        Keyword search over pages: the local index first, live /search on a miss.
+
+        Args:
+            query: Search keywords
+            limit: Maximum results from the local index
+        """
+        if self.index:
+            results = self.index.search(query, limit=limit)
+            if results:
+                return results
+        return self.search(query, filter_type='page')
+
     def find_page_by_title(self, title: str, parent_id: Optional[str] = None) -> Optional[Dict]:
         """
         Find a page by exact title match.
 
+        Answered from the local index when it knows the title, once a live
+        get_page confirms the page still exists under that title; otherwise
+        a live /search (whose results are indexed for next time).
+
         Args:
             title: Page title to find
             parent_id: Optional parent page ID to narrow search
@@ -255,6 +331,13 @@ class NotionAPI:
         Returns:
             Page object if found, None otherwise
         """
+        if self.index:
+            page = self.index.find_by_title(title, parent_id)
+            if page:
+                page = self._verify_indexed(page, title, parent_id)
+                if page:
+                    return page
+
         results = self.search(title, filter_type='page')
 
         for page in results:
@@ -279,8 +362,25 @@ class NotionAPI:
 
         return None
 
+    def _verify_indexed(self, page: Dict, title: str,
+                        parent_id: Optional[str]) -> Optional[Dict]:
+        """The live copy of an index hit, or None if it was trashed, renamed or moved."""
+        try:
+            live = self.get_page(page['id'])  # Re-indexes (or drops) the page
+        except Exception:
+            # Deleted or no longer shared with the integration
+            self.index.remove_page(page['id'])
+            return None
+        if live.get('archived') or live.get('in_trash'):
+            return None
+        if lookup_title(live) != title.strip():
+            return None
+        if parent_id and live.get('parent', {}).get('page_id') != parent_id:
+            return None
+        return live
+
 
 # Convenience function
 def get_api() -> NotionAPI:
-    """Get a configured NotionAPI instance."""
-    return NotionAPI()
+    """Get a configured NotionAPI instance backed by the shared page index."""
+    return NotionAPI(index=get_index())
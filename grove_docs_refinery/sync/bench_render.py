@@ -0,0 +1,128 @@
+"""
+Benchmark script for Notion -> markdown rendering.
+
+Renders synthetic pages of deeply nested toggles and column lists to disk
+two ways: building the whole document as a string before write_text, and
+streaming fragments through write_markdown. Prints time and peak Python
+memory (tracemalloc) for each; the streamed peak should stay flat while
+the in-memory one grows with the page.
+
+Usage:
+    python -m grove_docs_refinery.sync.bench_render
+"""
+
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from grove_docs_refinery.sync.converter import (
+    iter_page_markdown,
+    notion_page_to_markdown,
+    write_markdown,
+)
+
+# (top-level sections, nesting depth)
+PAGE_SHAPES = [(50, 4), (200, 6), (500, 8), (1000, 10)]
+
+PAGE = {
+    'id': '00000000-0000-0000-0000-000000000000',
+    'url': 'https://www.notion.so/bench',
+    'created_time': '2026-01-01T00:00:00.000Z',
+    'last_edited_time': '2026-01-01T00:00:00.000Z',
+    'properties': {'title': {'type': 'title', 'title': [{'plain_text': 'Bench'}]}},
+}
+
+
+def _text(content: str, **annotations) -> list:
+    return [{'plain_text': content, 'annotations': annotations}]
+
+
+def _paragraph(n: int) -> dict:
+    return {'type': 'paragraph', 'paragraph': {
+        'rich_text': _text(f'Paragraph {n} with some ') + _text('bold', bold=True) + _text(' text. ' * 8)}}
+
+
+def _code(n: int) -> dict:
+    body = '\n'.join(f'value_{i} = compute({i})  # ' + 'x' * 60 for i in range(20))
+    return {'type': 'code', 'code': {'rich_text': _text(body), 'language': 'python'}}
+
+
+def _nested(depth: int, n: int) -> dict:
+    """A toggle holding a two-column list and the next level down."""
+    children = [_paragraph(n)]
+    if depth:
+        children.append({'type': 'column_list', 'column_list': {}, '_children': [
+            {'type': 'column', 'column': {}, '_children': [_paragraph(n), _code(n)]},
+            {'type': 'column', 'column': {}, '_children': [_nested(depth - 1, n)]},
+        ]})
+    return {'type': 'toggle', 'toggle': {'rich_text': _text(f'Toggle {n}.{depth}')},
+            '_children': children}
+
+
+def make_blocks(sections: int, depth: int) -> list:
+    """Build a synthetic page body of `sections` nested toggle trees."""
+    blocks = []
+    for n in range(sections):
+        blocks.append({'type': 'heading_2', 'heading_2': {'rich_text': _text(f'Section {n}')}})
+        blocks.append(_nested(depth, n))
+    return blocks
+
+
+def render_in_memory(path: Path, blocks: list):
+    path.write_text(notion_page_to_markdown(PAGE, blocks), encoding='utf-8')
+
+
+def render_streaming(path: Path, blocks: list):
+    write_markdown(path, iter_page_markdown(PAGE, blocks))
+
+
+def bench(render, path: Path, blocks: list, repeat: int = 3):
+    """Best-of-`repeat` seconds, then peak traced memory of one more run."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        render(path, blocks)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    render(path, blocks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    print("=" * 78)
+    print("NOTION BLOCKS -> MARKDOWN FILE BENCHMARK")
+    print("=" * 78)
+    print(f"{'sections':>8} {'depth':>6} {'output':>10} "
+          f"{'memory s':>10} {'stream s':>10} {'memory peak':>12} {'stream peak':>12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        memory_path = Path(tmp) / 'memory.md'
+        stream_path = Path(tmp) / 'stream.md'
+        for sections, depth in PAGE_SHAPES:
+            blocks = make_blocks(sections, depth)
+            mem_time, mem_peak = bench(render_in_memory, memory_path, blocks)
+            stream_time, stream_peak = bench(render_streaming, stream_path, blocks)
+
+            size = memory_path.stat().st_size
+            # Frontmatter carries last_synced; compare the bodies
+            same = (memory_path.read_text(encoding='utf-8').split('---\n\n', 1)[1]
+                    == stream_path.read_text(encoding='utf-8').split('---\n\n', 1)[1])
+            print(f"{sections:>8,} {depth:>6} {size / 1e6:>8.1f}MB "
+                  f"{mem_time:>10.3f} {stream_time:>10.3f} "
+                  f"{mem_peak / 1e6:>10.2f}MB {stream_peak / 1e6:>10.2f}MB"
+                  f"{'' if same else '  OUTPUT DIFFERS'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,11 +9,14 @@ Key features:
 - Table support (both directions)
 - Nested block handling (toggles, columns)
 - Rich text formatting preservation
+- Streaming Notion -> markdown rendering (generators + atomic file write)
 """
 
+import os
 import re
 import yaml
-from typing import Dict, List, Tuple, Optional, Any
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Any
 from datetime import datetime
 
 
@@ -97,8 +100,13 @@ def rich_text_to_markdown(rich_text: List[Dict]) -> str:
     return ''.join(parts)
 
 
-def block_to_markdown(block: Dict, indent: int = 0) -> str:
-    """Convert a single Notion block to markdown."""
+def iter_block_markdown(block: Dict, indent: int = 0) -> Iterator[str]:
+    """
+    Render a single Notion block to markdown, yielding fragments.
+
+    Children are rendered as they are visited rather than concatenated up
+    the tree, so a block's output is never held in memory as one string.
+    """
     block_type = block.get('type')
     content = block.get(block_type, {})
     prefix = '    ' * indent
@@ -106,119 +114,113 @@ def block_to_markdown(block: Dict, indent: int = 0) -> str:
     # Handle different block types
     if block_type == 'paragraph':
         text = rich_text_to_markdown(content.get('rich_text', []))
-        result = f'{prefix}{text}\n' if text else f'{prefix}\n'
+        yield f'{prefix}{text}\n' if text else f'{prefix}\n'
 
     elif block_type in ('heading_1', 'heading_2', 'heading_3'):
         level = int(block_type[-1])
         text = rich_text_to_markdown(content.get('rich_text', []))
-        result = f'{prefix}{"#" * level} {text}\n'
+        yield f'{prefix}{"#" * level} {text}\n'
 
     elif block_type == 'bulleted_list_item':
         text = rich_text_to_markdown(content.get('rich_text', []))
-        result = f'{prefix}- {text}\n'
+        yield f'{prefix}- {text}\n'
 
     elif block_type == 'numbered_list_item':
         text = rich_text_to_markdown(content.get('rich_text', []))
-        result = f'{prefix}1. {text}\n'
+        yield f'{prefix}1. {text}\n'
 
     elif block_type == 'to_do':
         text = rich_text_to_markdown(content.get('rich_text', []))
         checked = '- [x]' if content.get('checked') else '- [ ]'
-        result = f'{prefix}{checked} {text}\n'
+        yield f'{prefix}{checked} {text}\n'
 
     elif block_type == 'toggle':
         text = rich_text_to_markdown(content.get('rich_text', []))
-        result = f'{prefix}<details>\n{prefix}<summary>{text}</summary>\n'
-        # Children will be added below
-        if '_children' in block:
-            for child in block['_children']:
-                result += block_to_markdown(child, indent + 1)
-        result += f'{prefix}</details>\n'
-        return result  # Early return - children already handled
+        yield f'{prefix}<details>\n{prefix}<summary>{text}</summary>\n'
+        for child in block.get('_children', ()):
+            yield from iter_block_markdown(child, indent + 1)
+        yield f'{prefix}</details>\n'
+        return  # Children already handled
 
     elif block_type == 'code':
         text = extract_text(content.get('rich_text', []))
         language = content.get('language', '')
-        result = f'{prefix}```{language}\n{text}\n{prefix}```\n'
+        yield f'{prefix}```{language}\n{text}\n{prefix}```\n'
 
     elif block_type == 'quote':
         text = rich_text_to_markdown(content.get('rich_text', []))
         lines = text.split('\n')
-        result = '\n'.join(f'{prefix}> {line}' for line in lines) + '\n'
+        yield '\n'.join(f'{prefix}> {line}' for line in lines) + '\n'
 
     elif block_type == 'callout':
         text = rich_text_to_markdown(content.get('rich_text', []))
         icon = content.get('icon', {})
         emoji = icon.get('emoji', '💡') if icon.get('type') == 'emoji' else '💡'
-        result = f'{prefix}> {emoji} {text}\n'
+        yield f'{prefix}> {emoji} {text}\n'
 
     elif block_type == 'divider':
-        result = f'{prefix}---\n'
+        yield f'{prefix}---\n'
 
     elif block_type == 'table':
-        result = table_to_markdown(block, indent)
+        yield from iter_table_markdown(block, indent)
 
     elif block_type == 'image':
         image = content.get('file', {}) or content.get('external', {})
         url = image.get('url', '')
         caption = extract_text(content.get('caption', []))
-        result = f'{prefix}![{caption}]({url})\n'
+        yield f'{prefix}![{caption}]({url})\n'
 
     elif block_type == 'bookmark':
         url = content.get('url', '')
         caption = extract_text(content.get('caption', [])) or url
-        result = f'{prefix}[{caption}]({url})\n'
+        yield f'{prefix}[{caption}]({url})\n'
 
     elif block_type == 'equation':
         expression = content.get('expression', '')
-        result = f'{prefix}$$\n{expression}\n$$\n'
+        yield f'{prefix}$$\n{expression}\n$$\n'
 
     elif block_type == 'child_page':
         title = content.get('title', 'Untitled')
-        result = f'{prefix}<!-- Child page: {title} -->\n'
+        yield f'{prefix}<!-- Child page: {title} -->\n'
 
     elif block_type == 'child_database':
         title = content.get('title', 'Untitled')
-        result = f'{prefix}<!-- Child database: {title} -->\n'
+        yield f'{prefix}<!-- Child database: {title} -->\n'
 
     elif block_type == 'column_list':
         # Handle columns - convert to sequential content
-        result = ''
-        if '_children' in block:
-            for column in block['_children']:
-                if column.get('type') == 'column' and '_children' in column:
-                    for child in column['_children']:
-                        result += block_to_markdown(child, indent)
-        return result
+        for column in block.get('_children', ()):
+            if column.get('type') == 'column' and '_children' in column:
+                for child in column['_children']:
+                    yield from iter_block_markdown(child, indent)
+        return
 
     elif block_type == 'synced_block':
         # Synced blocks contain their content in children
-        result = ''
-        if '_children' in block:
-            for child in block['_children']:
-                result += block_to_markdown(child, indent)
-        return result
+        for child in block.get('_children', ()):
+            yield from iter_block_markdown(child, indent)
+        return
 
     else:
         # Unknown block type - add comment
-        result = f'{prefix}<!-- Unsupported block type: {block_type} -->\n'
+        yield f'{prefix}<!-- Unsupported block type: {block_type} -->\n'
 
     # Handle children (for blocks that support nesting, except those handled above)
-    if '_children' in block and block_type not in ('toggle', 'table', 'column_list', 'synced_block'):
+    if '_children' in block and block_type != 'table':
         for child in block['_children']:
-            result += block_to_markdown(child, indent + 1)
+            yield from iter_block_markdown(child, indent + 1)
 
-    return result
 
+def block_to_markdown(block: Dict, indent: int = 0) -> str:
+    """Convert a single Notion block to markdown."""
+    return ''.join(iter_block_markdown(block, indent))
 
-def table_to_markdown(table_block: Dict, indent: int = 0) -> str:
-    """Convert a Notion table block to markdown table."""
+
+def iter_table_markdown(table_block: Dict, indent: int = 0) -> Iterator[str]:
+    """Render a Notion table block as markdown table lines."""
     prefix = '    ' * indent
     children = table_block.get('_children', [])
 
-    if not children:
-        return f'{prefix}<!-- Empty table -->\n'
-
     rows = []
     max_cols = 0
 
@@ -230,42 +232,43 @@ def table_to_markdown(table_block: Dict, indent: int = 0) -> str:
             max_cols = max(max_cols, len(row_text))
 
     if not rows:
-        return f'{prefix}<!-- Empty table -->\n'
+        yield f'{prefix}<!-- Empty table -->\n'
+        return
 
     # Normalize row lengths
     for row in rows:
         while len(row) < max_cols:
             row.append('')
 
-    # Build markdown table
-    lines = []
-    lines.append(prefix + '| ' + ' | '.join(rows[0]) + ' |')
-    lines.append(prefix + '|' + '---|' * max_cols)
-
+    yield prefix + '| ' + ' | '.join(rows[0]) + ' |\n'
+    yield prefix + '|' + '---|' * max_cols + '\n'
     for row in rows[1:]:
-        lines.append(prefix + '| ' + ' | '.join(row) + ' |')
+        yield prefix + '| ' + ' | '.join(row) + ' |\n'
 
-    return '\n'.join(lines) + '\n'
+
+def table_to_markdown(table_block: Dict, indent: int = 0) -> str:
+    """Convert a Notion table block to markdown table."""
+    return ''.join(iter_table_markdown(table_block, indent))
+
+
+def iter_blocks_markdown(blocks: Iterable[Dict]) -> Iterator[str]:
+    """Render a list of Notion blocks to markdown, yielding fragments."""
+    for block in blocks:
+        yield from iter_block_markdown(block)
 
 
 def blocks_to_markdown(blocks: List[Dict]) -> str:
     """Convert a list of Notion blocks to markdown."""
-    lines = []
-    for block in blocks:
-        lines.append(block_to_markdown(block))
-    return ''.join(lines)
+    return ''.join(iter_blocks_markdown(blocks))
 
 
-def notion_page_to_markdown(page: Dict, blocks: List[Dict]) -> str:
+def iter_page_markdown(page: Dict, blocks: List[Dict]) -> Iterator[str]:
     """
-    Convert a Notion page to markdown with YAML frontmatter.
+    Render a Notion page with YAML frontmatter, yielding fragments.
 
     Args:
         page: Notion page metadata
         blocks: Page blocks (from get_block_children)
-
-    Returns:
-        Complete markdown string with frontmatter
     """
     props = page.get('properties', {})
 
@@ -286,12 +289,46 @@ def notion_page_to_markdown(page: Dict, blocks: List[Dict]) -> str:
         'last_edited_time': page.get('last_edited_time', '')
     }
 
-    # Convert blocks to markdown
-    content = blocks_to_markdown(blocks)
-
-    # Assemble document
     yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
-    return f'---\n{yaml_str}---\n\n{content}'
+    yield f'---\n{yaml_str}---\n\n'
+    yield from iter_blocks_markdown(blocks)
+
+
+def notion_page_to_markdown(page: Dict, blocks: List[Dict]) -> str:
+    """
+    Convert a Notion page to markdown with YAML frontmatter.
+
+    Args:
+        page: Notion page metadata
+        blocks: Page blocks (from get_block_children)
+
+    Returns:
+        Complete markdown string with frontmatter
+    """
+    return ''.join(iter_page_markdown(page, blocks))
+
+
+def write_markdown(path: Path, fragments: Iterable[str]) -> int:
+    """
+    Stream markdown fragments into a file, atomically.
+
+    Fragments are written to a temp file beside the target, which then
+    replaces it; readers never see a partial document. Returns the number
+    of characters written.
+    """
+    path = Path(path)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    chars = 0
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for fragment in fragments:
+                f.write(fragment)
+                chars += len(fragment)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return chars
 
 
 # ============================================================================
@@ -373,6 +410,20 @@ def text_to_rich_text(text: str) -> List[Dict]:
     return result
 
 
+# Combined pattern to match all inline formatting
+# Order matters: bold before italic, code is greedy
+_INLINE_PATTERN = re.compile(
+    r'(`[^`]+`)'                           # code
+    r'|(\*\*[^*]+\*\*)'                    # bold with **
+    r'|(__[^_]+__)'                        # bold with __
+    r'|(~~[^~]+~~)'                        # strikethrough
+    r'|(\*[^*]+\*)'                        # italic with *
+    r'|(_[^_]+_)'                          # italic with _
+    r'|(\[[^\]]+\]\([^)]+\))'              # links
+)
+_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+
 def _parse_inline_formatting(text: str) -> List[Dict]:
     """
     Parse markdown inline formatting into segments.
@@ -381,20 +432,8 @@ def _parse_inline_formatting(text: str) -> List[Dict]:
     """
     segments = []
 
-    # Combined pattern to match all inline formatting
-    # Order matters: bold before italic, code is greedy
-    pattern = re.compile(
-        r'(`[^`]+`)'                           # code
-        r'|(\*\*[^*]+\*\*)'                    # bold with **
-        r'|(__[^_]+__)'                        # bold with __
-        r'|(~~[^~]+~~)'                        # strikethrough
-        r'|(\*[^*]+\*)'                        # italic with *
-        r'|(_[^_]+_)'                          # italic with _
-        r'|(\[[^\]]+\]\([^)]+\))'              # links
-    )
-
     last_end = 0
-    for match in pattern.finditer(text):
+    for match in _INLINE_PATTERN.finditer(text):
         # Add plain text before this match
         if match.start() > last_end:
             plain = text[last_end:match.start()]
@@ -451,7 +490,7 @@ def _parse_inline_formatting(text: str) -> List[Dict]:
             })
         elif matched.startswith('['):
             # Link
-            link_match = re.match(r'\[([^\]]+)\]\(([^)]+)\)', matched)
+            link_match = _LINK_PATTERN.match(matched)
             if link_match:
                 segments.append({
                     'text': link_match.group(1),
@@ -473,15 +512,37 @@ def _parse_inline_formatting(text: str) -> List[Dict]:
     return segments
 
 
+# Precompiled patterns for the Markdown -> Notion parser
+_NUMBERED_ITEM = re.compile(r'^\d+\.\s')
+_TABLE_SEPARATOR = re.compile(r'^\|[-:\s|]+\|$')
+
+# Notion API has a 2000 character limit per rich_text content
+CODE_BLOCK_MAX_CHARS = 1900  # Leave some margin for safety
+
+
 def markdown_line_to_block(line: str, next_lines: List[str] = None) -> Tuple[Optional[Dict], int]:
     """
     Convert a markdown line to a Notion block.
 
+    Kept for callers that convert a single line; markdown_to_blocks uses the
+    cursor-based _block_at directly so it never copies the remaining lines.
+
     Returns:
         Tuple of (block_dict or None, lines_consumed)
     """
-    stripped = line.strip()
-    lines_consumed = 1
+    return _block_at([line] + list(next_lines or []), 0)
+
+
+def _block_at(lines: List[str], i: int) -> Tuple[Optional[Dict], int]:
+    """
+    Convert the markdown line at lines[i] to a Notion block.
+
+    Multi-line constructs (code fences, tables) look ahead by index.
+
+    Returns:
+        Tuple of (block_dict or None, lines_consumed)
+    """
+    stripped = lines[i].strip()
 
     if not stripped:
         return {'type': 'paragraph', 'paragraph': {'rich_text': []}}, 1
@@ -529,8 +590,8 @@ def markdown_line_to_block(line: str, next_lines: List[str] = None) -> Tuple[Opt
         }, 1
 
     # Numbered list
-    if re.match(r'^\d+\.\s', stripped):
-        text = re.sub(r'^\d+\.\s', '', stripped)
+    if _NUMBERED_ITEM.match(stripped):
+        text = _NUMBERED_ITEM.sub('', stripped)
         return {
             'type': 'numbered_list_item',
             'numbered_list_item': {'rich_text': text_to_rich_text(text)}
@@ -545,69 +606,11 @@ def markdown_line_to_block(line: str, next_lines: List[str] = None) -> Tuple[Opt
 
     # Code block (need to look ahead)
     if stripped.startswith('```'):
-        raw_language = stripped[3:].strip()
-        language = normalize_language(raw_language)
-        code_lines = []
-        lines_consumed = 1
-
-        if next_lines:
-            for next_line in next_lines:
-                lines_consumed += 1
-                if next_line.strip().startswith('```'):
-                    break
-                code_lines.append(next_line.rstrip())
-
-        code_content = '\n'.join(code_lines)
-
-        # Notion API has a 2000 character limit per rich_text content
-        # Split long code blocks into multiple blocks
-        MAX_CHARS = 1900  # Leave some margin for safety
-        if len(code_content) <= MAX_CHARS:
-            return {
-                'type': 'code',
-                'code': {
-                    'rich_text': text_to_rich_text(code_content),
-                    'language': language
-                }
-            }, lines_consumed
-        else:
-            # Return a list of code blocks by splitting at line boundaries
-            blocks = []
-            current_chunk = []
-            current_len = 0
-
-            for line in code_lines:
-                line_len = len(line) + 1  # +1 for newline
-                if current_len + line_len > MAX_CHARS and current_chunk:
-                    # Flush current chunk
-                    blocks.append({
-                        'type': 'code',
-                        'code': {
-                            'rich_text': text_to_rich_text('\n'.join(current_chunk)),
-                            'language': language
-                        }
-                    })
-                    current_chunk = []
-                    current_len = 0
-                current_chunk.append(line)
-                current_len += line_len
-
-            # Add remaining chunk
-            if current_chunk:
-                blocks.append({
-                    'type': 'code',
-                    'code': {
-                        'rich_text': text_to_rich_text('\n'.join(current_chunk)),
-                        'language': language
-                    }
-                })
-
-            # Return special marker for multiple blocks
-            return {'_multi_blocks': blocks}, lines_consumed
+        return _code_block_at(lines, i)
 
     # Table (need to look ahead)
     if stripped.startswith('|') and stripped.endswith('|'):
-        return parse_markdown_table(line, next_lines)
+        return _table_at(lines, i)
 
     # Default: paragraph
     return {
@@ -616,24 +619,83 @@ def markdown_line_to_block(line: str, next_lines: List[str] = None) -> Tuple[Opt
     }, 1
 
 
+def _code_block_at(lines: List[str], i: int) -> Tuple[Dict, int]:
+    """Parse a fenced code block starting at lines[i]."""
+    raw_language = lines[i].strip()[3:].strip()
+    language = normalize_language(raw_language)
+    code_lines = []
+    lines_consumed = 1
+
+    for j in range(i + 1, len(lines)):
+        lines_consumed += 1
+        if lines[j].strip().startswith('```'):
+            break
+        code_lines.append(lines[j].rstrip())
+
+    code_content = '\n'.join(code_lines)
+
+    # Split long code blocks into multiple blocks
+    if len(code_content) <= CODE_BLOCK_MAX_CHARS:
+        return {
+            'type': 'code',
+            'code': {
+                'rich_text': text_to_rich_text(code_content),
+                'language': language
+            }
+        }, lines_consumed
+
+    # Return a list of code blocks by splitting at line boundaries
+    blocks = []
+    current_chunk = []
+    current_len = 0
+
+    for line in code_lines:
+        line_len = len(line) + 1  # +1 for newline
+        if current_len + line_len > CODE_BLOCK_MAX_CHARS and current_chunk:
+            # Flush current chunk
+            blocks.append({
+                'type': 'code',
+                'code': {
+                    'rich_text': text_to_rich_text('\n'.join(current_chunk)),
+                    'language': language
+                }
+            })
+            current_chunk = []
+            current_len = 0
+        current_chunk.append(line)
+        current_len += line_len
+
+    # Add remaining chunk
+    if current_chunk:
+        blocks.append({
+            'type': 'code',
+            'code': {
+                'rich_text': text_to_rich_text('\n'.join(current_chunk)),
+                'language': language
+            }
+        })
+
+    # Return special marker for multiple blocks
+    return {'_multi_blocks': blocks}, lines_consumed
+
+
 def parse_markdown_table(first_line: str, next_lines: List[str]) -> Tuple[Dict, int]:
     """Parse a markdown table into Notion table block."""
-    lines = [first_line]
-    lines_consumed = 1
+    return _table_at([first_line] + list(next_lines or []), 0)
 
-    if next_lines:
-        for next_line in next_lines:
-            if next_line.strip().startswith('|'):
-                lines.append(next_line)
-                lines_consumed += 1
-            else:
-                break
+
+def _table_at(lines: List[str], i: int) -> Tuple[Dict, int]:
+    """Parse a markdown table starting at lines[i] into a Notion table block."""
+    end = i + 1
+    while end < len(lines) and lines[end].strip().startswith('|'):
+        end += 1
+    lines_consumed = end - i
 
     # Parse table rows
     rows = []
-    for i, line in enumerate(lines):
+    for line in lines[i:end]:
         # Skip separator line (|---|---|)
-        if re.match(r'^\|[-:\s|]+\|$', line.strip()):
+        if _TABLE_SEPARATOR.match(line.strip()):
             continue
 
         cells = [c.strip() for c in line.strip().strip('|').split('|')]
@@ -670,16 +732,20 @@ def parse_markdown_table(first_line: str, next_lines: List[str]) -> Tuple[Dict,
 
 
 def markdown_to_blocks(markdown: str) -> List[Dict]:
-    """Convert markdown content (without frontmatter) to Notion blocks."""
+    """
+    Convert markdown content (without frontmatter) to Notion blocks.
+
+    Single pass over the lines with an index cursor: multi-line constructs
+    look ahead by index instead of slicing, so conversion is linear in
+    document length.
+    """
     lines = markdown.split('\n')
     blocks = []
     i = 0
+    n = len(lines)
 
-    while i < len(lines):
-        line = lines[i]
-        next_lines = lines[i + 1:] if i + 1 < len(lines) else []
-
-        block, consumed = markdown_line_to_block(line, next_lines)
+    while i < n:
+        block, consumed = _block_at(lines, i)
         if block:
             # Handle multi-block returns (e.g., long code blocks split into multiple)
             if '_multi_blocks' in block:
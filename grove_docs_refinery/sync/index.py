@@ -0,0 +1,317 @@
+"""
+Local full-text index of Notion pages.
+
+A SQLite FTS5 index of page titles, properties and converted markdown,
+fed by every page the sync client sees (search results, database queries,
+pulls and pushes). Rows are keyed by page ID and only replaced when the
+incoming last_edited_time is at least as new as the stored one, so the
+index stays fresh without a crawl of its own.
+
+Title lookups and keyword searches become local queries; NotionAPI falls
+back to a live /search only when the index has no answer.
+
+Usage:
+    python -m grove_docs_refinery.sync.index "grove ratchet"   # search
+    python -m grove_docs_refinery.sync.index --title "Vision"  # exact title
+    python -m grove_docs_refinery.sync.index --refresh         # index all pages
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+def lookup_title(page: Dict) -> Optional[str]:
+    """Title as matched by find_page_by_title (title/Name/name property)."""
+    props = page.get('properties', {})
+    title_prop = props.get('title') or props.get('Name') or props.get('name')
+    if title_prop and title_prop.get('type') == 'title':
+        return ''.join(t.get('plain_text', '') for t in title_prop.get('title', [])).strip()
+    return None
+
+
+def page_title(page: Dict) -> str:
+    """Text of the page's title property, whatever it is named."""
+    for prop in page.get('properties', {}).values():
+        if prop.get('type') == 'title':
+            return ''.join(t.get('plain_text', '') for t in prop.get('title', []))
+    return ''
+
+
+def properties_text(page: Dict) -> str:
+    """Non-title property values as 'Name: value' lines for full-text search."""
+    lines = []
+    for name, prop in page.get('properties', {}).items():
+        prop_type = prop.get('type')
+        value = prop.get(prop_type)
+        if prop_type == 'title' or value is None:
+            continue
+        if prop_type == 'rich_text':
+            text = ''.join(t.get('plain_text', '') for t in value)
+        elif prop_type in ('select', 'status'):
+            text = value.get('name', '')
+        elif prop_type == 'multi_select':
+            text = ', '.join(option.get('name', '') for option in value)
+        elif prop_type == 'date':
+            text = value.get('start') or ''
+        elif prop_type in ('url', 'email', 'phone_number', 'number', 'checkbox'):
+            text = str(value)
+        else:
+            continue
+        if text:
+            lines.append(f'{name}: {text}')
+    return '\n'.join(lines)
+
+
+class PageIndex:
+    """
+    SQLite FTS5 index of Notion pages.
+
+        pages       page metadata (raw JSON), last_edited_time, lookup title
+        pages_fts   title / properties / content, ranked with bm25
+
+    Content is optional per page: metadata-only sightings (search results,
+    query rows) keep the markdown from the last pull or push until a newer
+    copy is supplied.
+    """
+
+    DEFAULT_INDEX_FILE = '.notion_page_index.db'
+    BUSY_TIMEOUT_MS = 30000
+
+    # bm25 column weights: title, properties, content
+    RANK_WEIGHTS = (10.0, 2.0, 1.0)
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS pages (
+            page_id TEXT PRIMARY KEY,
+            lookup_title TEXT,
+            parent_page_id TEXT,
+            last_edited TEXT,
+            content_edited TEXT,
+            page_json TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_pages_lookup_title ON pages(lookup_title);
+        CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+            page_id UNINDEXED, title, properties, content,
+            tokenize = 'unicode61 remove_diacritics 2'
+        );
+    """
+
+    def __init__(self, index_file: Optional[str] = None):
+        self.index_file = Path(index_file or self.DEFAULT_INDEX_FILE)
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.index_file.parent and not self.index_file.parent.exists():
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.index_file), isolation_level=None,
+                               timeout=self.BUSY_TIMEOUT_MS / 1000,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ========================================================================
+    # Feeding
+    # ========================================================================
+
+    @staticmethod
+    def _normalize_id(page_id: str) -> str:
+        return page_id.replace('-', '').lower()
+
+    def _upsert(self, conn: sqlite3.Connection, page: Dict, content: Optional[str]) -> bool:
+        page_id = self._normalize_id(page['id'])
+        last_edited = page.get('last_edited_time') or ''
+
+        if page.get('archived') or page.get('in_trash'):
+            conn.execute('DELETE FROM pages WHERE page_id = ?', (page_id,))
+            conn.execute('DELETE FROM pages_fts WHERE page_id = ?', (page_id,))
+            return True
+
+        row = conn.execute('SELECT last_edited, content_edited FROM pages WHERE page_id = ?',
+                           (page_id,)).fetchone()
+        if row and last_edited < (row['last_edited'] or ''):
+            return False  # Older copy than the one we have
+        if row and content is None and last_edited == row['last_edited']:
+            return False  # Same version, nothing new to store
+
+        content_edited = last_edited if content is not None else (row['content_edited'] if row else None)
+        if content is None and row:
+            old = conn.execute('SELECT content FROM pages_fts WHERE page_id = ?',
+                               (page_id,)).fetchone()
+            content = old['content'] if old else ''
+
+        conn.execute(
+            'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)',
+            (page_id, lookup_title(page), page.get('parent', {}).get('page_id'),
+             last_edited, content_edited, json.dumps(page))
+        )
+        conn.execute('DELETE FROM pages_fts WHERE page_id = ?', (page_id,))
+        conn.execute('INSERT INTO pages_fts VALUES (?, ?, ?, ?)',
+                     (page_id, page_title(page), properties_text(page), content or ''))
+        return True
+
+    def add_page(self, page: Dict, content: Optional[str] = None) -> bool:
+        """
+        Index a page's metadata and, if given, its markdown content.
+
+        Returns True if the index changed.
+        """
+        if page.get('object', 'page') != 'page':
+            return False
+        with self._transaction() as conn:
+            return self._upsert(conn, page, content)
+
+    def add_pages(self, pages: Iterable[Dict]) -> int:
+        """Index many pages' metadata in one transaction; returns rows changed."""
+        changed = 0
+        with self._transaction() as conn:
+            for page in pages:
+                if page.get('object', 'page') == 'page':
+                    changed += self._upsert(conn, page, None)
+        return changed
+
+    def remove_page(self, page_id: str):
+        page_id = self._normalize_id(page_id)
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM pages WHERE page_id = ?', (page_id,))
+            conn.execute('DELETE FROM pages_fts WHERE page_id = ?', (page_id,))
+
+    # ========================================================================
+    # Lookups
+    # ========================================================================
+
+    def get_page(self, page_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute('SELECT page_json FROM pages WHERE page_id = ?',
+                                     (self._normalize_id(page_id),)).fetchone()
+        return json.loads(row['page_json']) if row else None
+
+    def is_fresh(self, page_id: str, last_edited: str) -> bool:
+        """True if the indexed content is from this last_edited_time or later."""
+        with self._lock:
+            row = self._conn.execute('SELECT content_edited FROM pages WHERE page_id = ?',
+                                     (self._normalize_id(page_id),)).fetchone()
+        return bool(row and row['content_edited'] and row['content_edited'] >= last_edited)
+
+    def find_by_title(self, title: str, parent_id: Optional[str] = None) -> Optional[Dict]:
+        """Most recently edited page with this exact title (and parent, if given)."""
+        sql = 'SELECT page_json FROM pages WHERE lookup_title = ?'
+        args = [title.strip()]
+        if parent_id:
+            sql += ' AND parent_page_id = ?'
+            args.append(parent_id)
+        sql += ' ORDER BY last_edited DESC LIMIT 1'
+        with self._lock:
+            row = self._conn.execute(sql, args).fetchone()
+        return json.loads(row['page_json']) if row else None
+
+    @staticmethod
+    def _match_query(query: str) -> str:
+        """Plain keywords -> an FTS5 query ANDing each quoted term."""
+        terms = re.findall(r'\w+', query, re.UNICODE)
+        return ' '.join(f'"{term}"' for term in terms)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        Keyword search over titles, properties and content.
+
+        Returns page objects, best match first, each with a '_snippet' key
+        holding the matching content excerpt.
+        """
+        match = self._match_query(query)
+        if not match:
+            return []
+        weights = ', '.join(str(w) for w in self.RANK_WEIGHTS)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT p.page_json,
+                       snippet(pages_fts, 3, '**', '**', '...', 12) AS snippet
+                FROM pages_fts
+                JOIN pages p ON p.page_id = pages_fts.page_id
+                WHERE pages_fts MATCH ?
+                ORDER BY bm25(pages_fts, 0.0, {weights})
+                LIMIT ?
+                """, (match, limit)).fetchall()
+        results = []
+        for row in rows:
+            page = json.loads(row['page_json'])
+            page['_snippet'] = row['snippet']
+            results.append(page)
+        return results
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
+
+
+_index: Optional[PageIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index(index_file: Optional[str] = None) -> PageIndex:
+    """Shared PageIndex for the default index file (or a new one for a given path)."""
+    global _index
+    if index_file:
+        return PageIndex(index_file)
+    with _index_lock:
+        if _index is None:
+            _index = PageIndex()
+        return _index
+
+
+def main():
+    """CLI interface."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Search the local Notion page index')
+    parser.add_argument('query', nargs='?', help='Keywords to search for')
+    parser.add_argument('--title', type=str, help='Exact page title to look up')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Index metadata for every page the integration can see')
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    index = get_index()
+
+    if args.refresh:
+        from .api import get_api
+        pages = get_api().search('', filter_type='page')
+        print(f"Indexed {len(pages)} pages ({index.count()} total)")
+
+    if args.title:
+        page = index.find_by_title(args.title)
+        print(page['url'] if page else 'Not found')
+
+    if args.query:
+        for page in index.search(args.query, limit=args.limit):
+            print(f"{page_title(page)[:60]:60} {page.get('url', '')}")
+            if page['_snippet']:
+                print(f"    {page['_snippet']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -18,10 +18,11 @@ import subprocess
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .api import NotionAPI, get_api
-from .converter import block_to_markdown, blocks_to_markdown
+from .converter import iter_block_markdown, write_markdown
 from .state import SyncState, get_state
 
 
@@ -172,8 +173,8 @@ class PullManager:
         # Combine
         return f"{date_prefix}-{type_code}-{domain}-{title_slug}.md--FINAL.md"
 
-    def _blocks_to_markdown(self, blocks: List[Dict]) -> str:
-        """Convert Notion blocks to markdown with semantic spacing.
+    def _iter_markdown(self, blocks: List[Dict]) -> Iterator[str]:
+        """Render Notion blocks to markdown fragments with semantic spacing.
 
         Rules:
         - Blank line before headings (always)
@@ -181,7 +182,6 @@ class PullManager:
         - No blank lines between consecutive paragraphs
         - Blank line before/after code blocks, tables, quotes
         """
-        result = []
         prev_type = None
 
         # Block types that need blank line before them
@@ -191,29 +191,50 @@ class PullManager:
         NEEDS_BLANK_AFTER = {'heading_1', 'heading_2', 'heading_3',
                              'code', 'table', 'quote', 'callout'}
 
-        for i, block in enumerate(blocks):
+        for block in blocks:
             block_type = block.get('type', 'paragraph')
-            md = block_to_markdown(block)
-
-            if not md or not md.strip():
+            parts = self._without_trailing_newlines(iter_block_markdown(block))
+
+            # Skip blocks that render to whitespace only
+            head = []
+            for part in parts:
+                head.append(part)
+                if part.strip():
+                    break
+            else:
                 continue
 
             # Add blank line before if needed
-            if result:  # Not first block
+            if prev_type is not None:  # Not first block
                 needs_blank = (
                     block_type in NEEDS_BLANK_BEFORE or
                     prev_type in NEEDS_BLANK_AFTER
                 )
                 if needs_blank:
-                    result.append('\n')
+                    yield '\n'
 
-            # Add the content (strip trailing newline, we'll manage spacing)
-            result.append(md.rstrip('\n'))
-            result.append('\n')
+            # The content, minus trailing newlines - spacing is managed here
+            yield from head
+            yield from parts
+            yield '\n'
 
             prev_type = block_type
 
-        return ''.join(result)
+    @staticmethod
+    def _without_trailing_newlines(fragments: Iterator[str]) -> Iterator[str]:
+        """Pass fragments through, holding back newlines that end the stream."""
+        held = ''
+        for fragment in fragments:
+            body = fragment.rstrip('\n')
+            if body:
+                yield held + body
+                held = fragment[len(body):]
+            else:
+                held += fragment
+
+    def _blocks_to_markdown(self, blocks: List[Dict]) -> str:
+        """Convert Notion blocks to markdown with semantic spacing."""
+        return ''.join(self._iter_markdown(blocks))
 
     def _create_frontmatter(self, page: Dict, properties: Dict,
                             local_filename: str) -> str:
@@ -269,14 +290,19 @@ class PullManager:
         return result
 
     def pull_page(self, page_id: str, force: bool = False,
-                  dry_run: bool = False) -> Dict:
+                  dry_run: bool = False, page: Optional[Dict] = None) -> Dict:
         """
         Pull a single page from Notion to local.
 
+        Sync status is decided from page metadata alone; the block tree is
+        only downloaded when the page is actually going to be written.
+
         Args:
             page_id: Notion page ID (with or without dashes)
             force: If True, overwrite existing file even on conflict
             dry_run: If True, preview changes without writing
+            page: Page metadata from a database query, if the caller already
+                has it (saves the metadata request)
 
         Returns:
             Dict with 'action', 'file', 'title', etc.
@@ -290,12 +316,9 @@ class PullManager:
         if not dry_run:
             self._check_git_status()
 
-        # Get page metadata and blocks
-        content = self.api.get_page_content(page_id)
-        page = content['page']
-        blocks = content['blocks']
-
-        print(f"  Found {content['block_count']} blocks")
+        # Page metadata first - blocks are fetched only if we pull
+        if page is None:
+            page = self.api.get_page(page_id)
 
         # Extract properties
         properties = self._extract_properties(page)
@@ -343,24 +366,26 @@ class PullManager:
                 'reason': sync_reason
             }
 
-        # Convert blocks to markdown
-        markdown_content = self._blocks_to_markdown(blocks)
+        # Get blocks
+        content = self.api.get_page_content(page_id, page=page)
+        blocks = content['blocks']
+
+        print(f"  Found {content['block_count']} blocks")
 
         # Create frontmatter
         frontmatter = self._create_frontmatter(page, properties, filename)
-
-        # Combine into final document
-        full_content = f"---\n{frontmatter}---\n\n{markdown_content}"
+        header = f"---\n{frontmatter}---\n\n"
 
         # Dry run - just report what would happen
         if dry_run:
             action = 'would_update' if file_path.exists() else 'would_create'
-            print(f"  [DRY] DRY RUN: {action} ({len(full_content):,} chars)")
+            chars = len(header) + sum(map(len, self._iter_markdown(blocks)))
+            print(f"  [DRY] DRY RUN: {action} ({chars:,} chars)")
             return {
                 'action': action,
                 'file': filename,
                 'title': title,
-                'chars': len(full_content),
+                'chars': chars,
                 'blocks': content['block_count'],
                 'dry_run': True
             }
@@ -368,11 +393,17 @@ class PullManager:
         # Create backup before overwriting (safety!)
         backup_path = self._create_backup(file_path)
 
-        # Write file
-        file_path.write_text(full_content, encoding='utf-8')
+        # Stream the document straight into the file (atomic replace)
+        chars = write_markdown(file_path, chain((header,), self._iter_markdown(blocks)))
+
+        if self.api.index:
+            # Index the body as written, without the frontmatter
+            with open(file_path, encoding='utf-8') as f:
+                f.read(len(header))
+                self.api.index.add_page(page, f.read())
 
         action = 'updated' if backup_path else 'created'
-        print(f"  [OK] {action.capitalize()}: {len(full_content):,} chars")
+        print(f"  [OK] {action.capitalize()}: {chars:,} chars")
 
         # Update sync state
         from .state import DocumentState
@@ -386,13 +417,12 @@ class PullManager:
             sync_status='synced'
         )
         self.state.set_document(doc_state)
-        self.state.save()
 
         return {
             'action': action,
             'file': filename,
             'title': title,
-            'chars': len(full_content),
+            'chars': chars,
             'blocks': content['block_count'],
             'backup': str(backup_path) if backup_path else None
         }
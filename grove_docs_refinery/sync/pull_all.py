@@ -13,6 +13,11 @@ def pull_all_documents(force: bool = False):
     """
     Pull all documents from Grove Corpus database.
 
+    Metadata-first: one paginated database query returns every row's
+    last_edited_time, which is diffed against SyncState. Block trees are
+    only downloaded for pages that changed, so an unchanged corpus costs a
+    handful of query requests.
+
     Args:
         force: If True, overwrite existing files
     """
@@ -21,7 +26,7 @@ def pull_all_documents(force: bool = False):
 
     print("Fetching all documents from Grove Corpus...")
     pages = api.query_database(GROVE_CORPUS_DB_ID)
-    print(f"Found {len(pages)} documents\n")
+    print(f"Found {len(pages)} documents")
 
     results = {
         'created': [],
@@ -30,33 +35,53 @@ def pull_all_documents(force: bool = False):
         'errors': []
     }
 
-    for i, page in enumerate(pages, 1):
+    # Diff query metadata against sync state before fetching any content
+    to_pull = []
+    for page in pages:
         page_id = page['id'].replace('-', '')
-
-        # Get title for display
-        props = page.get('properties', {})
-        title_prop = props.get('Title', {})
-        title = ''
-        if title_prop.get('type') == 'title':
-            title = ''.join(t.get('plain_text', '') for t in title_prop.get('title', []))
-
-        print(f"[{i}/{len(pages)}] {title[:50]}...")
-
-        try:
-            result = manager.pull_page(page_id, force=force)
-            action = result.get('action', 'unknown')
-
-            if action in results:
-                results[action].append(result)
-            else:
-                results['created'].append(result)
-
-            print(f"  -> {action}: {result.get('file', 'unknown')}\n")
-
-        except Exception as e:
-            error_info = {'page_id': page_id, 'title': title, 'error': str(e)}
-            results['errors'].append(error_info)
-            print(f"  -> ERROR: {e}\n")
+        status = manager.state.check_status(page_id, page.get('last_edited_time', ''))
+        if status == 'synced' and not force:
+            doc = manager.state.get_document(page_id)
+            results['skipped'].append({
+                'action': 'skipped',
+                'file': doc.local_file,
+                'title': doc.title,
+                'reason': 'No changes since last sync'
+            })
+        else:
+            to_pull.append(page)
+    print(f"Changed since last sync: {len(to_pull)} "
+          f"({len(results['skipped'])} unchanged)\n")
+
+    # State writes are committed in batches rather than once per page
+    with manager.state.batch():
+        for i, page in enumerate(to_pull, 1):
+            page_id = page['id'].replace('-', '')
+
+            # Get title for display
+            props = page.get('properties', {})
+            title_prop = props.get('Title', {})
+            title = ''
+            if title_prop.get('type') == 'title':
+                title = ''.join(t.get('plain_text', '') for t in title_prop.get('title', []))
+
+            print(f"[{i}/{len(to_pull)}] {title[:50]}...")
+
+            try:
+                result = manager.pull_page(page_id, force=force, page=page)
+                action = result.get('action', 'unknown')
+
+                if action in results:
+                    results[action].append(result)
+                else:
+                    results['created'].append(result)
+
+                print(f"  -> {action}: {result.get('file', 'unknown')}\n")
+
+            except Exception as e:
+                error_info = {'page_id': page_id, 'title': title, 'error': str(e)}
+                results['errors'].append(error_info)
+                print(f"  -> ERROR: {e}\n")
 
     # Summary
     print("\n" + "=" * 60)
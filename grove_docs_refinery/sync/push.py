@@ -17,6 +17,7 @@ from typing import Dict, List, Optional, Tuple, Any
 
 from .api import NotionAPI, get_api
 from .converter import markdown_file_to_notion, parse_frontmatter
+from .diff import blocks_for_upload, sync_page_blocks
 from .state import SyncState, DocumentState, get_state
 
 
@@ -93,10 +94,12 @@ class PushManager:
 
     def __init__(self, api: Optional[NotionAPI] = None,
                  state: Optional[SyncState] = None,
-                 refined_dir: Optional[str] = None):
+                 refined_dir: Optional[str] = None,
+                 incremental: bool = True):
         self.api = api or get_api()
         self.state = state or get_state()
         self.refined_dir = Path(refined_dir or 'grove_docs_refinery/refined')
+        self.incremental = incremental  # Diff blocks instead of clear-and-reappend
 
         # Initialize state with category IDs
         for category, page_id in self.CATEGORY_PAGES.items():
@@ -239,17 +242,17 @@ class PushManager:
 
     def update_page(self, page_id: str, blocks: List[Dict]) -> Dict:
         """Update an existing page's content."""
-        # Clear existing content
-        self.api.clear_page_content(page_id)
-
-        # Filter blocks for upload
-        clean_blocks = []
-        for block in blocks:
-            clean_blocks.append({k: v for k, v in block.items() if k != '_children'})
+        if self.incremental:
+            # Only delete/insert/patch the blocks that changed
+            sync_page_blocks(self.api, page_id, blocks)
+        else:
+            # Clear existing content
+            self.api.clear_page_content(page_id)
 
-        # Append new content
-        if clean_blocks:
-            self.api.append_blocks(page_id, clean_blocks)
+            # Append new content
+            clean_blocks = blocks_for_upload(blocks)
+            if clean_blocks:
+                self.api.append_blocks(page_id, clean_blocks)
 
         # Get updated page
         return self.api.get_page(page_id)
@@ -312,6 +315,9 @@ class PushManager:
 
             result['page'] = page
 
+            if self.api.index:
+                self.api.index.add_page(page, parse_frontmatter(content)[1])
+
             # Update local frontmatter with notion_id
             page_id = page.get('id', '').replace('-', '')
             page_url = page.get('url', '')
@@ -360,23 +366,25 @@ class PushManager:
         import sys
         print(f"Found {len(file_paths)} files to process", flush=True)
 
-        for i, file_path in enumerate(sorted(file_paths)):
-            if not file_path.exists():
-                results.append({
-                    'file': str(file_path),
-                    'action': 'not_found',
-                    'error': 'File does not exist'
-                })
-                continue
-
-            print(f"[{i+1}/{len(file_paths)}] Processing: {file_path.name}", flush=True)
-            result = self.push_file(file_path, dry_run)
-            results.append(result)
-
-            if result['action'] == 'error':
-                print(f"  ERROR: {result['error']}", flush=True)
-            else:
-                print(f"  {result['action']}: {result.get('page', {}).get('id', 'N/A')}", flush=True)
+        # State writes are committed in batches rather than once per file
+        with self.state.batch():
+            for i, file_path in enumerate(sorted(file_paths)):
+                if not file_path.exists():
+                    results.append({
+                        'file': str(file_path),
+                        'action': 'not_found',
+                        'error': 'File does not exist'
+                    })
+                    continue
+
+                print(f"[{i+1}/{len(file_paths)}] Processing: {file_path.name}", flush=True)
+                result = self.push_file(file_path, dry_run)
+                results.append(result)
+
+                if result['action'] == 'error':
+                    print(f"  ERROR: {result['error']}", flush=True)
+                else:
+                    print(f"  {result['action']}: {result.get('page', {}).get('id', 'N/A')}", flush=True)
 
         # Update global sync time
         if not dry_run:
@@ -482,10 +490,13 @@ def main():
                         help='Specific files to push')
     parser.add_argument('--refined-dir', type=str,
                         help='Path to refined directory')
+    parser.add_argument('--full-replace', action='store_true',
+                        help='Clear and re-append page content instead of diffing blocks')
 
     args = parser.parse_args()
 
-    manager = PushManager(refined_dir=args.refined_dir)
+    manager = PushManager(refined_dir=args.refined_dir,
+                          incremental=not args.full_replace)
 
     if args.check:
         status = manager.check_status()
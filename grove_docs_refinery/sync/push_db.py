@@ -14,6 +14,7 @@ from typing import Dict, List, Optional, Tuple, Any
 
 from .api import NotionAPI, get_api
 from .converter import markdown_file_to_notion, parse_frontmatter
+from .diff import blocks_for_upload, sync_page_blocks
 from .state import SyncState, DocumentState, get_state
 
 
@@ -28,10 +29,12 @@ class DatabasePushManager:
 
     def __init__(self, api: Optional[NotionAPI] = None,
                  state: Optional[SyncState] = None,
-                 refined_dir: Optional[str] = None):
+                 refined_dir: Optional[str] = None,
+                 incremental: bool = True):
         self.api = api or get_api()
         self.state = state or get_state()
         self.refined_dir = Path(refined_dir or 'grove_docs_refinery/refined')
+        self.incremental = incremental  # Diff blocks instead of clear-and-reappend
 
     def _parse_local_file(self, file_path: Path) -> Tuple[Dict, List[Dict], str]:
         """Parse a local markdown file."""
@@ -185,30 +188,8 @@ class DatabasePushManager:
                 'date': {'start': props['date:Last Synced:start']}
             }
 
-        # Clean blocks for upload - handle tables specially
-        # Tables MUST include their children (rows) when created
-        clean_blocks = []
-
-        for block in blocks:
-            if block.get('type') == 'table':
-                # Tables require children - include rows in the table block
-                table_rows = block.get('_children', [])
-                if table_rows:
-                    # Clean rows
-                    clean_rows = [{k: v for k, v in r.items() if k != '_children'}
-                                  for r in table_rows]
-                    clean_blocks.append({
-                        'type': 'table',
-                        'table': {
-                            'table_width': block.get('table', {}).get('table_width', 2),
-                            'has_column_header': block.get('table', {}).get('has_column_header', True),
-                            'has_row_header': block.get('table', {}).get('has_row_header', False),
-                            'children': clean_rows
-                        }
-                    })
-                # Skip empty tables
-            else:
-                clean_blocks.append({k: v for k, v in block.items() if k != '_children'})
+        # Clean blocks for upload - tables MUST include their rows when created
+        clean_blocks = blocks_for_upload(blocks)
 
         # Create page in database
         parent = {'database_id': self.DATABASE_ID}
@@ -247,33 +228,16 @@ class DatabasePushManager:
         # Update properties
         self.api.update_page(page_id, notion_props)
 
-        # Clear and replace content
-        self.api.clear_page_content(page_id)
-
-        # Clean blocks for upload - handle tables specially (same as create_row)
-        clean_blocks = []
-        for block in blocks:
-            if block.get('type') == 'table':
-                # Tables require children - include rows in the table block
-                table_rows = block.get('_children', [])
-                if table_rows:
-                    clean_rows = [{k: v for k, v in r.items() if k != '_children'}
-                                  for r in table_rows]
-                    clean_blocks.append({
-                        'type': 'table',
-                        'table': {
-                            'table_width': block.get('table', {}).get('table_width', 2),
-                            'has_column_header': block.get('table', {}).get('has_column_header', True),
-                            'has_row_header': block.get('table', {}).get('has_row_header', False),
-                            'children': clean_rows
-                        }
-                    })
-                # Skip empty tables
-            else:
-                clean_blocks.append({k: v for k, v in block.items() if k != '_children'})
+        if self.incremental:
+            # Only delete/insert/patch the blocks that changed
+            sync_page_blocks(self.api, page_id, blocks)
+        else:
+            # Clear and replace content
+            self.api.clear_page_content(page_id)
 
-        if clean_blocks:
-            self.api.append_blocks(page_id, clean_blocks)
+            clean_blocks = blocks_for_upload(blocks)
+            if clean_blocks:
+                self.api.append_blocks(page_id, clean_blocks)
 
         return self.api.get_page(page_id)
 
@@ -395,25 +359,26 @@ class DatabasePushManager:
 
         print(f"Found {len(file_paths)} files to process")
 
-        for i, file_path in enumerate(sorted(file_paths), 1):
-            if not file_path.exists():
-                results.append({
-                    'file': str(file_path),
-                    'action': 'not_found',
-                    'error': 'File does not exist'
-                })
-                continue
-
-            print(f"[{i}/{len(file_paths)}] {file_path.name[:50]}...")
-            result = self.push_file(file_path, dry_run)
-            results.append(result)
-
-            if result['action'] == 'error':
-                print(f"  ERROR: {result['error']}")
-            else:
-                action = result['action']
-                page_id = result.get('page', {}).get('id', 'N/A')[:8]
-                print(f"  {action} ({page_id}...)")
+        with self.state.batch():
+            for i, file_path in enumerate(sorted(file_paths), 1):
+                if not file_path.exists():
+                    results.append({
+                        'file': str(file_path),
+                        'action': 'not_found',
+                        'error': 'File does not exist'
+                    })
+                    continue
+
+                print(f"[{i}/{len(file_paths)}] {file_path.name[:50]}...")
+                result = self.push_file(file_path, dry_run)
+                results.append(result)
+
+                if result['action'] == 'error':
+                    print(f"  ERROR: {result['error']}")
+                else:
+                    action = result['action']
+                    page_id = result.get('page', {}).get('id', 'N/A')[:8]
+                    print(f"  {action} ({page_id}...)")
 
         if not dry_run:
             self.state.update_last_sync()
@@ -468,10 +433,13 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Preview changes')
     parser.add_argument('--file', type=str, nargs='+', help='Specific files')
     parser.add_argument('--refined-dir', type=str, help='Refined directory path')
+    parser.add_argument('--full-replace', action='store_true',
+                        help='Clear and re-append row content instead of diffing blocks')
 
     args = parser.parse_args()
 
-    manager = DatabasePushManager(refined_dir=args.refined_dir)
+    manager = DatabasePushManager(refined_dir=args.refined_dir,
+                                  incremental=not args.full_replace)
 
     if args.check:
         status = manager.check_status()
@@ -7,7 +7,10 @@ including timestamps for conflict detection.
 
 import os
 import json
+import sqlite3
 import hashlib
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, List, Any
@@ -38,45 +41,199 @@ class SyncState:
     """
     Enhanced sync state management with conflict detection.
 
-    State is stored in a JSON file with the structure:
-    {
-        "last_sync": "ISO timestamp",
-        "notion_workspace": "Documentation page ID",
-        "categories": {
-            "vision": "page_id",
-            "software": "page_id",
-            "blog": "page_id"
-        },
-        "documents": {
-            "notion-uuid": { DocumentState fields }
-        }
-    }
+    State is stored in a SQLite database (WAL mode) so concurrent pull/push
+    processes can share it safely:
+
+        meta        last_sync, notion_workspace, migration marker
+        categories  category -> page_id
+        documents   DocumentState rows, indexed by local_file and title
+
+    Every write is its own transaction unless it happens inside
+    `with state.batch():`, which buffers writes and commits them together
+    (every `size` writes and on exit). A legacy `.notion_sync_state.json`
+    next to the database is imported once on first open.
     """
 
-    DEFAULT_STATE_FILE = '.notion_sync_state.json'
+    DEFAULT_STATE_FILE = '.notion_sync_state.db'
+    BATCH_SIZE = 50  # Writes buffered per commit inside batch()
+    BUSY_TIMEOUT_MS = 30000  # Wait for other processes' write locks
+
+    DOCUMENT_FIELDS = tuple(DocumentState.__dataclass_fields__)
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS categories (
+            name TEXT PRIMARY KEY,
+            page_id TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS documents (
+            notion_id TEXT PRIMARY KEY,
+            local_file TEXT,
+            title TEXT,
+            notion_last_edited TEXT,
+            local_last_modified TEXT,
+            last_synced TEXT,
+            content_hash TEXT,
+            sync_status TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_documents_local_file ON documents(local_file);
+        CREATE INDEX IF NOT EXISTS idx_documents_title ON documents(title);
+    """
 
     def __init__(self, state_file: Optional[str] = None, refined_dir: Optional[str] = None):
-        self.state_file = Path(state_file or self.DEFAULT_STATE_FILE)
+        path = Path(state_file or self.DEFAULT_STATE_FILE)
+        # Accept the legacy JSON path: the database lives next to it
+        self.state_file = path.with_suffix('.db') if path.suffix == '.json' else path
+        self.legacy_file = self.state_file.with_suffix('.json')
         self.refined_dir = Path(refined_dir or 'grove_docs_refinery/refined')
-        self.state = self._load_state()
 
-    def _load_state(self) -> Dict:
-        """Load state from file or create default."""
-        if self.state_file.exists():
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._batch_size = self.BATCH_SIZE
+        self._pending_docs: Dict[str, Optional[Dict]] = {}  # None = delete
+        self._pending_meta: Dict[str, Optional[str]] = {}
+        self._pending_categories: Dict[str, str] = {}
+
+        self._conn = self._connect()
+        self._migrate_json()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database in WAL mode and ensure the schema exists."""
+        if self.state_file.parent and not self.state_file.parent.exists():
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode - transactions are explicit (BEGIN IMMEDIATE)
+        conn = sqlite3.connect(str(self.state_file), isolation_level=None,
+                               timeout=self.BUSY_TIMEOUT_MS / 1000,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}')
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction; takes the write lock up front to avoid upgrade deadlocks."""
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+        self._conn.execute('COMMIT')
+
+    def _migrate_json(self):
+        """One-shot import of the legacy JSON state file."""
+        if not self.legacy_file.exists():
+            return
+
+        with self._lock, self._transaction() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'migrated_from'").fetchone()
+            if row:
+                return
+
+            with open(self.legacy_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            for key in ('last_sync', 'notion_workspace'):
+                if data.get(key):
+                    conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                                 (key, data[key]))
+            conn.executemany(
+                'INSERT OR REPLACE INTO categories (name, page_id) VALUES (?, ?)',
+                list(data.get('categories', {}).items())
+            )
+            docs = [DocumentState.from_dict({'notion_id': notion_id, **doc_data}).to_dict()
+                    for notion_id, doc_data in data.get('documents', {}).items()]
+            self._upsert_documents(conn, docs)
+            conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                         ('migrated_from', str(self.legacy_file)))
+
+    def _upsert_documents(self, conn: sqlite3.Connection, docs: List[Dict]):
+        columns = ', '.join(self.DOCUMENT_FIELDS)
+        placeholders = ', '.join('?' for _ in self.DOCUMENT_FIELDS)
+        conn.executemany(
+            f'INSERT OR REPLACE INTO documents ({columns}) VALUES ({placeholders})',
+            [tuple(doc.get(field) for field in self.DOCUMENT_FIELDS) for doc in docs]
+        )
 
-        return {
-            'last_sync': None,
-            'notion_workspace': None,
-            'categories': {},
-            'documents': {}
-        }
+    # ========================================================================
+    # Batching
+    # ========================================================================
+
+    @contextmanager
+    def batch(self, size: Optional[int] = None):
+        """
+        Buffer writes and commit them in one transaction per `size` writes.
+
+        Reads inside the batch see the buffered writes. Nested batches
+        commit when the outermost one exits.
+        """
+        with self._lock:
+            if self._batch_depth == 0 and size:
+                self._batch_size = size
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._batch_size = self.BATCH_SIZE
+                    self.save()
+
+    def _pending_count(self) -> int:
+        return len(self._pending_docs) + len(self._pending_meta) + len(self._pending_categories)
+
+    def _after_write(self):
+        """Commit now, or once the batch buffer is full."""
+        if self._batch_depth == 0 or self._pending_count() >= self._batch_size:
+            self.save()
 
     def save(self):
-        """Persist state to file."""
-        with open(self.state_file, 'w', encoding='utf-8') as f:
-            json.dump(self.state, f, indent=2, ensure_ascii=False)
+        """Commit any buffered writes."""
+        with self._lock:
+            if not self._pending_count():
+                return
+            with self._transaction() as conn:
+                upserts = [doc for doc in self._pending_docs.values() if doc is not None]
+                deletes = [(nid,) for nid, doc in self._pending_docs.items() if doc is None]
+                if upserts:
+                    self._upsert_documents(conn, upserts)
+                if deletes:
+                    conn.executemany('DELETE FROM documents WHERE notion_id = ?', deletes)
+                conn.executemany(
+                    'INSERT OR REPLACE INTO categories (name, page_id) VALUES (?, ?)',
+                    list(self._pending_categories.items())
+                )
+                conn.executemany(
+                    'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                    list(self._pending_meta.items())
+                )
+            self._pending_docs.clear()
+            self._pending_meta.clear()
+            self._pending_categories.clear()
+
+    def close(self):
+        """Commit buffered writes and close the database."""
+        self.save()
+        self._conn.close()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._pending_meta:
+                return self._pending_meta[key]
+            row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+            return row['value'] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]):
+        with self._lock:
+            self._pending_meta[key] = value
+            self._after_write()
 
     # ========================================================================
     # Configuration
@@ -84,59 +241,88 @@ class SyncState:
 
     def set_workspace(self, page_id: str):
         """Set the root Documentation page ID."""
-        self.state['notion_workspace'] = page_id
-        self.save()
+        self._set_meta('notion_workspace', page_id)
 
     def set_category(self, category: str, page_id: str):
         """Set the page ID for a document category."""
-        self.state.setdefault('categories', {})[category] = page_id
-        self.save()
+        with self._lock:
+            if self.get_category_id(category) == page_id:
+                return  # Unchanged - skip the write
+            self._pending_categories[category] = page_id
+            self._after_write()
 
     def get_category_id(self, category: str) -> Optional[str]:
         """Get the page ID for a category."""
-        return self.state.get('categories', {}).get(category)
+        with self._lock:
+            if category in self._pending_categories:
+                return self._pending_categories[category]
+            row = self._conn.execute('SELECT page_id FROM categories WHERE name = ?',
+                                     (category,)).fetchone()
+            return row['page_id'] if row else None
+
+    def list_categories(self) -> List[str]:
+        """List configured category names."""
+        with self._lock:
+            rows = self._conn.execute('SELECT name FROM categories').fetchall()
+            names = [row['name'] for row in rows]
+            names.extend(c for c in self._pending_categories if c not in names)
+            return names
 
     # ========================================================================
     # Document State Management
     # ========================================================================
 
+    def _find_document(self, column: str, value: str) -> Optional[DocumentState]:
+        """Indexed lookup by column, with buffered writes taking precedence."""
+        with self._lock:
+            for doc_data in self._pending_docs.values():
+                if doc_data is not None and doc_data.get(column) == value:
+                    return DocumentState.from_dict(doc_data)
+            rows = self._conn.execute(
+                f'SELECT * FROM documents WHERE {column} = ?', (value,)
+            ).fetchall()
+            for row in rows:
+                if row['notion_id'] not in self._pending_docs:
+                    return DocumentState.from_dict(dict(row))
+            return None
+
     def get_document(self, notion_id: str) -> Optional[DocumentState]:
         """Get document state by Notion ID."""
-        doc_data = self.state.get('documents', {}).get(notion_id)
-        if doc_data:
-            return DocumentState.from_dict(doc_data)
-        return None
+        with self._lock:
+            if notion_id in self._pending_docs:
+                doc_data = self._pending_docs[notion_id]
+                return DocumentState.from_dict(doc_data) if doc_data else None
+            return self._find_document('notion_id', notion_id)
 
     def get_document_by_file(self, filename: str) -> Optional[DocumentState]:
         """Get document state by local filename."""
-        for notion_id, doc_data in self.state.get('documents', {}).items():
-            if doc_data.get('local_file') == filename:
-                return DocumentState.from_dict(doc_data)
-        return None
+        return self._find_document('local_file', filename)
 
     def get_document_by_title(self, title: str) -> Optional[DocumentState]:
         """Get document state by title."""
-        for notion_id, doc_data in self.state.get('documents', {}).items():
-            if doc_data.get('title') == title:
-                return DocumentState.from_dict(doc_data)
-        return None
+        return self._find_document('title', title)
 
     def set_document(self, doc: DocumentState):
         """Update or create document state."""
-        self.state.setdefault('documents', {})[doc.notion_id] = doc.to_dict()
-        self.save()
+        with self._lock:
+            self._pending_docs[doc.notion_id] = doc.to_dict()
+            self._after_write()
 
     def remove_document(self, notion_id: str):
         """Remove a document from state."""
-        self.state.get('documents', {}).pop(notion_id, None)
-        self.save()
+        with self._lock:
+            self._pending_docs[notion_id] = None
+            self._after_write()
 
     def list_documents(self) -> List[DocumentState]:
         """List all tracked documents."""
-        return [
-            DocumentState.from_dict(data)
-            for data in self.state.get('documents', {}).values()
-        ]
+        with self._lock:
+            rows = self._conn.execute('SELECT * FROM documents').fetchall()
+            docs = [DocumentState.from_dict(dict(row)) for row in rows
+                    if row['notion_id'] not in self._pending_docs]
+            docs.extend(DocumentState.from_dict(doc_data)
+                        for doc_data in self._pending_docs.values() if doc_data)
+            return docs
 
     # ========================================================================
     # Sync Operations
@@ -144,12 +330,11 @@ class SyncState:
 
     def update_last_sync(self):
         """Update global last sync timestamp."""
-        self.state['last_sync'] = datetime.now().isoformat()
-        self.save()
+        self._set_meta('last_sync', datetime.now().isoformat())
 
     def get_last_sync(self) -> Optional[str]:
         """Get global last sync timestamp."""
-        return self.state.get('last_sync')
+        return self._get_meta('last_sync')
 
     def mark_synced(self, notion_id: str, local_file: str, title: str,
                     notion_edited: str, content_hash: str):
@@ -275,7 +460,7 @@ class SyncState:
             'last_sync': self.get_last_sync(),
             'total_documents': len(docs),
             'status_counts': status_counts,
-            'categories': list(self.state.get('categories', {}).keys())
+            'categories': self.list_categories()
         }
 
     def get_changes_since(self, since: str) -> Dict[str, List[DocumentState]]:
@@ -319,6 +504,12 @@ def migrate_old_state(old_state_file: str, new_state: SyncState):
     with open(old_state_file, 'r', encoding='utf-8') as f:
         old_data = json.load(f)
 
+    with new_state.batch():
+        _migrate_old_documents(old_data, new_state)
+
+
+def _migrate_old_documents(old_data: Dict, new_state: SyncState):
+    """Copy title-keyed documents and categories into new_state."""
     # Migrate documents
     for key, data in old_data.get('documents', {}).items():
         notion_id = data.get('notion_id') or key
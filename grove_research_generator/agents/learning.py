@@ -4,6 +4,10 @@ Learning Agent
 
 Analyzes differences between AI-generated drafts and human-edited versions
 to extract editorial preferences and update the editorial memory.
+
+Learnings live in a structured store (editorial_memory.jsonl, see
+memory_store.py); editorial_memory.md is regenerated from it for humans,
+and prompts get only the most relevant patterns within a token budget.
 """
 
 import re
@@ -13,6 +17,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from .memory_store import EditorialMemoryStore, PROMPT_MAX_ITEMS, PROMPT_TOKEN_BUDGET
+
 if TYPE_CHECKING:
     from ..config import ResearchConfig
 
@@ -72,6 +78,10 @@ class LearningAgent:
     def __init__(self, config: 'ResearchConfig' = None):
         self.config = config
         self.memory_path = Path(__file__).parent.parent / "editorial_memory.md"
+        self.store = EditorialMemoryStore(
+            self.memory_path.with_suffix(".jsonl"),
+            legacy_markdown=self.memory_path,
+        )
 
     def analyze_diff(
         self,
@@ -361,194 +371,22 @@ class LearningAgent:
         return patterns[:5]  # Limit to avoid noise
 
     def update_memory(self, analysis: DiffAnalysis) -> bool:
-        """Update editorial_memory.md with new learnings."""
+        """Record new learnings and regenerate editorial_memory.md."""
         if not analysis.has_learnings():
             return False
 
-        # Read current memory
-        if self.memory_path.exists():
-            content = self.memory_path.read_text(encoding='utf-8')
-        else:
-            content = self._create_empty_memory()
-
-        # Update each section
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        # Update terminology
-        for pattern in analysis.terminology_changes:
-            content = self._add_to_section(
-                content,
-                "## Terminology Preferences",
-                self._format_pattern(pattern),
-            )
-
-        # Update voice
-        for pattern in analysis.voice_changes:
-            content = self._add_to_section(
-                content,
-                "## Voice & Framing",
-                self._format_pattern(pattern),
-            )
-
-        # Update concepts
-        for pattern in analysis.added_concepts:
-            content = self._add_to_section(
-                content,
-                "## Concepts AI Tends to Miss",
-                self._format_pattern(pattern),
-            )
-
-        # Update structure
-        for pattern in analysis.structural_changes:
-            content = self._add_to_section(
-                content,
-                "## Structural Preferences",
-                self._format_pattern(pattern),
-            )
-
-        # Update phrasing
-        for pattern in analysis.phrasing_changes:
-            content = self._add_to_section(
-                content,
-                "## Phrasing Patterns",
-                self._format_pattern(pattern),
-            )
-
-        # Update changelog
-        for pattern in (
+        self.store.record(
             analysis.terminology_changes +
             analysis.voice_changes +
-            analysis.added_concepts
-        )[:3]:  # Top 3 learnings
-            changelog_entry = f"| {today} | {pattern.source_doc} | {pattern.pattern[:50]} |"
-            content = self._add_to_changelog(content, changelog_entry)
-
-        # Update header
-        content = self._update_header(content, analysis.total_changes)
-
-        # Write back
-        self.memory_path.write_text(content, encoding='utf-8')
-        return True
-
-    def _format_pattern(self, pattern: EditPattern) -> str:
-        """Format a pattern for the memory file."""
-        return f"""
-### {pattern.pattern}
-- **Category:** {pattern.category}
-- **Original:** {pattern.original}
-- **Edited:** {pattern.edited}
-- **Why:** {pattern.explanation}
-- **Source:** {pattern.source_doc} ({pattern.date})
-"""
-
-    def _add_to_section(self, content: str, section: str, entry: str) -> str:
-        """Add an entry to a section in the memory file."""
-        # Find the section
-        section_pattern = re.escape(section)
-        next_section = r'\n---\n\n## '
-
-        match = re.search(
-            f'{section_pattern}(.*?)({next_section}|## Changelog)',
-            content,
-            re.DOTALL
+            analysis.added_concepts +
+            analysis.structural_changes +
+            analysis.phrasing_changes
         )
 
-        if match:
-            section_content = match.group(1)
-            # Remove placeholder if present
-            section_content = re.sub(
-                r'\*No learnings yet.*?\*\n*',
-                '',
-                section_content
-            )
-            # Add new entry
-            new_section_content = section_content.rstrip() + "\n" + entry
-            content = content[:match.start(1)] + new_section_content + content[match.end(1):]
-
-        return content
-
-    def _add_to_changelog(self, content: str, entry: str) -> str:
-        """Add entry to changelog table."""
-        # Find the changelog table
-        changelog_match = re.search(
-            r'(\| Date \| Document \| Learning \|\n\|[-|]+\|)\n',
-            content
-        )
-        if changelog_match:
-            insert_pos = changelog_match.end()
-            content = content[:insert_pos] + entry + "\n" + content[insert_pos:]
-        return content
-
-    def _update_header(self, content: str, new_learnings: int) -> str:
-        """Update the header with new counts."""
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        # Update date
-        content = re.sub(
-            r'\*\*Last updated:\*\* \d{4}-\d{2}-\d{2}',
-            f'**Last updated:** {today}',
-            content
-        )
-
-        # Update count
-        count_match = re.search(r'\*\*Total learnings:\*\* (\d+)', content)
-        if count_match:
-            current = int(count_match.group(1))
-            content = re.sub(
-                r'\*\*Total learnings:\*\* \d+',
-                f'**Total learnings:** {current + new_learnings}',
-                content
-            )
-
-        return content
-
-    def _create_empty_memory(self) -> str:
-        """Create empty memory file content."""
-        return """# Editorial Memory
-
-This file captures learned preferences from editorial feedback.
-
-**Last updated:** {date}
-**Total learnings:** 0
-
----
-
-## Terminology Preferences
-
-*No learnings yet*
-
----
-
-## Voice & Framing
-
-*No learnings yet*
-
----
-
-## Concepts AI Tends to Miss
-
-*No learnings yet*
-
----
-
-## Structural Preferences
-
-*No learnings yet*
-
----
-
-## Phrasing Patterns
-
-*No learnings yet*
-
----
-
-## Changelog
-
-| Date | Document | Learning |
-|------|----------|----------|
-
-""".format(date=datetime.now().strftime("%Y-%m-%d"))
+        tmp = self.memory_path.with_name(f"{self.memory_path.name}.tmp")
+        tmp.write_text(self.store.render_markdown(), encoding='utf-8')
+        tmp.replace(self.memory_path)
+        return True
 
     def load_memory(self) -> str:
         """Load editorial memory for use in prompts."""
@@ -556,53 +394,18 @@ This file captures learned preferences from editorial feedback.
             return self.memory_path.read_text(encoding='utf-8')
         return ""
 
-    def get_memory_summary(self) -> str:
-        """Get a condensed summary for system prompts."""
-        if not self.memory_path.exists():
-            return "No editorial memory yet."
-
-        content = self.memory_path.read_text(encoding='utf-8')
-
-        # Extract key learnings for prompt injection
-        summary_parts = []
+    def get_memory_summary(
+        self,
+        query: str = "",
+        max_items: int = PROMPT_MAX_ITEMS,
+        token_budget: int = PROMPT_TOKEN_BUDGET,
+    ) -> str:
+        """
+        Condensed preferences for system prompts.
 
-        # Get terminology rules
-        term_match = re.search(
-            r'## Terminology Preferences\n(.*?)(?=\n---|\n## )',
-            content,
-            re.DOTALL
-        )
-        if term_match and 'No learnings' not in term_match.group(1):
-            summary_parts.append("**Terminology:**")
-            # Extract pattern names
-            patterns = re.findall(r'### ([^\n]+)', term_match.group(1))
-            for p in patterns[:5]:
-                summary_parts.append(f"- {p}")
-
-        # Get voice rules
-        voice_match = re.search(
-            r'## Voice & Framing\n(.*?)(?=\n---|\n## )',
-            content,
-            re.DOTALL
-        )
-        if voice_match and 'No learnings' not in voice_match.group(1):
-            summary_parts.append("\n**Voice:**")
-            patterns = re.findall(r'### ([^\n]+)', voice_match.group(1))
-            for p in patterns[:5]:
-                summary_parts.append(f"- {p}")
-
-        # Get concepts to include
-        concepts_match = re.search(
-            r'## Concepts AI Tends to Miss\n(.*?)(?=\n---|\n## )',
-            content,
-            re.DOTALL
-        )
-        if concepts_match and 'No learnings' not in concepts_match.group(1):
-            summary_parts.append("\n**Concepts to include:**")
-            patterns = re.findall(r'### ([^\n]+)', concepts_match.group(1))
-            for p in patterns[:5]:
-                summary_parts.append(f"- {p}")
-
-        if summary_parts:
-            return "\n".join(summary_parts)
-        return "No editorial memory yet."
+        The top `max_items` patterns for `query` (topic and draft text),
+        ranked by frequency, recency and overlap with the request, and cut
+        to `token_budget` tokens.
+        """
+        summary = self.store.render_prompt(query, max_items=max_items, token_budget=token_budget)
+        return summary or "No editorial memory yet."
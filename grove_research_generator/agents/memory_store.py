@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Editorial Memory Store
+
+Learned editorial patterns kept as structured records in
+editorial_memory.jsonl, one JSON object per distinct pattern:
+
+    category, pattern, original, edited, explanation, notes,
+    count, first_seen, last_seen, sources
+
+Seeing a pattern again bumps its count and recency instead of appending a
+duplicate entry. The store is capped at `max_entries`; the lowest-scoring
+patterns are dropped first.
+
+Two renderings:
+- render_prompt(): the top patterns for a request, scored by frequency,
+  recency and word overlap with the request, cut to a token budget. This is
+  what goes into the Writer's system prompt, so its size stays flat however
+  many learnings pile up.
+- render_markdown(): every pattern, for the human-readable
+  editorial_memory.md.
+"""
+
+import json
+import os
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# category -> (memory file section, prompt label)
+CATEGORIES = {
+    "terminology": ("Terminology Preferences", "Terminology"),
+    "voice": ("Voice & Framing", "Voice"),
+    "concepts": ("Concepts AI Tends to Miss", "Concepts to include"),
+    "structure": ("Structural Preferences", "Structure"),
+    "phrasing": ("Phrasing Patterns", "Phrasing"),
+}
+
+MAX_ENTRIES = 500
+MAX_SOURCES = 5           # Most recent source documents kept per pattern
+HALF_LIFE_DAYS = 60       # Recency weight halves every HALF_LIFE_DAYS
+PROMPT_MAX_ITEMS = 15
+PROMPT_TOKEN_BUDGET = 400
+CHANGELOG_ROWS = 20
+
+_WORD = re.compile(r"\w+")
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+def count_tokens(text: str) -> int:
+    """Approximate token count: words plus punctuation marks."""
+    return sum(1 for _ in _TOKEN.finditer(text))
+
+
+def _words(text: str) -> set:
+    return {w for w in _WORD.findall(text.lower()) if len(w) > 3}
+
+
+def _key(category: str, pattern: str) -> Tuple[str, str]:
+    return category, " ".join(pattern.lower().split())
+
+
+def _parse_date(value: str) -> Optional[date]:
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+class EditorialMemoryStore:
+    """Deduplicated, size-bounded editorial patterns backed by a JSONL file."""
+
+    def __init__(
+        self,
+        path: Path,
+        legacy_markdown: Optional[Path] = None,
+        max_entries: int = MAX_ENTRIES,
+        half_life_days: float = HALF_LIFE_DAYS,
+    ):
+        self.path = Path(path)
+        self.legacy_markdown = legacy_markdown
+        self.max_entries = max_entries
+        self.half_life_days = half_life_days
+        self._records: Optional[Dict[Tuple[str, str], Dict]] = None
+
+    @property
+    def records(self) -> Dict[Tuple[str, str], Dict]:
+        """Patterns by (category, normalized pattern), loaded on first use."""
+        if self._records is None:
+            self._records = {}
+            if self.path.exists():
+                with open(self.path, encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            self._records[_key(record["category"], record["pattern"])] = record
+            elif self.legacy_markdown and Path(self.legacy_markdown).exists():
+                # First run: seed from the hand-maintained markdown file
+                text = Path(self.legacy_markdown).read_text(encoding="utf-8")
+                for record in parse_memory_markdown(text):
+                    self._records[_key(record["category"], record["pattern"])] = record
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def total_observations(self) -> int:
+        return sum(r["count"] for r in self.records.values())
+
+    # ========================================================================
+    # Recording
+    # ========================================================================
+
+    def record(self, patterns: Iterable) -> int:
+        """
+        Add EditPatterns, merging repeats into existing records.
+
+        Returns the number of patterns not seen before.
+        """
+        new = 0
+        for p in patterns:
+            key = _key(p.category, p.pattern)
+            record = self.records.get(key)
+            if record is None:
+                new += 1
+                record = self.records[key] = {
+                    "category": p.category,
+                    "pattern": p.pattern,
+                    "notes": [],
+                    "count": 0,
+                    "first_seen": p.date,
+                    "sources": [],
+                }
+            record.update(original=p.original, edited=p.edited, explanation=p.explanation)
+            record["count"] += 1
+            record["last_seen"] = max(record.get("last_seen") or "", p.date)
+            sources = [s for s in record["sources"] if s != p.source_doc]
+            record["sources"] = (sources + [p.source_doc])[-MAX_SOURCES:]
+
+        self._evict()
+        self.save()
+        return new
+
+    def _evict(self):
+        if len(self.records) <= self.max_entries:
+            return
+        # Ties go to the more recently added pattern
+        items = list(self.records.items())
+        today = date.today()
+        ranked = sorted(range(len(items)), key=lambda i: (self.score(items[i][1], today=today), i),
+                        reverse=True)
+        keep = sorted(ranked[:self.max_entries])
+        self._records = dict(items[i] for i in keep)
+
+    def save(self):
+        """Rewrite the JSONL file atomically, oldest pattern first."""
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for record in self.records.values():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+
+    # ========================================================================
+    # Ranking
+    # ========================================================================
+
+    def score(self, record: Dict, query_words: Optional[set] = None,
+              today: Optional[date] = None) -> float:
+        """Frequency x recency, boosted by words shared with the request."""
+        today = today or date.today()
+        last_seen = _parse_date(record.get("last_seen") or "")
+        age = (today - last_seen).days if last_seen else self.half_life_days
+        weight = record["count"] * 0.5 ** (max(age, 0) / self.half_life_days)
+        if query_words:
+            text = " ".join(str(record.get(field, "")) for field in
+                            ("pattern", "original", "edited", "explanation"))
+            weight *= 1 + len(query_words & _words(text))
+        return weight
+
+    def top(self, query: str = "", k: int = PROMPT_MAX_ITEMS) -> List[Dict]:
+        """The k most relevant patterns for a request, best first."""
+        query_words = _words(query)
+        today = date.today()
+        ranked = sorted(self.records.values(),
+                        key=lambda r: self.score(r, query_words, today), reverse=True)
+        return ranked[:k]
+
+    # ========================================================================
+    # Rendering
+    # ========================================================================
+
+    def render_prompt(
+        self,
+        query: str = "",
+        max_items: int = PROMPT_MAX_ITEMS,
+        token_budget: int = PROMPT_TOKEN_BUDGET,
+    ) -> str:
+        """Top patterns for a request, grouped by category, within a token budget."""
+        chosen: Dict[str, List[str]] = {}
+        used = 0
+        for record in self.top(query, max_items):
+            line = f"- {record['pattern']}"
+            if record.get("explanation"):
+                line += f": {record['explanation']}"
+            tokens = count_tokens(line) + (0 if record["category"] in chosen else 4)
+            if used + tokens > token_budget:
+                continue
+            chosen.setdefault(record["category"], []).append(line)
+            used += tokens
+
+        parts = []
+        for category, (_, label) in CATEGORIES.items():
+            if category in chosen:
+                parts.append(f"**{label}:**\n" + "\n".join(chosen[category]))
+        return "\n\n".join(parts)
+
+    def render_markdown(self) -> str:
+        """The whole store as editorial_memory.md."""
+        records = list(self.records.values())
+        last_updated = max((r.get("last_seen") or "" for r in records),
+                           default="") or date.today().isoformat()
+        lines = [
+            "# Editorial Memory",
+            "",
+            "This file captures learned preferences from editorial feedback. It grows over "
+            "time as Atlas analyzes the differences between generated drafts and Jim's "
+            "edited versions.",
+            "",
+            "Generated from `editorial_memory.jsonl` - edit that file, not this one.",
+            "",
+            f"**Last updated:** {last_updated}",
+            f"**Total learnings:** {self.total_observations}",
+            "",
+        ]
+
+        for category, (section, _) in CATEGORIES.items():
+            lines += ["---", "", f"## {section}", ""]
+            entries = sorted((r for r in records if r["category"] == category),
+                             key=lambda r: (-r["count"], r.get("first_seen") or ""))
+            if not entries:
+                lines += ["*No learnings yet - will populate as we process more edits*", ""]
+            for r in entries:
+                lines.append(f"### {r['pattern']}")
+                for label, field in (("Original", "original"), ("Edited", "edited"),
+                                     ("Why", "explanation")):
+                    if r.get(field):
+                        lines.append(f"- **{label}:** {r[field]}")
+                seen = f"{r['count']}x, last {r.get('last_seen')}" if r.get("last_seen") else f"{r['count']}x"
+                lines.append(f"- **Seen:** {seen}")
+                if r["sources"]:
+                    lines.append(f"- **Source:** {'; '.join(r['sources'])}")
+                lines += r.get("notes", [])
+                lines.append("")
+
+        lines += ["---", "", "## Changelog", "",
+                  "| Date | Document | Learning |", "|------|----------|----------|"]
+        recent = sorted(reversed(records), key=lambda r: r.get("last_seen") or "", reverse=True)
+        for r in recent[:CHANGELOG_ROWS]:
+            source = r["sources"][-1] if r["sources"] else ""
+            lines.append(f"| {r.get('last_seen') or ''} | {source} | {r['pattern'][:50]} |")
+        return "\n".join(lines) + "\n\n"
+
+
+def parse_memory_markdown(text: str) -> List[Dict]:
+    """Records from a hand-written editorial_memory.md (used to seed the store)."""
+    sections = {section: category for category, (section, _) in CATEGORIES.items()}
+    records = []
+    category = None
+    record = None
+    for line in text.splitlines():
+        if line.startswith("## "):
+            category = sections.get(line[3:].strip())
+            record = None
+        elif line.startswith("### ") and category:
+            record = {"category": category, "pattern": line[4:].strip(), "original": "",
+                      "edited": "", "explanation": "", "notes": [], "count": 1,
+                      "first_seen": None, "last_seen": None, "sources": []}
+            records.append(record)
+        elif record is not None and line.strip() and line.strip() != "---":
+            field = re.match(r"- \*\*(\w+):\*\* (.*)", line)
+            name = field.group(1).lower() if field else None
+            if name in ("original", "edited"):
+                record[name] = field.group(2)
+            elif name in ("why", "pattern"):
+                # Rule and rationale, in file order
+                record["explanation"] = "; ".join(filter(None, [record["explanation"], field.group(2)]))
+            elif name == "source":
+                source = re.match(r"(.*?)\s*\((\d{4}-\d{2}-\d{2})\)$", field.group(2))
+                doc, seen = (source.groups() if source else (field.group(2), None))
+                record["sources"].append(doc)
+                record["first_seen"] = record["last_seen"] = seen
+            elif name not in ("category", "seen"):
+                record["notes"].append(line)
+    return records
@@ -3,16 +3,21 @@
 Researcher Agent
 
 Queries LEANN RAG for Grove context and synthesizes sources.
+
+All queries for a request (topic plus draft concepts) go through one
+Retriever call: embedded as a batch, searched concurrently, and cached.
 """
 
+import json
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..config import ResearchConfig
     from ..orchestrator import ResearchRequest, ResearchContext
+    from ..retrieval import Retriever
 
 # Add LEANN to path
 LEANN_PATH = Path(__file__).parent.parent.parent / "leann-repo" / "packages" / "leann-core" / "src"
@@ -40,6 +45,8 @@ class Researcher:
         self.config = config
         self._searcher = None
         self._index_path = None
+        self._tombstones = None
+        self._retriever = None
 
     @property
     def index_path(self) -> Optional[Path]:
@@ -71,6 +78,39 @@ class Researcher:
                 self._searcher = None
         return self._searcher
 
+    @property
+    def tombstones(self) -> set:
+        """Chunk IDs the incremental builder has retired but not yet compacted away."""
+        if self._tombstones is None:
+            self._tombstones = set()
+            if self.index_path:
+                manifest = Path(f"{self.index_path}.manifest.json")
+                try:
+                    self._tombstones = set(json.loads(manifest.read_text(encoding="utf-8"))
+                                           .get("tombstones", []))
+                except (OSError, ValueError):
+                    pass
+        return self._tombstones
+
+    @property
+    def index_version(self) -> Tuple[int, int]:
+        """Changes whenever the index is rebuilt or updated (keys cached results)."""
+        version = []
+        for suffix in (".meta.json", ".manifest.json"):
+            try:
+                version.append(Path(f"{self.index_path}{suffix}").stat().st_mtime_ns)
+            except OSError:
+                version.append(0)
+        return tuple(version)
+
+    @property
+    def retriever(self) -> Optional['Retriever']:
+        """Batched, cached search over the loaded index."""
+        if self._retriever is None and self.searcher:
+            from ..retrieval import Retriever
+            self._retriever = Retriever(self.searcher, index_version=(str(self.index_path), self.index_version))
+        return self._retriever
+
     def get_context(self, request: 'ResearchRequest') -> 'ResearchContext':
         """
         Query LEANN for relevant Grove context.
@@ -85,20 +125,22 @@ class Researcher:
             print("  No LEANN index available - skipping RAG")
             return context
 
-        # Query for primary topic
+        # Topic and key concepts from the draft, retrieved as one batch
+        queries = []
         if request.topic:
             print(f"  Searching for: {request.topic}")
-            primary_results = self._search(request.topic, top_k=10)
-            context.primary_sources = self._format_results(primary_results)
-            print(f"  Found {len(context.primary_sources)} primary sources")
-
-        # Query for key concepts from draft
-        concepts = self._extract_concepts(request.draft_content)
+            queries.append((request.topic, 10))
+        concepts = self._extract_concepts(request.draft_content)[:3]  # Limit queries
         if concepts:
-            print(f"  Searching for concepts: {', '.join(concepts[:3])}")
-            for concept in concepts[:3]:  # Limit queries
-                related = self._search(concept, top_k=5)
-                context.related_sources.extend(self._format_results(related))
+            print(f"  Searching for concepts: {', '.join(concepts)}")
+            queries.extend((concept, 5) for concept in concepts)
+
+        results = self._search_many(queries)
+        if request.topic:
+            context.primary_sources = self._format_results(results.pop(0))
+            print(f"  Found {len(context.primary_sources)} primary sources")
+        for related in results:
+            context.related_sources.extend(self._format_results(related))
 
         # Deduplicate related sources
         context.related_sources = self._deduplicate(context.related_sources)
@@ -123,15 +165,50 @@ class Researcher:
 
     def _search(self, query: str, top_k: int = 10) -> List:
         """Execute LEANN search."""
-        if not self.searcher:
-            return []
+        return self._search_many([(query, top_k)])[0]
+
+    def _search_many(self, queries: Sequence[Tuple[str, int]]) -> List[List]:
+        """Execute several LEANN searches as one batch; results per query."""
+        if not queries or not self.searcher:
+            return [[] for _ in queries]
 
         try:
-            results = self.searcher.search(query, top_k=top_k)
-            return results
+            # Over-fetch when chunks are retired, and keep doubling for any
+            # query still short of top_k live hits until the index runs out
+            fetch = [top_k * 2 if self.tombstones else top_k for _, top_k in queries]
+            found: List[Optional[List]] = [None] * len(queries)
+            pending = list(range(len(queries)))
+            while pending:
+                batches = self.retriever.search_many([(queries[i][0], fetch[i]) for i in pending])
+                for i, results in zip(pending, batches):
+                    live = self._live(results)
+                    top_k = queries[i][1]
+                    if len(live) >= top_k or len(results) < fetch[i]:
+                        found[i] = live[:top_k]
+                pending = [i for i in pending if found[i] is None]
+                for i in pending:
+                    fetch[i] *= 2
+            return found
         except Exception as e:
             print(f"  Search error: {e}")
-            return []
+            return [[] for _ in queries]
+
+    def _live(self, results: List) -> List:
+        """Results minus tombstoned chunks and repeats of the same chunk ID.
+
+        A build interrupted between appending a batch and saving the
+        manifest re-embeds that batch on the next run, so a chunk can be in
+        the index twice; the first (best-scored) copy is kept.
+        """
+        live = []
+        seen = set()
+        for r in results:
+            cid = (getattr(r, 'metadata', {}) or {}).get('chunk_id')
+            if cid in self.tombstones or (cid and cid in seen):
+                continue
+            seen.add(cid)
+            live.append(r)
+        return live
 
     def _format_results(self, results: List) -> List[Dict]:
         """Format LEANN results for context."""
@@ -143,6 +220,7 @@ class Researcher:
             formatted.append({
                 'title': metadata.get('title', 'Untitled'),
                 'source': metadata.get('source', ''),
+                'section': metadata.get('section', ''),
                 'path': metadata.get('path', ''),
                 'url': self._generate_url(metadata),
                 'date': metadata.get('date', ''),
@@ -166,8 +244,8 @@ class Researcher:
         seen = set()
         unique = []
         for src in sources:
-            # Use title + source as unique key
-            key = (src.get('title', ''), src.get('source', ''))
+            # Chunks are per section, so a document can contribute several
+            key = (src.get('title', ''), src.get('source', ''), src.get('section', ''))
             if key not in seen:
                 seen.add(key)
                 unique.append(src)
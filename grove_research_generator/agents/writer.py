@@ -6,7 +6,7 @@ Generates research documents with Chicago-style citations using Claude.
 """
 
 import os
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 from pathlib import Path
 
@@ -167,10 +167,10 @@ class Writer:
                 self._learning_agent = None
         return self._learning_agent
 
-    def _get_editorial_memory(self) -> str:
+    def _get_editorial_memory(self, query: str = "") -> str:
         """Get editorial memory summary for prompt injection."""
         if self.learning_agent:
-            summary = self.learning_agent.get_memory_summary()
+            summary = self.learning_agent.get_memory_summary(query)
             if summary:
                 return summary
         return ""
@@ -201,8 +201,6 @@ class Writer:
 
         Uses Claude API if available, otherwise falls back to template.
         """
-        from ..orchestrator import GeneratedDocument
-
         # Reset citation manager
         self.citation_manager = CitationManager()
 
@@ -214,6 +212,66 @@ class Writer:
             print("  Using template generation (Claude unavailable)...")
             content = self._generate_template(prompt, context, request)
 
+        return self._assemble_document(content, request)
+
+    def generate_batch(
+        self,
+        jobs: List[Tuple['StructuredPrompt', 'ResearchContext', 'ResearchRequest']],
+        runner=None,
+    ) -> List['GeneratedDocument']:
+        """
+        Generate many documents through one Message Batch.
+
+        Batches cost half as much as synchronous calls but can take minutes
+        to hours, so this is for bulk runs, not interactive @atlas requests.
+        Failed requests fall back to template generation like generate().
+
+        Args:
+            jobs: (prompt, context, request) per document
+            runner: MessageBatchRunner to use (created from the client if None)
+
+        Returns:
+            Documents in the same order as jobs
+        """
+        if not self.claude_client:
+            return [self.generate(*job) for job in jobs]
+
+        requests = {
+            f"doc-{i:05d}": self._build_claude_request(*job)
+            for i, job in enumerate(jobs)
+        }
+        if runner is None:
+            runner = self._batch_runner_class()(self.claude_client)
+        results = runner.run(requests)
+
+        documents = []
+        for custom_id, (prompt, context, request) in zip(requests, jobs):
+            self.citation_manager = CitationManager()
+            result = results[custom_id]
+            if result.ok:
+                content = result.text
+                self._extract_citations_from_content(content, context)
+            else:
+                print(f"  Batch request failed ({request.topic or request.page_id}): {result.error}")
+                print("  Falling back to template...")
+                content = self._generate_template(prompt, context, request)
+            documents.append(self._assemble_document(content, request))
+
+        return documents
+
+    def _batch_runner_class(self):
+        """MessageBatchRunner from the repo-root module shared with the refinery."""
+        from message_batches import MessageBatchRunner
+        return MessageBatchRunner
+
+    def _assemble_document(
+        self,
+        content: str,
+        request: 'ResearchRequest',
+    ) -> 'GeneratedDocument':
+        """Combine generated content with the tracked citations."""
+        from ..orchestrator import GeneratedDocument
+
         # Get footnotes and bibliography
         footnotes = self.citation_manager.generate_footnotes()
         bibliography = self.citation_manager.generate_bibliography()
@@ -243,12 +301,38 @@ class Writer:
         request: 'ResearchRequest',
     ) -> str:
         """Generate document using Claude API."""
+        params = self._build_claude_request(prompt, context, request)
+
+        try:
+            response = self.claude_client.messages.create(**params)
+
+            content = response.content[0].text
+
+            # Track citations from the generated content
+            self._extract_citations_from_content(content, context)
+
+            return content
+
+        except Exception as e:
+            print(f"  Claude API error: {e}")
+            print("  Falling back to template...")
+            return self._generate_template(prompt, context, request)
+
+    def _build_claude_request(
+        self,
+        prompt: 'StructuredPrompt',
+        context: 'ResearchContext',
+        request: 'ResearchRequest',
+    ) -> Dict:
+        """Build messages.create() params for one document."""
 
         # Load methodology
         methodology = self._load_methodology()
 
         # Load editorial memory (learned preferences from human edits)
-        editorial_memory = self._get_editorial_memory()
+        editorial_memory = self._get_editorial_memory(
+            f"{request.topic or ''}\n{request.draft_content}"
+        )
 
         # Build context section from RAG results
         context_section = self._format_context_for_claude(context)
@@ -314,25 +398,12 @@ Now write the {request.format} document. Start with the content directly (no pre
 Include [^n] footnote markers for citations, and define them at the end.
 """
 
-        try:
-            response = self.claude_client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-            )
-
-            content = response.content[0].text
-
-            # Track citations from the generated content
-            self._extract_citations_from_content(content, context)
-
-            return content
-
-        except Exception as e:
-            print(f"  Claude API error: {e}")
-            print("  Falling back to template...")
-            return self._generate_template(prompt, context, request)
+        return {
+            "model": "claude-sonnet-4-20250514",
+            "max_tokens": 4096,
+            "system": system_prompt,
+            "messages": [{"role": "user", "content": user_prompt}],
+        }
 
     def _load_methodology(self) -> str:
         """Load research methodology from prompts."""
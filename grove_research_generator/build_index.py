@@ -2,15 +2,28 @@
 """
 Build LEANN index for Grove knowledge base.
 
+The index is maintained incrementally: a manifest next to it
+(grove-knowledge.leann.manifest.json) records each file's content hash and
+chunk IDs, so a run only embeds chunks that are new, tombstones chunks that
+disappeared, and rebuilds from scratch once tombstones pass a threshold.
+Files are streamed through the structure-aware chunker (chunker.py), so
+chunks follow sections and carry their heading path.
+
 Usage:
     python -m grove_research_generator.build_index
     python -m grove_research_generator.build_index --docs-dir ./custom-docs
+    python -m grove_research_generator.build_index --full
 """
 
 import argparse
+import hashlib
+import json
+import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+from .chunker import DEFAULT_MAX_TOKENS, DEFAULT_OVERLAP, iter_markdown_chunks
 
 # Add leann-repo to path
 LEANN_PATH = Path(__file__).parent.parent / "leann-repo" / "packages" / "leann-core" / "src"
@@ -23,59 +36,191 @@ except ImportError:
     LEANN_AVAILABLE = False
     print("Warning: LEANN not available. Install with: pip install leann")
 
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 2  # 2: structure-aware token chunks
+TOMBSTONE_THRESHOLD = 0.2  # Compact (full rebuild) past this fraction of dead chunks
+EMBED_BATCH = 256          # Chunks appended per update_index call
+
+
+def chunk_id(source: str, text: str) -> str:
+    """Content-addressed chunk ID: unchanged chunks keep their ID (and vector)."""
+    return hashlib.sha1(f"{source}\0{text}".encode("utf-8")).hexdigest()[:16]
+
+
+def file_chunks(
+    md_file: Path,
+    docs_dir: Path,
+    chunk_size: int = DEFAULT_MAX_TOKENS,
+    chunk_overlap: int = DEFAULT_OVERLAP,
+    hasher=None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream one markdown file as {id, text, metadata} chunk records.
+
+    The file is read line by line through the structure-aware chunker; if
+    `hasher` is given it is fed the file content along the way (complete
+    once the generator is exhausted).
+    """
+    source = str(md_file.relative_to(docs_dir))
+    seen: Dict[str, int] = {}
+
+    with open(md_file, encoding="utf-8") as f:
+        lines = f if hasher is None else _hashed(f, hasher)
+        for chunk in iter_markdown_chunks(lines, chunk_size, chunk_overlap):
+            cid = chunk_id(source, chunk["text"])
+            # Repeated identical chunks within a file still need distinct IDs
+            seen[cid] = seen.get(cid, 0) + 1
+            if seen[cid] > 1:
+                cid = f"{cid}-{seen[cid]}"
+            yield {
+                "id": cid,
+                "text": chunk["text"],
+                "metadata": {
+                    "title": chunk["title"] or md_file.stem,
+                    "section": " > ".join(chunk["section"]),
+                    "source": source,
+                    "path": str(md_file),
+                    "type": "grove_documentation",
+                    "chunk_id": cid,
+                    "chunk_index": chunk["index"],
+                },
+            }
+
+
+def _hashed(lines: Iterable[str], hasher) -> Iterator[str]:
+    for line in lines:
+        hasher.update(line.encode("utf-8"))
+        yield line
+
+
+# ============================================================================
+# Manifest
+# ============================================================================
+
+def manifest_path(output_path: Path) -> Path:
+    """Manifest lives next to the LEANN index files."""
+    return Path(f"{output_path}{MANIFEST_SUFFIX}")
+
+
+def load_manifest(output_path: Path) -> Optional[Dict[str, Any]]:
+    path = manifest_path(output_path)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def save_manifest(output_path: Path, manifest: Dict[str, Any]) -> None:
+    """Write the manifest atomically (tmp file + replace)."""
+    path = manifest_path(output_path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    os.replace(tmp, path)
+
 
-def load_markdown_files(docs_dir: Path) -> List[Dict[str, Any]]:
-    """Load markdown files and extract metadata."""
-    chunks = []
+def new_manifest(embedding_model: str, chunk_size: int, chunk_overlap: int) -> Dict[str, Any]:
+    return {
+        "version": MANIFEST_VERSION,
+        "embedding_model": embedding_model,
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "files": {},       # path -> {mtime_ns, size, hash, chunks: [chunk_id, ...]}
+        "tombstones": [],  # chunk IDs still in the index but no longer live
+    }
 
-    for md_file in docs_dir.glob("**/*.md"):
-        if md_file.name.startswith("."):
+
+def tombstone_ratio(manifest: Dict[str, Any]) -> float:
+    live = sum(len(entry["chunks"]) for entry in manifest["files"].values())
+    dead = len(manifest["tombstones"])
+    return dead / (live + dead) if live + dead else 0.0
+
+
+def iter_markdown_files(docs_dirs: List[Path]):
+    """(docs_dir, md_file) pairs for every indexable markdown file."""
+    for docs_dir in docs_dirs:
+        if not docs_dir.exists():
+            print(f"Warning: Directory not found: {docs_dir}")
             continue
+        for md_file in docs_dir.glob("**/*.md"):
+            if not md_file.name.startswith("."):
+                yield docs_dir, md_file
 
-        content = md_file.read_text(encoding="utf-8")
-
-        # Extract title from first heading
-        title = md_file.stem
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip()
-                break
-
-        # Create chunk with metadata
-        chunks.append({
-            "text": content,
-            "metadata": {
-                "title": title,
-                "source": str(md_file.relative_to(docs_dir)),
-                "path": str(md_file),
-                "type": "grove_documentation",
-            }
-        })
 
-    return chunks
+# ============================================================================
+# Build
+# ============================================================================
 
+def _new_builder(embedding_model: str):
+    # Non-compact, stored-embedding HNSW so later runs can append with update_index
+    return LeannBuilder(
+        embedding_model=embedding_model,
+        backend_name="hnsw",
+        is_compact=False,
+        is_recompute=False,
+    )
 
-def chunk_text(text: str, chunk_size: int = 512, overlap: int = 128) -> List[str]:
-    """Split text into overlapping chunks."""
-    words = text.split()
-    chunks = []
 
-    for i in range(0, len(words), chunk_size - overlap):
-        chunk = " ".join(words[i:i + chunk_size])
-        if chunk.strip():
-            chunks.append(chunk)
+def rebuild_grove_index(
+    docs_dirs: List[Path],
+    output_path: Path,
+    embedding_model: str,
+    chunk_size: int,
+    chunk_overlap: int,
+) -> Dict[str, Any]:
+    """Embed every chunk and write a fresh index and manifest (no tombstones)."""
+    manifest = new_manifest(embedding_model, chunk_size, chunk_overlap)
+    builder = _new_builder(embedding_model)
 
-    return chunks
+    total_chunks = 0
+    for docs_dir, md_file in iter_markdown_files(docs_dirs):
+        stat = md_file.stat()
+        hasher = hashlib.sha256()
+        chunk_ids = []
+        for record in file_chunks(md_file, docs_dir, chunk_size, chunk_overlap, hasher):
+            builder.add_text(record["text"], metadata=record["metadata"])
+            chunk_ids.append(record["id"])
+        manifest["files"][str(md_file)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": hasher.hexdigest(),
+            "chunks": chunk_ids,
+        }
+        total_chunks += len(chunk_ids)
+
+    if not total_chunks:
+        print("ERROR: No documents found to index.")
+        sys.exit(1)
+
+    print(f"Total documents: {len(manifest['files'])}")
+    print(f"Total chunks: {total_chunks}")
+    builder.build_index(str(output_path))
+    save_manifest(output_path, manifest)
+    return manifest
 
 
 def build_grove_index(
     docs_dirs: List[Path],
     output_path: Path,
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
-    chunk_size: int = 512,
-    chunk_overlap: int = 128,
+    chunk_size: int = DEFAULT_MAX_TOKENS,
+    chunk_overlap: int = DEFAULT_OVERLAP,
+    full: bool = False,
+    tombstone_threshold: float = TOMBSTONE_THRESHOLD,
+    embed_batch: int = EMBED_BATCH,
 ) -> None:
-    """Build LEANN index from Grove documentation."""
+    """
+    Build or incrementally update the LEANN index for Grove documentation.
+
+    Files whose size/mtime and content hash match the manifest are skipped.
+    Chunks of changed files are diffed by ID: only new chunks are embedded
+    (appended in batches of `embed_batch`), and chunks that disappeared are
+    tombstoned. Researcher filters tombstoned chunks out of search results.
+    The index is rebuilt from scratch when there is no compatible index yet,
+    when `full` is set, or once tombstones exceed `tombstone_threshold` of
+    all indexed chunks.
+    """
 
     if not LEANN_AVAILABLE:
         print("ERROR: LEANN is not installed.")
@@ -87,50 +232,109 @@ def build_grove_index(
     print(f"Embedding model: {embedding_model}")
     print()
 
-    # Collect all documents
-    all_docs = []
-    for docs_dir in docs_dirs:
-        if docs_dir.exists():
-            docs = load_markdown_files(docs_dir)
-            print(f"Loaded {len(docs)} documents from {docs_dir}")
-            all_docs.extend(docs)
-        else:
-            print(f"Warning: Directory not found: {docs_dir}")
-
-    if not all_docs:
-        print("ERROR: No documents found to index.")
-        sys.exit(1)
-
-    print(f"\nTotal documents: {len(all_docs)}")
-
-    # Build index
-    print("\nBuilding index...")
-    builder = LeannBuilder(
-        embedding_model=embedding_model,
-        backend_name="hnsw",
+    manifest = load_manifest(output_path)
+    compatible = (
+        manifest is not None
+        and manifest.get("version") == MANIFEST_VERSION
+        and manifest.get("embedding_model") == embedding_model
+        and manifest.get("chunk_size") == chunk_size
+        and manifest.get("chunk_overlap") == chunk_overlap
+        and Path(f"{output_path}.meta.json").exists()
+        and hasattr(LeannBuilder, "update_index")
     )
+    if full or not compatible:
+        print("Full rebuild" + ("" if full else " (no compatible index/manifest)"))
+        rebuild_grove_index(docs_dirs, output_path, embedding_model, chunk_size, chunk_overlap)
+        print(f"\nIndex saved to: {output_path}")
+        print("Done!")
+        return
+
+    # Diff the corpus against the manifest
+    old_files = manifest["files"]
+    tombstones = set(manifest["tombstones"])
+    changed = []  # (path, new entry, records to embed)
+    seen_paths = set()
+    unchanged = 0
+    for docs_dir, md_file in iter_markdown_files(docs_dirs):
+        key = str(md_file)
+        seen_paths.add(key)
+        stat = md_file.stat()
+        entry = old_files.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            unchanged += 1
+            continue
 
-    total_chunks = 0
-    for doc in all_docs:
-        # Chunk the document
-        chunks = chunk_text(doc["text"], chunk_size, chunk_overlap)
-
-        for chunk in chunks:
-            # Add chunk with metadata
-            builder.add_text(
-                chunk,
-                metadata={
-                    **doc["metadata"],
-                    "chunk_index": total_chunks,
-                }
-            )
-            total_chunks += 1
-
-    print(f"Total chunks: {total_chunks}")
+        # One streaming pass chunks and hashes the file
+        hasher = hashlib.sha256()
+        records = list(file_chunks(md_file, docs_dir, chunk_size, chunk_overlap, hasher))
+        digest = hasher.hexdigest()
+        if entry and entry["hash"] == digest:
+            # Touched but identical - just refresh the stat fingerprint
+            entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            unchanged += 1
+            continue
 
-    # Build and save
-    builder.build_index(str(output_path))
-    print(f"\nIndex saved to: {output_path}")
+        indexed = set(entry["chunks"]) if entry else set()
+        changed.append((key, {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": digest,
+            "chunks": [record["id"] for record in records],
+        }, [record for record in records
+            if record["id"] not in indexed and record["id"] not in tombstones]))
+
+    removed = [key for key in old_files if key not in seen_paths]
+    to_embed = sum(len(records) for _, _, records in changed)
+    print(f"Unchanged files: {unchanged}, changed/new: {len(changed)}, removed: {len(removed)}")
+    print(f"Chunks to embed: {to_embed}")
+
+    # Removed files: every chunk becomes a tombstone
+    for key in removed:
+        tombstones.update(old_files.pop(key)["chunks"])
+
+    # Would this update push the index past the compaction threshold?
+    projected = {**old_files, **{key: entry for key, entry, _ in changed}}
+    for key, entry, _ in changed:
+        if key in old_files:
+            tombstones.update(set(old_files[key]["chunks"]) - set(entry["chunks"]))
+        # Chunks that came back reuse their (tombstoned) vectors
+        tombstones.difference_update(entry["chunks"])
+    if tombstone_ratio({"files": projected, "tombstones": tombstones}) > tombstone_threshold:
+        print(f"Tombstones above {tombstone_threshold:.0%} - compacting with a full rebuild")
+        rebuild_grove_index(docs_dirs, output_path, embedding_model, chunk_size, chunk_overlap)
+        print(f"\nIndex saved to: {output_path}")
+        print("Done!")
+        return
+
+    # Append new chunks in batches; a file's entry is recorded once all of
+    # its chunks are in the index, so an interrupted run resumes cleanly.
+    # A crash between update_index and save_manifest re-embeds that batch
+    # next run; Researcher drops the duplicate chunk IDs at search time.
+    manifest["tombstones"] = sorted(tombstones)
+    batch_files, batch_records = [], []
+
+    def flush():
+        if batch_records:
+            builder = _new_builder(embedding_model)
+            for record in batch_records:
+                builder.add_text(record["text"], metadata=record["metadata"])
+            builder.update_index(str(output_path))
+            print(f"  Embedded {len(batch_records)} chunks")
+        for key, entry in batch_files:
+            old_files[key] = entry
+        save_manifest(output_path, manifest)
+        batch_files.clear()
+        batch_records.clear()
+
+    for key, entry, records in changed:
+        batch_files.append((key, entry))
+        batch_records.extend(records)
+        if len(batch_records) >= embed_batch:
+            flush()
+    flush()
+
+    print(f"Tombstones: {len(tombstones)} ({tombstone_ratio(manifest):.1%})")
+    print(f"\nIndex updated: {output_path}")
     print("Done!")
 
 
@@ -160,14 +364,25 @@ def main():
     parser.add_argument(
         "--chunk-size",
         type=int,
-        default=512,
-        help="Chunk size in words",
+        default=DEFAULT_MAX_TOKENS,
+        help="Maximum chunk size in tokens",
     )
     parser.add_argument(
         "--chunk-overlap",
         type=int,
-        default=128,
-        help="Chunk overlap in words",
+        default=DEFAULT_OVERLAP,
+        help="Token overlap when splitting an oversized paragraph",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild from scratch instead of updating incrementally",
+    )
+    parser.add_argument(
+        "--tombstone-threshold",
+        type=float,
+        default=TOMBSTONE_THRESHOLD,
+        help="Fraction of dead chunks that triggers a full rebuild",
     )
 
     args = parser.parse_args()
@@ -194,6 +409,8 @@ def main():
         embedding_model=args.embedding_model,
         chunk_size=args.chunk_size,
         chunk_overlap=args.chunk_overlap,
+        full=args.full,
+        tombstone_threshold=args.tombstone_threshold,
     )
 
 
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Structure-aware streaming chunker for Grove markdown.
+
+Reads a document line by line and yields chunks lazily, so memory stays
+flat however large the corpus. Chunks follow the document's structure:
+
+- A chunk never spans two sections; each carries its heading path
+  (e.g. ["Trellis Architecture", "Agents", "Pruning"]) and starts with a
+  breadcrumb line so the embedding knows where the text came from.
+- Paragraphs, list runs, fenced code blocks and tables are kept whole and
+  packed together up to the token limit.
+- Only a block that alone exceeds the limit is split: code and tables on
+  line boundaries (tables repeat their header row), prose on a sliding
+  token window with overlap.
+- YAML frontmatter is skipped.
+
+Token counts are an approximation (words and punctuation), which tracks
+sentence-transformer wordpieces closely enough for sizing.
+
+Usage:
+    with open(path, encoding="utf-8") as f:
+        for chunk in iter_markdown_chunks(f, max_tokens=256):
+            chunk["text"], chunk["section"]
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_MAX_TOKENS = 256  # all-MiniLM-L6-v2 truncates at 256 wordpieces
+DEFAULT_OVERLAP = 32      # Overlap when splitting an oversized paragraph
+
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+def count_tokens(text: str) -> int:
+    """Approximate token count: words plus punctuation marks."""
+    return sum(1 for _ in _TOKEN.finditer(text))
+
+
+def iter_blocks(lines: Iterable[str]) -> Iterator[Tuple[str, str, int]]:
+    """
+    Group markdown lines into structural blocks.
+
+    Yields (kind, text, level) where kind is 'heading' (level = 1-6),
+    'code', 'table' or 'text' (level = 0).
+    """
+    kind = None   # block being accumulated
+    buf: List[str] = []
+    fence = None
+    first = True
+    in_frontmatter = False
+
+    def flush():
+        nonlocal kind
+        if buf and kind:
+            text = "\n".join(buf).strip("\n")
+            if text.strip():
+                yield kind, text, 0
+        buf.clear()
+        kind = None
+
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+
+        # Frontmatter: a leading --- ... --- block
+        if first:
+            first = False
+            if line.strip() == "---":
+                in_frontmatter = True
+                continue
+        if in_frontmatter:
+            if line.strip() in ("---", "..."):
+                in_frontmatter = False
+            continue
+
+        if fence:
+            buf.append(line)
+            if line.strip().startswith(fence):
+                yield from flush()
+                fence = None
+            continue
+
+        fence_match = _FENCE.match(line)
+        if fence_match:
+            yield from flush()
+            fence = fence_match.group(1)
+            kind = "code"
+            buf.append(line)
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            yield from flush()
+            yield "heading", heading.group(2), len(heading.group(1))
+            continue
+
+        if not line.strip():
+            yield from flush()
+            continue
+
+        line_kind = "table" if line.lstrip().startswith("|") else "text"
+        if kind and kind != line_kind:
+            yield from flush()
+        kind = line_kind
+        buf.append(line)
+
+    yield from flush()
+
+
+def _split_lines(text: str, max_tokens: int, repeat_header: bool) -> Iterator[str]:
+    """Split a code block or table on line boundaries."""
+    lines = text.split("\n")
+    header: List[str] = []
+    if repeat_header and len(lines) > 2 and set(lines[1].replace("|", "").strip()) <= set("-: "):
+        header, lines = lines[:2], lines[2:]
+    header_tokens = count_tokens("\n".join(header))
+
+    part: List[str] = []
+    tokens = header_tokens
+    for line in lines:
+        line_tokens = count_tokens(line)
+        if part and tokens + line_tokens > max_tokens:
+            yield "\n".join(header + part)
+            part, tokens = [], header_tokens
+        part.append(line)
+        tokens += line_tokens
+    if part:
+        yield "\n".join(header + part)
+
+
+def _split_words(text: str, max_tokens: int, overlap: int) -> Iterator[str]:
+    """Split prose on a sliding window of roughly max_tokens tokens."""
+    words = text.split()
+    # Window in words, scaled so the window's token count fits the limit
+    ratio = max(1.0, count_tokens(text) / max(1, len(words)))
+    size = max(1, int(max_tokens / ratio))
+    step = max(1, size - int(overlap / ratio))
+    for start in range(0, len(words), step):
+        yield " ".join(words[start:start + size])
+        if start + size >= len(words):
+            break
+
+
+def iter_markdown_chunks(
+    lines: Iterable[str],
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    overlap: int = DEFAULT_OVERLAP,
+) -> Iterator[Dict]:
+    """
+    Yield chunks of a markdown document as it is read.
+
+    Each chunk is a dict with:
+        text      breadcrumb line + packed block text (what gets embedded)
+        section   heading path, outermost first
+        title     the document's first H1 seen so far (None before it)
+        index     chunk number within the document
+        tokens    approximate token count of text
+    """
+    section: List[str] = []
+    levels: List[int] = []
+    title: Optional[str] = None
+    parts: List[str] = []
+    used = 0
+    index = 0
+
+    def breadcrumb() -> str:
+        return " > ".join(section)
+
+    def budget() -> int:
+        # Room left for body text once the breadcrumb is counted
+        return max(1, max_tokens - count_tokens(breadcrumb()))
+
+    def emit(body: str) -> Dict:
+        nonlocal index
+        crumb = breadcrumb()
+        text = f"{crumb}\n\n{body}" if crumb else body
+        chunk = {
+            "text": text,
+            "section": list(section),
+            "title": title,
+            "index": index,
+            "tokens": count_tokens(text),
+        }
+        index += 1
+        return chunk
+
+    def flush() -> Iterator[Dict]:
+        nonlocal used
+        if parts:
+            yield emit("\n\n".join(parts))
+        parts.clear()
+        used = 0
+
+    for kind, text, level in iter_blocks(lines):
+        if kind == "heading":
+            yield from flush()
+            while levels and levels[-1] >= level:
+                levels.pop()
+                section.pop()
+            levels.append(level)
+            section.append(text)
+            if level == 1 and title is None:
+                title = text
+            continue
+
+        tokens = count_tokens(text)
+        limit = budget()
+        if tokens > limit:
+            # Oversized block: emit what we have, then the block in pieces
+            yield from flush()
+            if kind == "text":
+                pieces = _split_words(text, limit, overlap)
+            else:
+                pieces = _split_lines(text, limit, repeat_header=(kind == "table"))
+            for piece in pieces:
+                yield emit(piece)
+            continue
+
+        if used + tokens > limit:
+            yield from flush()
+        parts.append(text)
+        used += tokens
+
+    yield from flush()
@@ -8,6 +8,7 @@ Usage:
     python -m grove_research_generator test
     python -m grove_research_generator generate --draft draft.md --direction "turn into blog about X"
     python -m grove_research_generator generate --topic "Distributed Inference" --format blog
+    python -m grove_research_generator generate-batch drafts/*.md --direction "turn into blog" --output-dir out/
 """
 
 import argparse
@@ -110,6 +111,39 @@ def cmd_generate(args):
                 print(f"  - {issue}")
 
 
+def cmd_generate_batch(args):
+    """Generate documents for many drafts with one Message Batch."""
+    config = get_config()
+    orchestrator = ResearchOrchestrator(config)
+
+    requests = []
+    for draft in args.drafts:
+        draft_path = Path(draft)
+        if not draft_path.exists():
+            print(f"ERROR: Draft file not found: {draft_path}")
+            sys.exit(1)
+        direction = args.direction or f"@atlas create a {args.format} about {draft_path.stem}"
+        request = orchestrator.parse_research_request(
+            page_id=draft_path.stem,
+            draft_content=draft_path.read_text(encoding="utf-8"),
+            comment_text=direction,
+        )
+        requests.append(request)
+
+    documents = orchestrator.generate_documents(requests)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for request, document in zip(requests, documents):
+        output_path = output_dir / f"{request.page_id}.md"
+        output_path.write_text(document.to_markdown(), encoding="utf-8")
+        print(f"Saved to: {output_path}")
+
+        if not args.dry_run:
+            validation = orchestrator.validate_document(document, request)
+            print(f"  Validation: {validation.status}")
+
+
 def cmd_validate(args):
     """Validate an existing document."""
     config = get_config()
@@ -163,6 +197,7 @@ def cmd_build_index(args):
         embedding_model=args.embedding_model,
         chunk_size=args.chunk_size,
         chunk_overlap=args.chunk_overlap,
+        full=args.full,
     )
 
 
@@ -191,6 +226,23 @@ def main():
     gen_parser.add_argument("--dry-run", action="store_true", help="Skip validation")
     gen_parser.set_defaults(func=cmd_generate)
 
+    # generate-batch command
+    batch_parser = subparsers.add_parser(
+        "generate-batch",
+        help="Generate documents for many drafts via Message Batches (half price, slower)",
+    )
+    batch_parser.add_argument("drafts", nargs="+", help="Draft markdown files")
+    batch_parser.add_argument("--direction", help="User direction applied to every draft")
+    batch_parser.add_argument(
+        "--format",
+        choices=["blog", "whitepaper", "deep_dive"],
+        default="blog",
+        help="Document format",
+    )
+    batch_parser.add_argument("--output-dir", "-o", required=True, help="Output directory")
+    batch_parser.add_argument("--dry-run", action="store_true", help="Skip validation")
+    batch_parser.set_defaults(func=cmd_generate_batch)
+
     # validate command
     val_parser = subparsers.add_parser("validate", help="Validate existing document")
     val_parser.add_argument("document", help="Path to document to validate")
@@ -205,8 +257,11 @@ def main():
         default="sentence-transformers/all-MiniLM-L6-v2",
         help="Embedding model to use",
     )
-    idx_parser.add_argument("--chunk-size", type=int, default=512, help="Chunk size")
-    idx_parser.add_argument("--chunk-overlap", type=int, default=128, help="Chunk overlap")
+    idx_parser.add_argument("--chunk-size", type=int, default=256, help="Chunk size in tokens")
+    idx_parser.add_argument("--chunk-overlap", type=int, default=32,
+                            help="Token overlap when splitting an oversized paragraph")
+    idx_parser.add_argument("--full", action="store_true",
+                            help="Rebuild from scratch instead of updating incrementally")
     idx_parser.set_defaults(func=cmd_build_index)
 
     args = parser.parse_args()
@@ -206,6 +206,31 @@ class ResearchOrchestrator:
         print(f"  Generated: {document.word_count} words")
         return document
 
+    def generate_documents(
+        self,
+        requests: List[ResearchRequest],
+        use_rag: bool = True,
+    ) -> List[GeneratedDocument]:
+        """
+        Generate many documents with one Message Batch for the Claude calls.
+
+        Prompt building and RAG retrieval run per request as in
+        generate_document(); only the writer step is batched.
+        """
+        jobs = []
+        for request in requests:
+            prompt = self.prompt_builder.build(request)
+            context = ResearchContext()
+            if use_rag and self.config.leann_index_path:
+                context = self.researcher.get_context(request)
+            jobs.append((prompt, context, request))
+
+        print(f"Generating {len(jobs)} documents via Message Batches...")
+        documents = self.writer.generate_batch(jobs)
+        for request, document in zip(requests, documents):
+            print(f"  {request.topic or request.page_id}: {document.word_count} words")
+        return documents
+
     def validate_document(
         self,
         document: GeneratedDocument,
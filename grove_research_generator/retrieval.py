@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Batched LEANN retrieval with query caches.
+
+A research request asks the index several questions at once (the topic
+plus a few concepts from the draft). The Retriever answers them together:
+
+- Queries missing from the embedding cache are embedded in one batch with
+  the index's own embedding model, instead of one model call per search.
+- The vector searches then run concurrently on a small thread pool.
+- Query embeddings and result lists are kept in process-wide LRU caches.
+  Embeddings are keyed by model, so they survive index rebuilds; result
+  lists are keyed by index version, so an updated index is never served
+  stale hits.
+
+The batched path calls into the searcher's backend (the grove index is
+built with stored embeddings, see build_index.py). If that is unavailable
+for a given LEANN install, each query falls back to LeannSearcher.search,
+still concurrent and still result-cached.
+
+Usage:
+    retriever = Retriever(searcher, index_version="...")
+    topic_hits, concept_hits = retriever.search_many([("Trellis", 10), ("Ratchet", 5)])
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Hashable, List, Optional, Sequence, Tuple
+
+DEFAULT_WORKERS = 4
+EMBEDDING_CACHE_SIZE = 1024
+RESULT_CACHE_SIZE = 256
+
+
+class LRUCache:
+    """Small thread-safe least-recently-used mapping."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Shared by every Retriever in the process
+_embedding_cache = LRUCache(EMBEDDING_CACHE_SIZE)
+_result_cache = LRUCache(RESULT_CACHE_SIZE)
+
+
+def clear_caches():
+    """Drop cached query embeddings and result lists."""
+    _embedding_cache.clear()
+    _result_cache.clear()
+
+
+class Retriever:
+    """Runs a set of queries against one LEANN searcher as a batch."""
+
+    def __init__(self, searcher, index_version: Hashable = None,
+                 workers: int = DEFAULT_WORKERS):
+        self.searcher = searcher
+        self.index_version = index_version
+        self.workers = workers
+        self._batched = all(hasattr(searcher, attr) for attr in
+                            ("backend_impl", "passage_manager", "embedding_model"))
+
+    @property
+    def model(self) -> str:
+        return getattr(self.searcher, "embedding_model", "")
+
+    def embed(self, queries: Sequence[str]) -> List[Any]:
+        """Query vectors, embedding only the uncached ones, in one batch."""
+        vectors = [_embedding_cache.get((self.model, q)) for q in queries]
+        missing = list(dict.fromkeys(q for q, v in zip(queries, vectors) if v is None))
+        if missing:
+            from leann.api import compute_embeddings
+            mode = getattr(self.searcher, "embedding_mode", "sentence-transformers")
+            computed = compute_embeddings(missing, self.model, mode=mode, use_server=False)
+            fresh = dict(zip(missing, computed))
+            for query, vector in fresh.items():
+                _embedding_cache.put((self.model, query), vector)
+            vectors = [v if v is not None else fresh[q] for q, v in zip(queries, vectors)]
+        return vectors
+
+    def search_many(self, queries: Sequence[Tuple[str, int]]) -> List[List]:
+        """
+        Results for each (query, top_k), in order.
+
+        Cached result lists are returned as-is; the rest are embedded in
+        one batch and searched concurrently.
+        """
+        keys = [(self.index_version, query, top_k) for query, top_k in queries]
+        results: List[Optional[List]] = [_result_cache.get(key) for key in keys]
+        todo = [i for i, r in enumerate(results) if r is None]
+        if not todo:
+            return results
+
+        pending = [queries[i] for i in todo]
+        found = None
+        if self._batched:
+            try:
+                vectors = self.embed([query for query, _ in pending])
+                found = self._map(self._search_vector,
+                                  [(vector, top_k) for vector, (_, top_k) in zip(vectors, pending)])
+            except Exception as e:
+                print(f"  Batched search unavailable ({e}) - searching per query")
+                self._batched = False
+        if found is None:
+            found = self._map(self._search_text, pending)
+
+        for i, hits in zip(todo, found):
+            _result_cache.put(keys[i], hits)
+            results[i] = hits
+        return results
+
+    def _map(self, fn, args: List[Tuple]) -> List[List]:
+        if len(args) == 1 or self.workers <= 1:
+            return [fn(*a) for a in args]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(args))) as pool:
+            return list(pool.map(lambda a: fn(*a), args))
+
+    def _search_text(self, query: str, top_k: int) -> List:
+        return self.searcher.search(query, top_k=top_k)
+
+    def _search_vector(self, vector, top_k: int) -> List:
+        """What LeannSearcher.search does after embedding the query."""
+        from leann.api import SearchResult
+
+        raw = self.searcher.backend_impl.search(
+            vector.reshape(1, -1), top_k, recompute_embeddings=False,
+        )
+        hits = []
+        for string_id, distance in zip(raw["labels"][0], raw["distances"][0]):
+            passage = self.searcher.passage_manager.get_passage(string_id)
+            hits.append(SearchResult(
+                id=string_id,
+                score=float(distance),
+                text=passage["text"],
+                metadata=passage.get("metadata", {}),
+            ))
+        return hits
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Message Batches
+
+Shared by grove_docs_refinery (bulk rewrites/reviews) and
+grove_research_generator (Writer.generate_batch).
+
+Runs many independent Claude requests through the Message Batches API
+instead of one synchronous call each. Batches are billed at half price and
+don't compete with interactive traffic for rate limits; the trade-off is
+latency (results arrive within 24 hours, usually much sooner).
+
+Usage:
+    runner = MessageBatchRunner()
+    results = runner.run({
+        "doc-a": {"model": ..., "max_tokens": ..., "system": ..., "messages": ...},
+        "doc-b": {...},
+    })
+    results["doc-a"].text
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import anthropic
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one request in a Message Batch."""
+    custom_id: str
+    text: str = ""
+    usage: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class MessageBatchRunner:
+    """Submits message requests as batches and waits for their results."""
+
+    POLL_INTERVAL = 30        # seconds between status checks
+    MAX_BATCH_REQUESTS = 10000  # requests per submitted batch
+    MAX_WAIT = 24 * 3600      # batches expire after 24 hours
+
+    # custom_id must be 1-64 chars of [a-zA-Z0-9_-]
+    _CUSTOM_ID = re.compile(r'^[a-zA-Z0-9_-]{1,64}$')
+
+    def __init__(
+        self,
+        client: Optional[anthropic.Anthropic] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self._client = client or anthropic.Anthropic()
+        self.poll_interval = self.POLL_INTERVAL if poll_interval is None else poll_interval
+
+    def run(self, requests: Dict[str, Dict]) -> Dict[str, BatchResult]:
+        """Run message requests and return their results by custom_id.
+
+        Args:
+            requests: custom_id -> messages.create() params
+
+        Returns:
+            custom_id -> BatchResult (every requested id is present)
+        """
+        for custom_id in requests:
+            if not self._CUSTOM_ID.match(custom_id):
+                raise ValueError(f"Invalid batch custom_id: {custom_id!r}")
+
+        results: Dict[str, BatchResult] = {}
+        ids = list(requests)
+        for start in range(0, len(ids), self.MAX_BATCH_REQUESTS):
+            chunk = ids[start:start + self.MAX_BATCH_REQUESTS]
+            batch_id = self.submit({cid: requests[cid] for cid in chunk})
+            self.wait(batch_id)
+            results.update(self.collect(batch_id))
+
+        # Requests the API never reported on
+        for custom_id in ids:
+            if custom_id not in results:
+                results[custom_id] = BatchResult(custom_id, error="missing from batch results")
+        return results
+
+    def submit(self, requests: Dict[str, Dict]) -> str:
+        """Create a batch and return its id."""
+        batch = self._client.messages.batches.create(requests=[
+            {"custom_id": custom_id, "params": params}
+            for custom_id, params in requests.items()
+        ])
+        print(f"  Submitted message batch {batch.id} ({len(requests)} requests)")
+        return batch.id
+
+    def wait(self, batch_id: str):
+        """Poll until the batch has finished processing."""
+        deadline = time.monotonic() + self.MAX_WAIT
+        while True:
+            batch = self._client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                counts = batch.request_counts
+                print(f"  Batch {batch_id} ended: {counts.succeeded} succeeded, "
+                      f"{counts.errored} errored, {counts.expired} expired")
+                return
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Message batch {batch_id} did not finish")
+            counts = batch.request_counts
+            print(f"  Batch {batch_id}: {counts.processing} processing, "
+                  f"{counts.succeeded} succeeded")
+            time.sleep(self.poll_interval)
+
+    def collect(self, batch_id: str) -> Dict[str, BatchResult]:
+        """Read results for a finished batch."""
+        results = {}
+        for entry in self._client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                message = result.message
+                text = "".join(
+                    block.text for block in message.content if block.type == "text"
+                )
+                results[entry.custom_id] = BatchResult(
+                    entry.custom_id,
+                    text=text,
+                    usage=usage_to_dict(message.usage),
+                )
+            elif result.type == "errored":
+                error = getattr(result.error, "error", result.error)
+                message = getattr(error, "message", None) or str(error)
+                results[entry.custom_id] = BatchResult(
+                    entry.custom_id, error=f"errored: {message}"
+                )
+            else:  # canceled / expired
+                results[entry.custom_id] = BatchResult(entry.custom_id, error=result.type)
+        return results
+
+
+def usage_to_dict(usage) -> Dict[str, int]:
+    """Token usage from an API response, including prompt cache hits/misses."""
+    return {
+        "input_tokens": usage.input_tokens or 0,
+        "output_tokens": usage.output_tokens or 0,
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+    }
+
+
+def batch_ids(names: List[str], prefix: str = "req") -> Dict[str, str]:
+    """Map arbitrary names (e.g. filenames) to valid, unique custom_ids."""
+    return {name: f"{prefix}-{i:05d}" for i, name in enumerate(names)}
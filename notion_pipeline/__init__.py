@@ -5,9 +5,11 @@ Key advantages over MCP tools:
 - Fresh reads (no cache issues)
 - Property filtering on queries
 - Batch operations with rate limiting
+- Shared pooled transport for every Notion caller in the repo
 """
 
 from .client import NotionClient
 from .config import Config
+from .transport import NotionTransport, TokenBucket, get_transport
 
-__all__ = ['NotionClient', 'Config']
+__all__ = ['NotionClient', 'Config', 'NotionTransport', 'TokenBucket', 'get_transport']
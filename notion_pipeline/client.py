@@ -2,11 +2,11 @@
 Notion API client with direct REST calls.
 Bypasses MCP cache - always fresh reads.
 """
-import time
 from typing import Any, Dict, List, Optional
 import requests
 
 from .config import Config
+from .transport import get_transport
 
 
 class NotionClient:
@@ -16,38 +16,19 @@ class NotionClient:
     Key features:
     - Fresh reads (no caching)
     - Property filtering on queries
-    - Built-in rate limiting
+    - Built-in rate limiting (shared transport)
     """
 
-    BASE_URL = 'https://api.notion.com/v1'
-
     def __init__(self, api_key: Optional[str] = None):
         config = Config()
         self.api_key = api_key or config.notion_api_key
         self.databases = config.databases
 
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json',
-            'Notion-Version': '2022-06-28'
-        }
-
-        self._rate_limit_delay = 0.35  # seconds between requests
-        self._last_request_time = 0
-
-    def _rate_limit(self):
-        """Respect Notion rate limits."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._rate_limit_delay:
-            time.sleep(self._rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+        self._transport = get_transport(self.api_key)
 
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make rate-limited request."""
-        self._rate_limit()
-        url = f'{self.BASE_URL}{endpoint}'
-        response = requests.request(method, url, headers=self.headers, **kwargs)
-        return response
+        return self._transport.request(method, endpoint, **kwargs)
 
     # ========== Database Operations ==========
 
@@ -0,0 +1,193 @@
+"""
+Shared Notion HTTP transport.
+
+Every Notion caller in the repo goes through one pooled session per API key:
+- Keep-alive connection pooling (no TLS handshake per request)
+- Token-bucket rate limiting at Notion's 3 req/s average, with bursts
+- Retry-After aware backoff with jitter on 429 and transient errors
+
+Usage:
+    from notion_pipeline.transport import get_transport
+
+    transport = get_transport(api_key)
+    response = transport.request('GET', f'pages/{page_id}')
+"""
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+NOTION_API_BASE = 'https://api.notion.com/v1'
+NOTION_VERSION = '2022-06-28'
+
+# Notion allows an average of 3 requests/second per integration, with bursts
+DEFAULT_RATE = 3.0
+DEFAULT_BURST = 10
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill at `rate` per second up to `burst`. A 429 from the server
+    pauses the bucket for every thread sharing it, not just the caller.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                # _updated may be in the future while paused
+                wait = max(self._updated - now, 0) + (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Drain the bucket and hand out no tokens for `seconds`."""
+        with self._lock:
+            resume_at = time.monotonic() + seconds
+            self._tokens = 0.0
+            self._updated = max(self._updated, resume_at)
+
+
+class NotionTransport:
+    """
+    Pooled, rate-limited Notion HTTP client.
+
+    `request()` returns the final `requests.Response` so callers keep their
+    own status-code handling. Rate limits (429) are retried for any method;
+    5xx and connection errors are only retried for requests that are safe to
+    repeat (reads, deletes, database queries and searches).
+    """
+
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 0.5   # seconds
+    BACKOFF_CAP = 30.0   # seconds
+    TIMEOUT = 30         # seconds
+    TRANSIENT_STATUSES = {500, 502, 503, 504}
+    IDEMPOTENT_METHODS = {'GET', 'HEAD', 'DELETE'}
+
+    def __init__(self, api_key: str, limiter: Optional[TokenBucket] = None,
+                 pool_size: int = 10, base_url: str = NOTION_API_BASE):
+        self.base_url = base_url.rstrip('/')
+        self.limiter = limiter or TokenBucket()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json',
+            'Notion-Version': NOTION_VERSION,
+        })
+
+    def url(self, endpoint: str) -> str:
+        """Resolve an endpoint ('pages/<id>', '/search' or a full URL)."""
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _is_idempotent(self, method: str, url: str) -> bool:
+        if method.upper() in self.IDEMPOTENT_METHODS:
+            return True
+        # Queries and searches are POSTs but don't change anything
+        path = url.split('?', 1)[0].rstrip('/')
+        return method.upper() == 'POST' and (path.endswith('/query') or path.endswith('/search'))
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        return random.uniform(0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * (2 ** attempt)))
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return float(value) + random.uniform(0, self.BACKOFF_BASE)
+        except ValueError:
+            return None
+
+    def request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Make a rate-limited request, retrying rate limits and transient failures."""
+        kwargs.setdefault('timeout', self.TIMEOUT)
+        url = self.url(endpoint)
+        retryable = self._is_idempotent(method, url)
+
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not retryable or attempt >= self.MAX_RETRIES:
+                    raise
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            rate_limited = response.status_code == 429
+            transient = retryable and response.status_code in self.TRANSIENT_STATUSES
+            if not (rate_limited or transient) or attempt >= self.MAX_RETRIES:
+                return response
+
+            delay = self._retry_after(response) or self._backoff(attempt)
+            if rate_limited:
+                # Back off every thread sharing this limiter
+                self.limiter.pause(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
+
+    def get(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request('GET', endpoint, **kwargs)
+
+    def post(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request('POST', endpoint, **kwargs)
+
+    def patch(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request('PATCH', endpoint, **kwargs)
+
+    def delete(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request('DELETE', endpoint, **kwargs)
+
+
+_transports: Dict[str, NotionTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(api_key: str) -> NotionTransport:
+    """
+    Get the process-wide transport for an API key.
+
+    Notion rate limits per integration, so every client using the same key
+    shares one session and one token bucket.
+    """
+    if not api_key:
+        raise ValueError("Notion API key is required")
+    with _transports_lock:
+        transport = _transports.get(api_key)
+        if transport is None:
+            transport = NotionTransport(api_key)
+            _transports[api_key] = transport
+        return transport
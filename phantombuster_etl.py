@@ -12,23 +12,33 @@ Usage:
     python phantombuster_etl.py              # Full sync
     python phantombuster_etl.py --dry-run    # Preview without writing to Notion
     python phantombuster_etl.py --stats      # Show sync stats only
+    python phantombuster_etl.py --refresh-index  # Full reload of the local Hub index
+    python phantombuster_etl.py --full       # Re-read every PhantomBuster record, not just new ones
+    python phantombuster_etl.py --export-sales-nav [--incremental]  # Segment CSVs for Sales Nav
 """
+import codecs
+import csv
 import json
 import os
+import re
+import sqlite3
 import sys
-import time
-from datetime import datetime, timezone
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 
 import requests
 from dotenv import load_dotenv
 
+from notion_pipeline.transport import get_transport
+
 load_dotenv()
 
 # --- Configuration ---
 NOTION_KEY = os.environ.get('NOTION_API_KEY', '')
-PB_API_KEY = os.environ.get('PHANTOMBUSTER_API_KEY', ''')
+PB_API_KEY = os.environ.get('PHANTOMBUSTER_API_KEY', '')
 
 # Notion database IDs
 CONTACTS_DB = '08b9f73264b24e4b82d4c842f5a11cc8'
@@ -45,13 +55,13 @@ PB_AGENTS = {
 PB_S3_BASE = 'https://phantombuster.s3.amazonaws.com/fPnqqqrVtDA'
 
 REQUEST_TIMEOUT = 20
+PB_STREAM_CHUNK = 64 * 1024  # bytes per read when streaming result.json
 SYNC_STATE_FILE = Path(__file__).parent / '.pb_sync_state.json'
+HUB_INDEX_FILE = Path(__file__).parent / '.pb_hub_index.db'
 
-NOTION_HEADERS = {
-    'Authorization': f'Bearer {NOTION_KEY}',
-    'Content-Type': 'application/json',
-    'Notion-Version': '2022-06-28'
-}
+# Concurrent Notion writes (the shared transport enforces the rate limit)
+WRITE_WORKERS = 4
+CHECKPOINT_EVERY = 50  # writes between sync state checkpoints
 
 # --- Degree mapping ---
 DEGREE_MAP = {
@@ -62,6 +72,12 @@ DEGREE_MAP = {
     'Following': 'Following',
 }
 
+# Engagement kind -> Engagements "Type" select
+ENGAGEMENT_TYPES = {
+    'comment': 'Commented on Our Post',
+    'like': 'Liked',
+}
+
 # --- Contact Classification ---
 # Keyword sets for Sector classification (checked against lowercase headline)
 SECTOR_KEYWORDS = {
@@ -128,98 +144,234 @@ BUCKET_SENIOR_TITLES = [
     'evp', 'director', 'partner', 'founder', 'co-founder', 'head of',
     'chief', 'general manager', 'managing director',
 ]
+BUCKET_TECHNICAL_KEYWORDS = [
+    'open source', 'contributor', 'maintainer', 'developer', 'engineer',
+    'architect', 'infrastructure', 'distributed', 'systems',
+]
+BUCKET_ADVISOR_KEYWORDS = [
+    'ai', 'infrastructure', 'platform', 'distributed', 'open source',
+    'venture', 'investor', 'research',
+]
+BUCKET_ENTERPRISE_KEYWORDS = [
+    'enterprise', 'saas', 'b2b', 'platform', 'digital transformation',
+]
+
+# Sectors in priority order (AI/ML first, then specialized, then general)
+SECTOR_PRIORITY = ['AI/ML Specialist', 'Academia', 'Investor', 'Influencer',
+                   'Job Seeker', 'Corporate', 'Tech']
+
+
+# --- Keyword engine ---
+class KeywordAutomaton:
+    """Aho-Corasick automaton over a fixed keyword list.
+
+    One scan of a text reports every keyword it contains as a bitmask
+    (bit i = keywords[i]), replacing a `kw in text` check per keyword.
+    Matching runs over UTF-8 bytes through a flat transition table, so the
+    result is identical to substring checks for any input text.
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = list(dict.fromkeys(keywords))
+        self._bit = {kw: 1 << i for i, kw in enumerate(self.keywords)}
+
+        # Trie over UTF-8 bytes
+        goto: List[Dict[int, int]] = [{}]
+        out = [0]
+        for kw, bit in self._bit.items():
+            state = 0
+            for byte in kw.encode('utf-8'):
+                nxt = goto[state].get(byte)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    out.append(0)
+                    goto[state][byte] = nxt
+                state = nxt
+            out[state] |= bit
+
+        # Bytes that occur in no keyword share column 0 (always back to root)
+        alphabet = sorted({byte for edges in goto for byte in edges})
+        self._width = width = len(alphabet) + 1
+        column = {byte: i + 1 for i, byte in enumerate(alphabet)}
+        self._translate = bytes(column.get(b, 0) for b in range(256))
+
+        # Breadth-first failure links, folded into a full DFA. States are
+        # stored premultiplied by the row width: next = table[state + column].
+        table = [0] * (len(goto) * width)
+        outputs = [0] * (len(goto) * width)
+        fail = [0] * len(goto)
+        queue = []
+        for byte, child in goto[0].items():
+            table[column[byte]] = child * width
+            queue.append(child)
+        for state in queue:  # grows while iterating
+            out[state] |= out[fail[state]]
+            outputs[state * width] = out[state]
+            row, fail_row = state * width, fail[state] * width
+            table[row:row + width] = table[fail_row:fail_row + width]
+            for byte, child in goto[state].items():
+                fail[child] = table[fail_row + column[byte]] // width
+                table[row + column[byte]] = child * width
+                queue.append(child)
+        self._table = table
+        self._outputs = outputs
+
+    def mask(self, keywords: List[str]) -> int:
+        """Bitmask covering the given keywords (all must be compiled in)."""
+        mask = 0
+        for kw in keywords:
+            mask |= self._bit[kw]
+        return mask
+
+    def scan(self, text: str, state: int = 0) -> tuple:
+        """Find every keyword in text.
+
+        Args:
+            text: Text to scan (matched as-is; lowercase it first)
+            state: End state of a previous scan, to continue matching as if
+                the two texts were concatenated
+
+        Returns:
+            (bitmask of keywords found, end state)
+        """
+        table = self._table
+        outputs = self._outputs
+        found = 0
+        for c in text.encode('utf-8').translate(self._translate):
+            state = table[state + c]
+            found |= outputs[state]
+        return found, state
+
+
+class LeadClassifier:
+    """All classification keyword tables compiled into one automaton.
+
+    `classify()` scans each lead's headline and comment once and derives
+    sector, alignment, buckets, priority and Sales Nav status from the
+    resulting keyword bitmask.
+    """
+
+    def __init__(self):
+        tables = [kw for sector in SECTOR_PRIORITY for kw in SECTOR_KEYWORDS[sector]]
+        tables += GROVE_STRONG_KEYWORDS + GROVE_MODERATE_KEYWORDS
+        tables += BUCKET_GOVERNANCE_KEYWORDS + BUCKET_SENIOR_TITLES
+        tables += BUCKET_TECHNICAL_KEYWORDS + BUCKET_ADVISOR_KEYWORDS
+        tables += BUCKET_ENTERPRISE_KEYWORDS
+        self.automaton = ac = KeywordAutomaton(tables)
+
+        self.sector_masks = [(sector, ac.mask(SECTOR_KEYWORDS[sector]))
+                             for sector in SECTOR_PRIORITY]
+        self.strong_mask = ac.mask(GROVE_STRONG_KEYWORDS)
+        self.moderate_mask = ac.mask(GROVE_MODERATE_KEYWORDS)
+        self.governance_mask = ac.mask(BUCKET_GOVERNANCE_KEYWORDS)
+        self.senior_mask = ac.mask(BUCKET_SENIOR_TITLES)
+        self.technical_mask = ac.mask(BUCKET_TECHNICAL_KEYWORDS)
+        self.advisor_mask = ac.mask(BUCKET_ADVISOR_KEYWORDS)
+        self.enterprise_mask = ac.mask(BUCKET_ENTERPRISE_KEYWORDS)
+
+    def scan(self, headline: str, comment_text: str = '') -> tuple:
+        """Keyword bitmasks for (headline alone, headline + comment)."""
+        headline_found, state = self.automaton.scan(f' {headline.lower()} ')
+        if not comment_text:
+            return headline_found, headline_found
+        comment_found, _ = self.automaton.scan(f' {comment_text.lower()} ', state)
+        return headline_found, headline_found | comment_found
+
+    def sector(self, found: int) -> str:
+        for sector, mask in self.sector_masks:
+            if found & mask:
+                return sector
+        return 'Other'
+
+    def alignment(self, found: int, comment_text: str = '',
+                  has_commented: bool = False, has_liked: bool = False) -> str:
+        score = 0
+        score += 3 * (found & self.strong_mask).bit_count()
+        score += (found & self.moderate_mask).bit_count()
+        # Engagement bonuses
+        if has_commented and len(comment_text) > 50:
+            score += 2  # Substantive commenter
+        elif has_commented:
+            score += 1
+        if has_liked:
+            score += 0.5
+
+        if score >= 8:
+            return '\u2b50\u2b50\u2b50\u2b50\u2b50 Strong Thesis Alignment'
+        elif score >= 5:
+            return '\u2b50\u2b50\u2b50\u2b50 Good Alignment'
+        elif score >= 3:
+            return '\u2b50\u2b50\u2b50 Moderate Interest'
+        elif score >= 1:
+            return '\u2b50\u2b50 Peripheral Interest'
+        else:
+            return '\u2b50 Minimal Alignment'
+
+    def buckets(self, found: int, sector: str) -> List[str]:
+        buckets = []
+        senior = found & self.senior_mask
+        if sector == 'Academia':
+            buckets.append('University Pipeline')
+        if sector in ('AI/ML Specialist', 'Tech') and found & self.technical_mask:
+            buckets.append('Technical Contributors')
+        if sector == 'Influencer' or (sector == 'Corporate' and senior):
+            buckets.append('Content Amplifiers')
+        if found & self.governance_mask:
+            buckets.append('Governance/Policy')
+        # Potential Advisors: senior people with relevant backgrounds
+        if senior and found & self.advisor_mask:
+            buckets.append('Potential Advisors')
+        if sector == 'Corporate' and found & self.enterprise_mask:
+            buckets.append('Enterprise Clients')
+        return buckets
+
+    def classify(self, headline: str, comment_text: str = '',
+                 has_commented: bool = False, has_liked: bool = False) -> Dict:
+        headline_found, found = self.scan(headline, comment_text)
+        sector = self.sector(headline_found)
+        alignment = self.alignment(found, comment_text, has_commented, has_liked)
+        buckets = self.buckets(headline_found, sector)
+        return {
+            'sector': sector,
+            'alignment': alignment,
+            'buckets': buckets,
+            'priority': classify_priority(alignment, has_commented, comment_text),
+            'sales_nav': classify_sales_nav_status(sector, buckets),
+        }
+
+
+_classifier: Optional[LeadClassifier] = None
+
+
+def get_classifier() -> LeadClassifier:
+    """Compile the keyword tables on first use."""
+    global _classifier
+    if _classifier is None:
+        _classifier = LeadClassifier()
+    return _classifier
 
 
 def classify_sector(headline: str) -> str:
     """Classify contact into a Sector based on headline keywords."""
-    hl = f' {headline.lower()} '
-    # Check in priority order (AI/ML first, then specialized, then general)
-    for sector in ['AI/ML Specialist', 'Academia', 'Investor', 'Influencer',
-                    'Job Seeker', 'Corporate', 'Tech']:
-        for kw in SECTOR_KEYWORDS[sector]:
-            if kw in hl:
-                return sector
-    return 'Other'
+    classifier = get_classifier()
+    found, _ = classifier.scan(headline)
+    return classifier.sector(found)
 
 
 def classify_grove_alignment(headline: str, comment_text: str = '',
                               has_commented: bool = False, has_liked: bool = False) -> str:
     """Score Grove alignment from 1-5 stars based on headline + engagement signals."""
-    hl = f' {headline.lower()} '
-    ct = f' {comment_text.lower()} ' if comment_text else ''
-    combined = hl + ct
-
-    score = 0
-    # Strong keyword matches
-    for kw in GROVE_STRONG_KEYWORDS:
-        if kw in combined:
-            score += 3
-    # Moderate keyword matches
-    for kw in GROVE_MODERATE_KEYWORDS:
-        if kw in combined:
-            score += 1
-    # Engagement bonuses
-    if has_commented and len(comment_text) > 50:
-        score += 2  # Substantive commenter
-    elif has_commented:
-        score += 1
-    if has_liked:
-        score += 0.5
-
-    if score >= 8:
-        return '\u2b50\u2b50\u2b50\u2b50\u2b50 Strong Thesis Alignment'
-    elif score >= 5:
-        return '\u2b50\u2b50\u2b50\u2b50 Good Alignment'
-    elif score >= 3:
-        return '\u2b50\u2b50\u2b50 Moderate Interest'
-    elif score >= 1:
-        return '\u2b50\u2b50 Peripheral Interest'
-    else:
-        return '\u2b50 Minimal Alignment'
+    classifier = get_classifier()
+    _, found = classifier.scan(headline, comment_text)
+    return classifier.alignment(found, comment_text, has_commented, has_liked)
 
 
 def classify_strategic_buckets(headline: str, sector: str) -> List[str]:
     """Assign zero or more Strategic Buckets based on sector + headline signals."""
-    hl = f' {headline.lower()} '
-    buckets = []
-
-    if sector == 'Academia':
-        buckets.append('University Pipeline')
-    if sector in ('AI/ML Specialist', 'Tech'):
-        for kw in ['open source', 'contributor', 'maintainer', 'developer', 'engineer',
-                    'architect', 'infrastructure', 'distributed', 'systems']:
-            if kw in hl:
-                buckets.append('Technical Contributors')
-                break
-    if sector == 'Influencer' or sector == 'Corporate':
-        # Check for senior influence
-        for kw in BUCKET_SENIOR_TITLES:
-            if kw in hl:
-                buckets.append('Content Amplifiers')
-                break
-        if sector == 'Influencer' and 'Content Amplifiers' not in buckets:
-            buckets.append('Content Amplifiers')
-    for kw in BUCKET_GOVERNANCE_KEYWORDS:
-        if kw in hl:
-            buckets.append('Governance/Policy')
-            break
-    # Potential Advisors: senior people with relevant backgrounds
-    for kw in BUCKET_SENIOR_TITLES:
-        if kw in hl:
-            for akw in ['ai', 'infrastructure', 'platform', 'distributed', 'open source',
-                         'venture', 'investor', 'research']:
-                if akw in hl:
-                    if 'Potential Advisors' not in buckets:
-                        buckets.append('Potential Advisors')
-                    break
-            break
-    if sector == 'Corporate':
-        for kw in ['enterprise', 'saas', 'b2b', 'platform', 'digital transformation']:
-            if kw in hl:
-                buckets.append('Enterprise Clients')
-                break
-
-    return list(dict.fromkeys(buckets))  # dedupe preserving order
+    classifier = get_classifier()
+    found, _ = classifier.scan(headline)
+    return classifier.buckets(found, sector)
 
 
 def classify_priority(alignment: str, has_commented: bool, comment_text: str = '') -> str:
@@ -250,67 +402,171 @@ def classify_sales_nav_status(sector: str, buckets: List[str]) -> str:
     return 'Not Saved'
 
 
+def _lead_signals(lead: Dict) -> tuple:
+    return (
+        lead.get('occupation', ''),
+        lead.get('comments', ''),
+        lead.get('hasCommented') == 'true',
+        lead.get('hasLiked') == 'true',
+    )
+
+
 def classify_contact(lead: Dict) -> Dict:
     """Run full classification pipeline on a lead. Returns dict of Notion property values."""
-    headline = lead.get('occupation', '')
-    comment_text = lead.get('comments', '')
-    has_commented = lead.get('hasCommented') == 'true'
-    has_liked = lead.get('hasLiked') == 'true'
-
-    sector = classify_sector(headline)
-    alignment = classify_grove_alignment(headline, comment_text, has_commented, has_liked)
-    buckets = classify_strategic_buckets(headline, sector)
-    priority = classify_priority(alignment, has_commented, comment_text)
-    sales_nav = classify_sales_nav_status(sector, buckets)
-
-    return {
-        'sector': sector,
-        'alignment': alignment,
-        'buckets': buckets,
-        'priority': priority,
-        'sales_nav': sales_nav,
-    }
+    return get_classifier().classify(*_lead_signals(lead))
+
+
+def classify_contacts(leads: List[Dict]) -> List[Dict]:
+    """Classify a whole lead list; same results as classify_contact per lead.
+
+    Leads with identical headline/comment/engagement signals (the same
+    person liking several posts, stock headlines) are classified once.
+    """
+    classifier = get_classifier()
+    seen: Dict[tuple, Dict] = {}
+    results = []
+    for lead in leads:
+        signals = _lead_signals(lead)
+        result = seen.get(signals)
+        if result is None:
+            result = seen[signals] = classifier.classify(*signals)
+        results.append({**result, 'buckets': list(result['buckets'])})
+    return results
 
 
 # --- Sync state ---
 def load_sync_state() -> Dict:
     if SYNC_STATE_FILE.exists():
         return json.loads(SYNC_STATE_FILE.read_text())
-    return {'synced_contacts': {}, 'synced_engagements': {}, 'synced_posts': {}, 'last_sync': None}
+    return {'synced_contacts': {}, 'synced_engagements': {}, 'synced_posts': {},
+            'pb_cursors': {}, 'last_sync': None}
 
 
 def save_sync_state(state: Dict):
     state['last_sync'] = datetime.now(timezone.utc).isoformat()
-    SYNC_STATE_FILE.write_text(json.dumps(state, indent=2))
+    # Write-then-rename so a crash mid-checkpoint can't truncate the state
+    tmp_file = SYNC_STATE_FILE.with_suffix('.json.tmp')
+    tmp_file.write_text(json.dumps(state, indent=2))
+    tmp_file.replace(SYNC_STATE_FILE)
 
 
 # --- PhantomBuster data fetching ---
-def fetch_pb_results(agent_id: str) -> List[Dict]:
-    """Fetch result.json from a PhantomBuster agent's S3 output."""
+def iter_json_array(chunks: Iterable[str]) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array as its text arrives.
+
+    Only one item (plus the unparsed tail of the current chunk) is held in
+    memory at a time, instead of the whole document.
+    """
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    started = False
+    for chunk in chunks:
+        buf = buf[pos:] + chunk
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buf):
+                break
+            if not started:
+                if buf[pos] != '[':
+                    raise ValueError("Expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # Item continues in the next chunk
+            if end == len(buf):
+                break  # A trailing number may be cut short; wait for more
+            yield item
+            pos = end
+    raise ValueError("Truncated JSON array")
+
+
+def fetch_pb_results(agent_id: str, cursor: Optional[Dict] = None) -> Tuple[List[Dict], Optional[Dict]]:
+    """Fetch lead records from a PhantomBuster agent's S3 result.json.
+
+    With a cursor from a previous run, the GET is conditional (an unchanged
+    output costs a 304 and no download) and only records newer than the
+    cursor's high-water mark are returned.
+
+    Returns:
+        (leads, new cursor) - the cursor is None if the fetch failed
+    """
     s3_folder = PB_AGENTS.get(agent_id)
     if not s3_folder:
         print(f"  WARN: Unknown agent {agent_id}")
-        return []
+        return [], None
+
+    cursor = cursor or {}
+    headers = {}
+    if cursor.get('etag'):
+        headers['If-None-Match'] = cursor['etag']
+    if cursor.get('last_modified'):
+        headers['If-Modified-Since'] = cursor['last_modified']
 
     url = f'{PB_S3_BASE}/{s3_folder}/result.json'
     try:
-        resp = requests.get(url, timeout=REQUEST_TIMEOUT)
-        if resp.status_code == 200:
-            return resp.json()
-        print(f"  WARN: S3 fetch failed ({resp.status_code}): {url}")
+        with requests.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as resp:
+            if resp.status_code == 304:
+                return [], cursor
+            if resp.status_code != 200:
+                print(f"  WARN: S3 fetch failed ({resp.status_code}): {url}")
+                return [], None
+
+            high_water = cursor.get('high_water') or ''
+            newest = high_water
+            decode = codecs.getincrementaldecoder('utf-8')().decode
+            chunks = (decode(chunk) for chunk in resp.iter_content(chunk_size=PB_STREAM_CHUNK))
+            leads = []
+            for lead in iter_json_array(chunks):
+                stamp = lead.get('timestamp') or ''
+                if stamp and stamp <= high_water:
+                    continue  # Already ingested on an earlier run
+                leads.append(lead)
+                newest = max(newest, stamp)
+            return leads, {
+                'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified'),
+                'high_water': newest,
+            }
     except Exception as e:
         print(f"  WARN: S3 fetch error: {e}")
-    return []
+    return [], None
 
 
-def fetch_all_pb_leads() -> List[Dict]:
-    """Fetch and merge leads from all configured agents, dedup by memberId."""
+def fetch_all_pb_leads(cursors: Optional[Dict] = None) -> Tuple[List[Dict], Dict, Dict[str, set]]:
+    """Fetch and merge leads from all configured agents, dedup by memberId.
+
+    Agents are fetched concurrently. Pass the per-agent cursors saved by the
+    last run for incremental ingestion, or None to read every record.
+
+    Returns:
+        (leads, cursors to save once those leads are synced,
+         memberId -> IDs of the agents that returned it)
+    """
+    cursors = cursors or {}
+    with ThreadPoolExecutor(max_workers=len(PB_AGENTS)) as pool:
+        results = dict(zip(PB_AGENTS, pool.map(
+            lambda agent_id: fetch_pb_results(agent_id, cursors.get(agent_id)), PB_AGENTS)))
+
     all_leads = {}
-    for agent_id, folder in PB_AGENTS.items():
-        leads = fetch_pb_results(agent_id)
-        print(f"  Agent {agent_id}: {len(leads)} leads")
+    new_cursors = {}
+    lead_agents: Dict[str, set] = {}
+    for agent_id, (leads, cursor) in results.items():
+        if cursor is not None:
+            new_cursors[agent_id] = cursor
+        status = 'unchanged' if cursor is cursors.get(agent_id) else f"{len(leads)} new leads"
+        print(f"  Agent {agent_id}: {status if cursors else f'{len(leads)} leads'}")
         for lead in leads:
             mid = lead.get('memberId', '')
+            if mid:
+                lead_agents.setdefault(mid, set()).add(agent_id)
             if mid and mid not in all_leads:
                 all_leads[mid] = lead
             elif mid and mid in all_leads:
@@ -318,13 +574,14 @@ def fetch_all_pb_leads() -> List[Dict]:
                 existing = all_leads[mid]
                 if lead.get('comments') and not existing.get('comments'):
                     all_leads[mid] = lead
-    return list(all_leads.values())
+    return list(all_leads.values()), new_cursors, lead_agents
 
 
 # --- Notion helpers ---
+# All Notion calls share one pooled, rate-limited transport (no fixed sleeps)
 def notion_post(url: str, payload: dict) -> Optional[requests.Response]:
     try:
-        return requests.post(url, headers=NOTION_HEADERS, json=payload, timeout=REQUEST_TIMEOUT)
+        return get_transport(NOTION_KEY).post(url, json=payload, timeout=REQUEST_TIMEOUT)
     except Exception as e:
         print(f"  WARN: Notion POST failed: {e}")
         return None
@@ -332,41 +589,42 @@ def notion_post(url: str, payload: dict) -> Optional[requests.Response]:
 
 def notion_patch(url: str, payload: dict) -> Optional[requests.Response]:
     try:
-        return requests.patch(url, headers=NOTION_HEADERS, json=payload, timeout=REQUEST_TIMEOUT)
+        return get_transport(NOTION_KEY).patch(url, json=payload, timeout=REQUEST_TIMEOUT)
     except Exception as e:
         print(f"  WARN: Notion PATCH failed: {e}")
         return None
 
 
-def query_notion_db(db_id: str, filter_payload: dict) -> List[Dict]:
-    """Query a Notion database with a filter, return all matching pages."""
-    url = f'https://api.notion.com/v1/databases/{db_id}/query'
-    resp = notion_post(url, {"filter": filter_payload})
-    if resp and resp.status_code == 200:
-        return resp.json().get('results', [])
-    return []
+class NotionQueryError(Exception):
+    """A database query page failed, so the results would be incomplete."""
 
 
-def find_contact_by_member_id(member_id: str) -> Optional[Dict]:
-    """Find existing contact by PhantomBuster memberId stored in Notes as 'PB:XXXXX'.
+def iter_notion_db(db_id: str, filter_payload: Optional[dict] = None) -> Iterator[Dict]:
+    """Yield the pages of a Notion database query (optionally filtered) as
+    each result page arrives, following pagination.
 
-    This is the PRIMARY dedup key — LinkedIn users can have multiple vanity URLs
-    but memberId is stable and unique.
+    Raises NotionQueryError if any result page fails, so callers never
+    mistake a truncated listing for a complete one.
     """
-    results = query_notion_db(CONTACTS_DB, {
-        "property": "Notes",
-        "rich_text": {"starts_with": f"PB:{member_id}"}
-    })
-    return results[0] if results else None
-
-
-def find_contact_by_linkedin_url(linkedin_url: str) -> Optional[Dict]:
-    """Find existing contact by LinkedIn URL (fallback dedup)."""
-    results = query_notion_db(CONTACTS_DB, {
-        "property": "LinkedIn URL",
-        "url": {"equals": linkedin_url}
-    })
-    return results[0] if results else None
+    url = f'https://api.notion.com/v1/databases/{db_id}/query'
+    payload: Dict[str, Any] = {"page_size": 100}
+    if filter_payload:
+        payload["filter"] = filter_payload
+    while True:
+        resp = notion_post(url, payload)
+        if resp is None or resp.status_code != 200:
+            status = resp.status_code if resp is not None else 'no response'
+            raise NotionQueryError(f"Query of database {db_id} failed ({status})")
+        data = resp.json()
+        yield from data.get('results', [])
+        if not data.get('has_more'):
+            return
+        payload["start_cursor"] = data['next_cursor']
+
+
+def query_notion_db(db_id: str, filter_payload: Optional[dict] = None) -> List[Dict]:
+    """Query a Notion database (optionally filtered), return all matching pages."""
+    return list(iter_notion_db(db_id, filter_payload))
 
 
 def find_post_by_linkedin_url(post_url: str) -> Optional[Dict]:
@@ -378,8 +636,223 @@ def find_post_by_linkedin_url(post_url: str) -> Optional[Dict]:
     return results[0] if results else None
 
 
+# --- Hub index ---
+def normalize_linkedin_url(url: str) -> str:
+    """Canonical form of a LinkedIn URL for lookups (scheme, www, query,
+    trailing slash and case don't matter)."""
+    url = url.strip().split('?', 1)[0].split('#', 1)[0].lower()
+    for prefix in ('https://', 'http://'):
+        if url.startswith(prefix):
+            url = url[len(prefix):]
+    if url.startswith('www.'):
+        url = url[4:]
+    return url.rstrip('/')
+
+
+def _prop_text(page: Dict, name: str) -> str:
+    prop = page.get('properties', {}).get(name) or {}
+    return ''.join(t.get('plain_text', '') for t in prop.get('rich_text', []))
+
+
+def _prop_url(page: Dict, name: str) -> str:
+    prop = page.get('properties', {}).get(name) or {}
+    return prop.get('url') or ''
+
+
+def _prop_relation(page: Dict, name: str) -> str:
+    prop = page.get('properties', {}).get(name) or {}
+    relation = prop.get('relation') or []
+    return relation[0]['id'] if relation else ''
+
+
+def _prop_select(page: Dict, name: str) -> str:
+    prop = page.get('properties', {}).get(name) or {}
+    return (prop.get('select') or {}).get('name', '')
+
+
+class HubIndex:
+    """Local mirror of the Contacts, Posts and Engagements databases.
+
+    Bulk-loaded once per run so contact/post/engagement dedup is a dict
+    lookup instead of a Notion query per lead. Pages the ETL creates are
+    added as it goes. With a path, the index persists to SQLite and later
+    runs only fetch pages edited since the previous load.
+    """
+
+    # Notion rounds last_edited_time to the minute; re-read a little overlap
+    REFRESH_OVERLAP_SECONDS = 120
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.loaded_at: Optional[str] = None
+        # page_id -> (member_id, url_key) / url_key / (contact_id, post_id, type)
+        self.contacts: Dict[str, tuple] = {}
+        self.posts: Dict[str, str] = {}
+        self.engagements: Dict[str, tuple] = {}
+        self._rebuild()
+
+    def _rebuild(self):
+        self.contact_by_member = {}
+        self.contact_by_url = {}
+        for page_id, (member_id, url_key) in self.contacts.items():
+            if member_id:
+                self.contact_by_member.setdefault(member_id, page_id)
+            if url_key:
+                self.contact_by_url.setdefault(url_key, page_id)
+        self.post_by_url = {url_key: page_id for page_id, url_key in self.posts.items() if url_key}
+        self.engagement_by_key = {key: page_id for page_id, key in self.engagements.items()}
+
+    # -- Loading --
+
+    def load(self, full: bool = False):
+        """Fill the index from Notion.
+
+        The index (and loaded_at) only changes once all three queries have
+        finished; a failed query raises NotionQueryError and leaves the
+        persisted index as it was, so the next refresh re-reads the window.
+
+        Args:
+            full: Re-read every page even if a persisted index exists
+        """
+        started = datetime.now(timezone.utc)
+        since = None
+        if self.path and not full and self._read_cache():
+            since = (datetime.fromisoformat(self.loaded_at) -
+                     timedelta(seconds=self.REFRESH_OVERLAP_SECONDS)).isoformat()
+
+        edited_filter = None
+        if since:
+            edited_filter = {"timestamp": "last_edited_time",
+                             "last_edited_time": {"on_or_after": since}}
+
+        contacts = query_notion_db(CONTACTS_DB, edited_filter)
+        posts = query_notion_db(POSTS_DB, edited_filter)
+        engagements = query_notion_db(ENGAGEMENTS_DB, edited_filter)
+
+        for page in contacts:
+            if self._drop_if_archived(self.contacts, page):
+                continue
+            self._add_contact_page(page)
+        for page in posts:
+            if self._drop_if_archived(self.posts, page):
+                continue
+            self.posts[page['id']] = normalize_linkedin_url(_prop_url(page, 'LinkedIn URL'))
+        for page in engagements:
+            if self._drop_if_archived(self.engagements, page):
+                continue
+            self.engagements[page['id']] = (
+                _prop_relation(page, 'Contact'),
+                _prop_relation(page, 'Post'),
+                _prop_select(page, 'Type'),
+            )
+        self._rebuild()
+        self.loaded_at = started.isoformat()
+        print(f"  Hub index: {len(self.contacts)} contacts, {len(self.posts)} posts, "
+              f"{len(self.engagements)} engagements"
+              f"{' (refreshed since ' + since[:16] + ')' if since else ''}")
+
+    @staticmethod
+    def _drop_if_archived(rows: Dict, page: Dict) -> bool:
+        """Forget an archived/trashed page. Returns True if it was one."""
+        if page.get('archived') or page.get('in_trash'):
+            rows.pop(page['id'], None)
+            return True
+        return False
+
+    def _add_contact_page(self, page: Dict):
+        match = re.match(r'PB:(\S+)', _prop_text(page, 'Notes'))
+        self.contacts[page['id']] = (
+            match.group(1) if match else '',
+            normalize_linkedin_url(_prop_url(page, 'LinkedIn URL')),
+        )
+
+    # -- Lookups --
+
+    def find_contact(self, member_id: str, linkedin_url: str) -> Optional[str]:
+        """Contact page ID by memberId (primary key), then LinkedIn URL."""
+        page_id = self.contact_by_member.get(member_id) if member_id else None
+        if not page_id and linkedin_url:
+            page_id = self.contact_by_url.get(normalize_linkedin_url(linkedin_url))
+        return page_id
+
+    def find_post(self, post_url: str) -> Optional[str]:
+        return self.post_by_url.get(normalize_linkedin_url(post_url))
+
+    def find_engagement(self, contact_id: str, post_id: str, notion_type: str) -> Optional[str]:
+        return self.engagement_by_key.get((contact_id, post_id, notion_type))
+
+    # -- Recording pages created this run --
+
+    def add_contact(self, page_id: str, member_id: str, linkedin_url: str):
+        url_key = normalize_linkedin_url(linkedin_url)
+        self.contacts[page_id] = (member_id, url_key)
+        if member_id:
+            self.contact_by_member.setdefault(member_id, page_id)
+        if url_key:
+            self.contact_by_url.setdefault(url_key, page_id)
+
+    def add_post(self, page_id: str, post_url: str):
+        url_key = normalize_linkedin_url(post_url)
+        self.posts[page_id] = url_key
+        self.post_by_url.setdefault(url_key, page_id)
+
+    def add_engagement(self, page_id: str, contact_id: str, post_id: str, notion_type: str):
+        self.engagements[page_id] = (contact_id, post_id, notion_type)
+        self.engagement_by_key.setdefault((contact_id, post_id, notion_type), page_id)
+
+    # -- Persistence --
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS contacts (page_id TEXT PRIMARY KEY, member_id TEXT, url_key TEXT);
+            CREATE TABLE IF NOT EXISTS posts (page_id TEXT PRIMARY KEY, url_key TEXT);
+            CREATE TABLE IF NOT EXISTS engagements (
+                page_id TEXT PRIMARY KEY, contact_id TEXT, post_id TEXT, type TEXT);
+        """)
+        return conn
+
+    def _read_cache(self) -> bool:
+        """Load the persisted index. Returns False if there is none."""
+        if not self.path.exists():
+            return False
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'loaded_at'").fetchone()
+            if not row:
+                return False
+            self.loaded_at = row[0]
+            self.contacts = {r[0]: (r[1], r[2]) for r in conn.execute("SELECT * FROM contacts")}
+            self.posts = {r[0]: r[1] for r in conn.execute("SELECT * FROM posts")}
+            self.engagements = {r[0]: tuple(r[1:]) for r in conn.execute("SELECT * FROM engagements")}
+        finally:
+            conn.close()
+        return True
+
+    def save(self):
+        """Persist the index (no-op for an in-memory index)."""
+        if not self.path:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM contacts")
+                conn.execute("DELETE FROM posts")
+                conn.execute("DELETE FROM engagements")
+                conn.executemany("INSERT INTO contacts VALUES (?, ?, ?)",
+                                 [(k, *v) for k, v in self.contacts.items()])
+                conn.executemany("INSERT INTO posts VALUES (?, ?)", self.posts.items())
+                conn.executemany("INSERT INTO engagements VALUES (?, ?, ?, ?)",
+                                 [(k, *v) for k, v in self.engagements.items()])
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('loaded_at', ?)",
+                             (self.loaded_at,))
+        finally:
+            conn.close()
+
+
 # --- Notion upsert operations ---
-def create_contact(lead: Dict) -> Optional[str]:
+def create_contact(lead: Dict, classification: Optional[Dict] = None) -> Optional[str]:
     """Create a Contact in Notion from a PhantomBuster lead. Returns page ID."""
     name = lead.get('fullName') or f"{lead.get('firstName', '')} {lead.get('lastName', '')}".strip()
     linkedin_url = lead.get('profileUrl') or lead.get('profileLink', '')
@@ -394,7 +867,8 @@ def create_contact(lead: Dict) -> Optional[str]:
         linkedin_url += '/'
 
     # Classify the contact
-    classification = classify_contact(lead)
+    if classification is None:
+        classification = classify_contact(lead)
 
     payload = {
         "parent": {"database_id": CONTACTS_DB},
@@ -437,7 +911,8 @@ def create_contact(lead: Dict) -> Optional[str]:
         return None
 
 
-def update_contact_on_new_engagement(contact_page_id: str, lead: Dict) -> bool:
+def update_contact_on_new_engagement(contact_page_id: str, lead: Dict,
+                                     classification: Optional[Dict] = None) -> bool:
     """Update an existing contact with new engagement data (longitudinal tracking).
 
     Called when we see a returning engager on a new post. Updates:
@@ -445,7 +920,8 @@ def update_contact_on_new_engagement(contact_page_id: str, lead: Dict) -> bool:
     - Relationship Stage (upgrade if deeper engagement)
     - Re-classify if headline changed (people update their profiles)
     """
-    classification = classify_contact(lead)
+    if classification is None:
+        classification = classify_contact(lead)
     today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
 
     payload = {
@@ -480,13 +956,11 @@ def create_engagement(lead: Dict, contact_page_id: str, post_page_id: str, eng_t
 
     if eng_type == 'comment':
         title = f"{name} commented"
-        notion_type = "Commented on Our Post"
         their_content = comment_text
         quality = "Substantive" if len(comment_text) > 50 else "Brief"
         response_status = "Needs Reply" if quality == "Substantive" else "No Reply Needed"
     else:
         title = f"{name} liked"
-        notion_type = "Liked"
         their_content = ""
         quality = "Reaction-only"
         response_status = "No Reply Needed"
@@ -501,7 +975,7 @@ def create_engagement(lead: Dict, contact_page_id: str, post_page_id: str, eng_t
             "Engagement": {"title": [{"text": {"content": title}}]},
             "Contact": {"relation": [{"id": contact_page_id}]},
             "Post": {"relation": [{"id": post_page_id}]},
-            "Type": {"select": {"name": notion_type}},
+            "Type": {"select": {"name": ENGAGEMENT_TYPES[eng_type]}},
             "Direction": {"select": {"name": "Inbound"}},
             "Engagement Quality": {"select": {"name": quality}},
             "Response Status": {"select": {"name": response_status}},
@@ -528,11 +1002,20 @@ def create_engagement(lead: Dict, contact_page_id: str, post_page_id: str, eng_t
         return None
 
 
-def ensure_post_exists(post_url: str, post_content: str = '') -> Optional[str]:
-    """Find or create a Post entry. Returns page ID."""
-    existing = find_post_by_linkedin_url(post_url)
-    if existing:
-        return existing['id']
+def ensure_post_exists(post_url: str, post_content: str = '',
+                       index: Optional[HubIndex] = None) -> Optional[str]:
+    """Find or create a Post entry. Returns page ID.
+
+    With an index, the lookup is local and a created post is recorded in it.
+    """
+    if index is not None:
+        existing_id = index.find_post(post_url)
+        if existing_id:
+            return existing_id
+    else:
+        existing = find_post_by_linkedin_url(post_url)
+        if existing:
+            return existing['id']
 
     # Derive a title from post content
     title = post_content[:80].split('\n')[0] if post_content else 'Untitled Post'
@@ -550,13 +1033,76 @@ def ensure_post_exists(post_url: str, post_content: str = '') -> Optional[str]:
 
     resp = notion_post('https://api.notion.com/v1/pages', payload)
     if resp and resp.status_code in [200, 201]:
-        return resp.json()['id']
+        page_id = resp.json()['id']
+        if index is not None:
+            index.add_post(page_id, post_url)
+        return page_id
     print(f"  ERROR creating post: {resp.status_code if resp else 'no response'}")
     return None
 
 
+# --- Write pipeline ---
+class WritePipeline:
+    """Bounded worker pool for the ETL's Notion writes.
+
+    Writes run on `workers` threads that share the transport's rate limiter.
+    A task's `then` callback runs when it finishes, under the pipeline lock,
+    to record the result in the sync state and queue writes that depend on
+    it (an engagement once its contact exists). The sync state is
+    checkpointed every `checkpoint_every` finished writes, so a crash
+    mid-run loses at most that many records.
+    """
+
+    def __init__(self, state: Dict, workers: int = WRITE_WORKERS,
+                 checkpoint_every: int = CHECKPOINT_EVERY):
+        self.state = state
+        self.checkpoint_every = checkpoint_every
+        self.lock = threading.RLock()
+        self.completed = 0
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._pending = 0
+        self._idle = threading.Condition(self.lock)
+
+    def submit(self, fn, *args, then=None):
+        """Queue a write; `then(result)` runs once it returns."""
+        with self.lock:
+            self._pending += 1
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self._finish(f, then))
+
+    def _finish(self, future, then):
+        with self.lock:
+            try:
+                if future.exception():
+                    print(f"    ERROR in write: {future.exception()}")
+                    if then:
+                        then(None)
+                elif then:
+                    then(future.result())
+            finally:
+                self.completed += 1
+                if self.completed % self.checkpoint_every == 0:
+                    self.checkpoint()
+                self._pending -= 1
+                self._idle.notify_all()
+
+    def checkpoint(self):
+        with self.lock:
+            save_sync_state(self.state)
+            print(f"  Checkpoint: {self.completed} writes done")
+
+    def join(self):
+        """Wait for every queued write (including ones queued by callbacks)."""
+        with self.lock:
+            while self._pending:
+                self._idle.wait()
+        self._pool.shutdown()
+        save_sync_state(self.state)
+
+
 # --- Main ETL ---
-def run_etl(dry_run: bool = False, stats_only: bool = False):
+def run_etl(dry_run: bool = False, stats_only: bool = False, refresh_index: bool = False,
+            full: bool = False):
     print("=" * 60)
     print("PHANTOMBUSTER -> NOTION ETL")
     print(f"  Mode: {'DRY RUN' if dry_run else 'STATS' if stats_only else 'LIVE'}")
@@ -570,11 +1116,19 @@ def run_etl(dry_run: bool = False, stats_only: bool = False):
     if state['last_sync']:
         print(f"  Last sync: {state['last_sync']}")
 
-    # 1. Fetch leads from PhantomBuster
+    # 1. Fetch leads from PhantomBuster (only new records unless --full/--stats)
     print(f"\n[1/4] Fetching leads from PhantomBuster...")
-    leads = fetch_all_pb_leads()
+    cursors = None if (full or stats_only) else state.setdefault('pb_cursors', {})
+    leads, new_cursors, lead_agents = fetch_all_pb_leads(cursors)
     print(f"  Total unique leads: {len(leads)}")
 
+    if not leads and not stats_only:
+        print("  Nothing new to sync")
+        if not dry_run:
+            state.setdefault('pb_cursors', {}).update(new_cursors)
+            save_sync_state(state)
+        return
+
     if stats_only:
         commenters = sum(1 for l in leads if l.get('hasCommented') == 'true')
         likers = sum(1 for l in leads if l.get('hasLiked') == 'true')
@@ -588,8 +1142,7 @@ def run_etl(dry_run: bool = False, stats_only: bool = False):
         sectors = {}
         alignments = {}
         buckets_count = {}
-        for l in leads:
-            c = classify_contact(l)
+        for c in classify_contacts(leads):
             sectors[c['sector']] = sectors.get(c['sector'], 0) + 1
             # Use star count for display (avoids Windows encoding issues)
             star_count = c['alignment'].count('\u2b50')
@@ -603,6 +1156,16 @@ def run_etl(dry_run: bool = False, stats_only: bool = False):
         print(f"  Strategic Buckets: {buckets_count}")
         return
 
+    # Mirror the Hub databases locally; all dedup below is index lookups
+    print(f"\nLoading Hub index...")
+    index = HubIndex(HUB_INDEX_FILE)
+    try:
+        index.load(full=refresh_index)
+    except NotionQueryError as e:
+        # Dedup against a partial index would create duplicate contacts
+        print(f"\nERROR: Hub index load incomplete: {e}")
+        sys.exit(1)
+
     # 2. Group by post URL
     print(f"\n[2/4] Identifying posts...")
     posts_seen = {}
@@ -614,122 +1177,192 @@ def run_etl(dry_run: bool = False, stats_only: bool = False):
 
     # 3. Ensure posts exist in Notion
     post_page_ids = {}
+    failed_posts = set()
     for post_url, content in posts_seen.items():
         if post_url in state['synced_posts']:
             post_page_ids[post_url] = state['synced_posts'][post_url]
             continue
-        if dry_run:
+        existing_id = index.find_post(post_url)
+        if existing_id:
+            post_page_ids[post_url] = existing_id
+            if not dry_run:
+                state['synced_posts'][post_url] = existing_id
+        elif dry_run:
             print(f"  [DRY] Would create post: {content[:60]}...")
             post_page_ids[post_url] = 'dry-run-id'
         else:
-            page_id = ensure_post_exists(post_url, content)
+            page_id = ensure_post_exists(post_url, content, index=index)
             if page_id:
                 post_page_ids[post_url] = page_id
                 state['synced_posts'][post_url] = page_id
                 print(f"  Post: {content[:50]}... -> {page_id}")
-            time.sleep(0.35)
+            else:
+                failed_posts.add(post_url)
 
-    # 4. Sync contacts and engagements
+    # 4. Plan contact and engagement writes (classification happens up front)
     print(f"\n[3/4] Syncing contacts & engagements...")
-    new_contacts = 0
-    updated_contacts = 0
-    new_engagements = 0
+    classifications = classify_contacts(leads)
+    creates: Dict[str, Dict] = {}  # normalized URL -> contact to create
+    updates = []                   # (contact page ID, lead, classification)
+    engagements = []               # (lead, contact page ID, post page ID, type, state key)
+    failed = set()                 # memberIds with a write that did not land
     skipped = 0
-    errors = 0
 
-    for i, lead in enumerate(leads, 1):
+    for lead, classification in zip(leads, classifications):
         member_id = lead.get('memberId', '')
         linkedin_url = lead.get('profileUrl') or lead.get('profileLink', '')
         if linkedin_url and not linkedin_url.endswith('/'):
             linkedin_url += '/'
         name = lead.get('fullName') or f"{lead.get('firstName', '')} {lead.get('lastName', '')}".strip()
         post_url = lead.get('postsUrl', '')
+        post_page_id = post_page_ids.get(post_url)
 
         if not member_id or not linkedin_url:
             skipped += 1
             continue
+        if post_url in failed_posts:
+            failed.add(member_id)  # Its engagements have no post to point at
+
+        # Engagements not yet in the sync state
+        pending = []
+        for eng_type, verb, engaged in (
+            ('comment', 'commented', lead.get('hasCommented') == 'true'),
+            ('like', 'liked', lead.get('hasLiked') == 'true'),
+        ):
+            eng_key = f"{member_id}:{eng_type}:{post_url}"
+            if engaged and post_page_id and eng_key not in state['synced_engagements']:
+                pending.append((eng_type, verb, eng_key))
+
+        # Dedup: sync state, then memberId (primary key), then URL (fallback)
+        contact_page_id = (state['synced_contacts'].get(member_id)
+                           or index.find_contact(member_id, linkedin_url))
+        url_key = normalize_linkedin_url(linkedin_url)
+        stars = classification['alignment'].count('\u2b50')
+
+        if not contact_page_id and url_key not in creates:
+            if dry_run:
+                print(f"  [DRY] Would create contact: {name} | {classification['sector']} | {stars}-star alignment")
+                for eng_type, verb, eng_key in pending:
+                    print(f"  [DRY] Would create engagement: {name} {verb}")
+            creates[url_key] = {
+                'lead': lead,
+                'classification': classification,
+                'member_ids': [member_id],
+                'returning': [],  # other leads resolving to the same contact
+                'engagements': [(lead, post_page_id, eng_type, eng_key)
+                                for eng_type, _, eng_key in pending],
+            }
+            continue
 
-        if i % 20 == 0:
-            print(f"  Processing lead {i}/{len(leads)}...")
-
-        # Upsert contact
-        contact_page_id = state['synced_contacts'].get(member_id)
-        is_returning = contact_page_id is not None
         if not contact_page_id:
+            # Same profile as a contact being created this run
+            job = creates[url_key]
             if dry_run:
-                classification = classify_contact(lead)
-                stars = classification['alignment'].count('\u2b50')
-                print(f"  [DRY] Would create contact: {name} | {classification['sector']} | {stars}-star alignment")
-                contact_page_id = 'dry-run-id'
-            else:
-                # Dedup: check by memberId first (primary key), then URL (fallback)
-                existing = None
-                if member_id:
-                    existing = find_contact_by_member_id(member_id)
-                if not existing:
-                    existing = find_contact_by_linkedin_url(linkedin_url)
-                if existing:
-                    contact_page_id = existing['id']
-                    state['synced_contacts'][member_id] = contact_page_id
-                    is_returning = True
-                else:
-                    contact_page_id = create_contact(lead)
-                    if contact_page_id:
-                        state['synced_contacts'][member_id] = contact_page_id
-                        new_contacts += 1
-                    else:
-                        errors += 1
-                        continue
-                time.sleep(0.35)
+                for eng_type, verb, eng_key in pending:
+                    print(f"  [DRY] Would create engagement: {name} {verb}")
+            job['member_ids'].append(member_id)
+            job['returning'].append((lead, classification))
+            job['engagements'] += [(lead, post_page_id, eng_type, eng_key)
+                                   for eng_type, _, eng_key in pending]
+            continue
 
         # Longitudinal: update existing contacts with latest classification + Last Active
-        if is_returning and not dry_run:
-            if update_contact_on_new_engagement(contact_page_id, lead):
-                updated_contacts += 1
-            time.sleep(0.35)
-        elif is_returning and dry_run:
-            classification = classify_contact(lead)
-            stars = classification['alignment'].count('\u2b50')
+        if not dry_run:
+            state['synced_contacts'][member_id] = contact_page_id
+        if dry_run:
             print(f"  [DRY] Would update returning contact: {name} | {classification['sector']} | {stars}-star alignment")
+        updates.append((contact_page_id, lead, classification))
+
+        for eng_type, verb, eng_key in pending:
+            existing_id = index.find_engagement(contact_page_id, post_page_id,
+                                                ENGAGEMENT_TYPES[eng_type])
+            if existing_id:
+                if not dry_run:
+                    state['synced_engagements'][eng_key] = existing_id
+            elif dry_run:
+                print(f"  [DRY] Would create engagement: {name} {verb}")
+            else:
+                engagements.append((lead, contact_page_id, post_page_id, eng_type, eng_key))
 
-        # Create engagements
-        post_page_id = post_page_ids.get(post_url)
-        if not contact_page_id or not post_page_id:
-            continue
+    print(f"  Planned: {len(creates)} contact creates, {len(updates)} updates, "
+          f"{len(engagements) + sum(len(j['engagements']) for j in creates.values())} engagements")
 
-        # Comment engagement
-        has_commented = lead.get('hasCommented') == 'true'
-        comment_key = f"{member_id}:comment:{post_url}"
-        if has_commented and comment_key not in state['synced_engagements']:
-            if dry_run:
-                print(f"  [DRY] Would create engagement: {name} commented")
-            else:
-                eng_id = create_engagement(lead, contact_page_id, post_page_id, 'comment')
-                if eng_id:
-                    state['synced_engagements'][comment_key] = eng_id
-                    new_engagements += 1
-                else:
-                    errors += 1
-                time.sleep(0.35)
+    # 5. Run the writes; engagements for new contacts wait for their page ID
+    counts = {'new_contacts': 0, 'updated_contacts': 0, 'new_engagements': 0, 'errors': 0}
+    if not dry_run:
+        pipeline = WritePipeline(state)
 
-        # Like engagement
-        has_liked = lead.get('hasLiked') == 'true'
-        like_key = f"{member_id}:like:{post_url}"
-        if has_liked and like_key not in state['synced_engagements']:
-            if dry_run:
-                print(f"  [DRY] Would create engagement: {name} liked")
-            else:
-                eng_id = create_engagement(lead, contact_page_id, post_page_id, 'like')
+        def engagement_done(lead, eng_key, contact_page_id, post_page_id, eng_type):
+            def then(eng_id):
                 if eng_id:
-                    state['synced_engagements'][like_key] = eng_id
-                    new_engagements += 1
+                    index.add_engagement(eng_id, contact_page_id, post_page_id,
+                                         ENGAGEMENT_TYPES[eng_type])
+                    state['synced_engagements'][eng_key] = eng_id
+                    counts['new_engagements'] += 1
                 else:
-                    errors += 1
-                time.sleep(0.35)
-
-    # Save state
-    if not dry_run:
+                    counts['errors'] += 1
+                    failed.add(lead.get('memberId', ''))
+            return then
+
+        def update_done(lead):
+            def then(ok):
+                if ok:
+                    counts['updated_contacts'] += 1
+                else:
+                    counts['errors'] += 1
+                    failed.add(lead.get('memberId', ''))
+            return then
+
+        def submit_engagement(lead, contact_page_id, post_page_id, eng_type, eng_key):
+            pipeline.submit(create_engagement, lead, contact_page_id, post_page_id, eng_type,
+                            then=engagement_done(lead, eng_key, contact_page_id,
+                                                 post_page_id, eng_type))
+
+        def contact_created(job):
+            def then(contact_page_id):
+                if not contact_page_id:
+                    counts['errors'] += 1
+                    failed.update(job['member_ids'])
+                    return
+                lead = job['lead']
+                index.add_contact(contact_page_id, lead.get('memberId', ''),
+                                  lead.get('profileUrl') or lead.get('profileLink', ''))
+                for member_id in job['member_ids']:
+                    state['synced_contacts'][member_id] = contact_page_id
+                counts['new_contacts'] += 1
+                for other_lead, classification in job['returning']:
+                    pipeline.submit(update_contact_on_new_engagement, contact_page_id,
+                                    other_lead, classification, then=update_done(other_lead))
+                for eng_lead, post_page_id, eng_type, eng_key in job['engagements']:
+                    submit_engagement(eng_lead, contact_page_id, post_page_id, eng_type, eng_key)
+            return then
+
+        for job in creates.values():
+            pipeline.submit(create_contact, job['lead'], job['classification'],
+                            then=contact_created(job))
+        for contact_page_id, lead, classification in updates:
+            pipeline.submit(update_contact_on_new_engagement, contact_page_id, lead,
+                            classification, then=update_done(lead))
+        for engagement in engagements:
+            submit_engagement(*engagement)
+        pipeline.join()
+        index.save()
+
+        # Advance an agent's cursor only if every one of its leads was
+        # written; a held cursor re-reads the failed leads next run (the
+        # synced state skips the ones that did land)
+        held = {agent_id for member_id in failed for agent_id in lead_agents.get(member_id, ())}
+        state.setdefault('pb_cursors', {}).update(
+            (agent_id, cursor) for agent_id, cursor in new_cursors.items() if agent_id not in held)
         save_sync_state(state)
+        if held:
+            print(f"  Holding cursor for {len(held)} agent(s): "
+                  f"{len(failed)} lead(s) will be retried next run")
+
+    new_contacts = counts['new_contacts']
+    updated_contacts = counts['updated_contacts']
+    new_engagements = counts['new_engagements']
+    errors = counts['errors']
 
     # Summary
     print(f"\n[4/4] Summary")
@@ -753,18 +1386,27 @@ SALES_NAV_SEGMENTS = {
 }
 
 EXPORT_DIR = Path(__file__).parent / 'sales_nav_exports'
+EXPORT_STATE_FILE = EXPORT_DIR / '.export_state.json'
+EXPORT_COLUMNS = ['profileUrl', 'name', 'segment']
 
 # Sales Nav Lead Sender phantom config
 SALES_NAV_AGENT_ID = os.environ.get('PB_SALES_NAV_AGENT_ID', '7375614927727918')
 
 
-def query_contacts_by_sales_nav_status(status: str) -> List[Dict]:
-    """Query Notion Contacts DB for contacts with a specific Sales Nav List Status."""
-    results = query_notion_db(CONTACTS_DB, {
-        "property": "Sales Nav List Status",
-        "select": {"equals": status}
-    })
-    return results
+def iter_saved_contacts(edited_since: Optional[str] = None) -> Iterator[Dict]:
+    """Stream the contacts an export needs from one paginated query.
+
+    Without `edited_since`, every contact in a Sales Nav segment. With it,
+    every contact edited since then whatever its status, so contacts that
+    left a segment are seen too.
+    """
+    if edited_since:
+        return iter_notion_db(CONTACTS_DB, {"timestamp": "last_edited_time",
+                                            "last_edited_time": {"on_or_after": edited_since}})
+    return iter_notion_db(CONTACTS_DB, {"or": [
+        {"property": "Sales Nav List Status", "select": {"equals": status}}
+        for status in SALES_NAV_SEGMENTS
+    ]})
 
 
 def extract_linkedin_url(page: Dict) -> str:
@@ -779,14 +1421,21 @@ def extract_contact_name(page: Dict) -> str:
     return title[0].get('plain_text', '') if title else ''
 
 
-def export_sales_nav_contacts():
+def export_sales_nav_contacts(incremental: bool = False):
     """Export classified contacts as segment CSVs for Sales Nav Lead Sender.
 
-    Creates one CSV per Sales Nav segment in the sales_nav_exports/ directory.
-    Each CSV has columns: profileUrl, name, sector, alignment, segment
+    Creates one CSV per Sales Nav segment in the sales_nav_exports/ directory,
+    plus sales_nav_all.csv with every segment. All files are written in a
+    single pass over one Notion query, and only replace the previous files
+    (and export state) once that query has finished.
+    Each CSV has columns: profileUrl, name, segment
+
+    Args:
+        incremental: Only write contacts that are new to a segment or changed
+            segment since the last export
     """
     print("=" * 60)
-    print("SALES NAV EXPORT")
+    print(f"SALES NAV EXPORT{' (incremental)' if incremental else ''}")
     print("=" * 60)
 
     if not NOTION_KEY:
@@ -794,46 +1443,86 @@ def export_sales_nav_contacts():
         sys.exit(1)
 
     EXPORT_DIR.mkdir(exist_ok=True)
+    export_state = {'exported': {}, 'last_export': None}
+    if EXPORT_STATE_FILE.exists():
+        export_state = json.loads(EXPORT_STATE_FILE.read_text())
+    exported = export_state['exported'] if incremental else {}
+
+    # A status change edits the page, so only recently edited pages can differ
+    edited_since = None
+    if incremental and export_state['last_export']:
+        edited_since = (datetime.fromisoformat(export_state['last_export']) -
+                        timedelta(minutes=2)).isoformat()
+    started = datetime.now(timezone.utc).isoformat()
+
+    print(f"\n  Querying saved contacts...")
     total_exported = 0
+    segment_counts = {}
     segment_files = {}
+    open_files = []
 
-    for status, slug in SALES_NAV_SEGMENTS.items():
-        print(f"\n  Querying: {status}...")
-        pages = query_contacts_by_sales_nav_status(status)
-        print(f"  Found {len(pages)} contacts")
+    def open_csv(csv_path):
+        f = open(f'{csv_path}.tmp', 'w', encoding='utf-8', newline='')
+        open_files.append((f, csv_path))
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_COLUMNS)
+        return writer
 
-        if not pages:
-            continue
+    combined_path = EXPORT_DIR / 'sales_nav_all.csv'
+    combined = open_csv(combined_path)
+    writers = {}
 
+    def segment_writer(slug):
         csv_path = EXPORT_DIR / f'sales_nav_{slug}.csv'
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            f.write('profileUrl,name,segment\n')
-            for page in pages:
-                url = extract_linkedin_url(page)
-                name = extract_contact_name(page)
-                if url:
-                    # Escape commas in name
-                    safe_name = name.replace('"', '""')
-                    f.write(f'{url},"{safe_name}",{slug}\n')
-                    total_exported += 1
-
+        writer = writers[slug] = open_csv(csv_path)
         segment_files[slug] = csv_path
-        print(f"  Exported to: {csv_path}")
-        time.sleep(0.5)
+        segment_counts[slug] = 0
+        return writer
 
-    # Also create a combined CSV with all segments
-    combined_path = EXPORT_DIR / 'sales_nav_all.csv'
-    with open(combined_path, 'w', encoding='utf-8', newline='') as f:
-        f.write('profileUrl,name,segment\n')
-        for status, slug in SALES_NAV_SEGMENTS.items():
-            pages = query_contacts_by_sales_nav_status(status)
-            for page in pages:
-                url = extract_linkedin_url(page)
-                name = extract_contact_name(page)
-                if url:
-                    safe_name = name.replace('"', '""')
-                    f.write(f'{url},"{safe_name}",{slug}\n')
-            time.sleep(0.5)
+    try:
+        # Incremental files replace every segment, so none keep stale rows
+        if incremental:
+            for slug in SALES_NAV_SEGMENTS.values():
+                segment_writer(slug)
+
+        for page in iter_saved_contacts(edited_since):
+            status = _prop_select(page, 'Sales Nav List Status')
+            slug = SALES_NAV_SEGMENTS.get(status)
+            if not slug:
+                exported.pop(page['id'], None)  # Left its segment
+                continue
+            url = extract_linkedin_url(page)
+            if not url:
+                continue
+            if exported.get(page['id']) == status:
+                continue  # Unchanged since the last export
+            exported[page['id']] = status
+
+            # Segment files are created on their first row
+            writer = writers.get(slug) or segment_writer(slug)
+            row = [url, extract_contact_name(page), slug]
+            writer.writerow(row)
+            combined.writerow(row)
+            segment_counts[slug] += 1
+            total_exported += 1
+    except NotionQueryError as e:
+        # Keep the last complete export; the next run covers this window again
+        for f, csv_path in open_files:
+            f.close()
+            os.remove(f'{csv_path}.tmp')
+        print(f"\nERROR: Contact query incomplete: {e}")
+        sys.exit(1)
+    finally:
+        for f, _ in open_files:
+            f.close()
+
+    for _, csv_path in open_files:
+        os.replace(f'{csv_path}.tmp', csv_path)
+    EXPORT_STATE_FILE.write_text(json.dumps(
+        {'exported': exported, 'last_export': started}, indent=2))
+
+    for slug, csv_path in segment_files.items():
+        print(f"  {slug}: {segment_counts[slug]} contacts -> {csv_path}")
 
     print(f"\n  Summary:")
     print(f"  Total contacts exported: {total_exported}")
@@ -927,7 +1616,7 @@ if __name__ == '__main__':
     launch_nav = '--launch-sales-nav' in sys.argv
 
     if export_nav:
-        export_sales_nav_contacts()
+        export_sales_nav_contacts(incremental='--incremental' in sys.argv)
     elif launch_nav:
         # Usage: python phantombuster_etl.py --launch-sales-nav <google_sheet_url> [limit]
         remaining = [a for a in sys.argv[1:] if not a.startswith('--')]
@@ -940,4 +1629,5 @@ if __name__ == '__main__':
         limit = int(remaining[1]) if len(remaining) > 1 else 25
         launch_lead_sender(sheet_url, limit=limit)
     else:
-        run_etl(dry_run=dry, stats_only=stats)
+        run_etl(dry_run=dry, stats_only=stats, refresh_index='--refresh-index' in sys.argv,
+                full='--full' in sys.argv)
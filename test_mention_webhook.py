@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test script for the @Atlas mention webhook receiver.
+
+Starts a WebhookReceiver on a free port against a stand-in Notion transport,
+delivers one comment event with a bad signature and one with the right one,
+and checks that only the signed event is scanned and posted. A polling scan
+whose comment listing fails must still find the mention on the next scan.
+
+Runs offline; no Notion key needed.
+"""
+
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import atlas_mention_scanner as scanner
+
+SECRET = 'test-secret'
+PAGE_ID = '11111111-2222-3333-4444-555555555555'
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class FakeNotion:
+    """Answers the calls a webhook or polling scan makes.
+
+    The first `comment_failures` comment listings answer 502.
+    """
+
+    def __init__(self, comment_failures: int = 0):
+        self.work_queue_posts = []
+        self.comment_failures = comment_failures
+        self.page = {
+            'id': PAGE_ID,
+            'last_edited_time': datetime.now(timezone.utc).isoformat(),
+            'properties': {'title': {'title': [{'plain_text': 'Webhook test page'}]}},
+        }
+
+    def get(self, url, params=None):
+        if url == f'pages/{PAGE_ID}':
+            return FakeResponse(200, self.page)
+        if url.endswith('/comments'):
+            if self.comment_failures:
+                self.comment_failures -= 1
+                return FakeResponse(502, {})
+            return FakeResponse(200, {'has_more': False, 'results': [{
+                'id': 'comment-1',
+                'created_time': '2026-01-01T00:00:00.000Z',
+                'rich_text': [{'plain_text': '@Atlas can you draft this?'}],
+            }]})
+        return FakeResponse(404, {})
+
+    def post(self, url, json=None):
+        if url.endswith('/search'):
+            return FakeResponse(200, {'has_more': False, 'results': [self.page]})
+        self.work_queue_posts.append(json)
+        return FakeResponse(200, {})
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return condition()
+
+
+def test_webhook_receiver():
+    """Bad signatures are rejected; a signed event posts its mention once."""
+    print("=" * 60)
+    print("MENTION WEBHOOK TEST")
+    print("=" * 60)
+
+    fake = FakeNotion()
+    original_notion, scanner.notion = scanner.notion, lambda: fake
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state = scanner.ScannerState(Path(tmp) / 'state.db')
+        receiver = scanner.WebhookReceiver(state, port=0, secret=SECRET).start()
+        try:
+            print(f"\nReceiver listening on {receiver.url}")
+
+            status = scanner.send_test_event(PAGE_ID, receiver.url, secret='wrong-secret')
+            print(f"Bad signature: HTTP {status}")
+            assert status == 401, status
+
+            status = scanner.send_test_event(PAGE_ID, receiver.url, secret=SECRET)
+            print(f"Good signature: HTTP {status}")
+            assert status == 200, status
+
+            assert wait_for(lambda: receiver.processed >= 1), "event was never processed"
+            print(f"Scan batches processed: {receiver.processed}")
+            assert receiver.processed == 1, receiver.processed
+            assert len(fake.work_queue_posts) == 1, fake.work_queue_posts
+            assert state.is_processed('comment-1')
+        finally:
+            receiver.stop()
+            state.close()
+            scanner.notion = original_notion
+
+    print("\n[OK] Webhook receiver test passed")
+
+
+def test_failed_comment_listing_is_retried():
+    """A page whose comments could not be listed is rescanned next poll."""
+    print("=" * 60)
+    print("FAILED COMMENT LISTING TEST")
+    print("=" * 60)
+
+    fake = FakeNotion(comment_failures=1)
+    original_notion, scanner.notion = scanner.notion, lambda: fake
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state = scanner.ScannerState(Path(tmp) / 'state.db')
+        try:
+            first = scanner.scan_for_mentions(state)
+            print(f"First scan (comments 502): {len(first)} mention(s)")
+            assert first == [], first
+            assert state.page_cursor(PAGE_ID)['last_edited'] is None, state.page_cursor(PAGE_ID)
+
+            second = scanner.scan_for_mentions(state)
+            print(f"Second scan: {len(second)} mention(s)")
+            assert [m['comment_id'] for m in second] == ['comment-1'], second
+
+            third = scanner.scan_for_mentions(state)
+            assert third == [], third
+        finally:
+            state.close()
+            scanner.notion = original_notion
+
+    print("\n[OK] Failed comment listing test passed")
+
+
+if __name__ == '__main__':
+    try:
+        test_webhook_receiver()
+        test_failed_comment_listing_is_retried()
+    except AssertionError as e:
+        print(f"\n[FAIL] {e}")
+        sys.exit(1)